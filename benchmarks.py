@@ -0,0 +1,310 @@
+# benchmarks.py
+"""
+Micro-benchmarks for the compute paths behind Quick Tools.
+
+Each benchmark times the code the GUI runs, outside of Tk, and where a path
+was rewritten for speed, also the previous implementation for comparison.
+
+Usage:
+    python benchmarks.py              # run every benchmark
+    python benchmarks.py sv_square    # run selected benchmarks by name
+"""
+import colorsys
+import sys
+import time
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Registers a benchmark function under a name."""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def time_per_call(func, *args, repeat=5, number=None):
+    """
+    Times a callable and returns the best average time per call in milliseconds.
+
+    Args:
+        func (callable): The code to time.
+        *args: Arguments passed to func.
+        repeat (int): Number of timing rounds; the fastest round is reported.
+        number (int, optional): Calls per round. Picked automatically to make
+            a round last roughly 0.2 s when omitted.
+    """
+    if number is None:
+        start = time.perf_counter()
+        func(*args)
+        single = time.perf_counter() - start
+        number = max(1, int(0.2 / max(single, 1e-6)))
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+@benchmark('core_import')
+def bench_core_import():
+    """Cold import time of each standard-library core module, in a fresh interpreter."""
+    import os
+    import subprocess
+    from core import STDLIB_MODULES
+    script = ("import sys, time; start = time.perf_counter(); import core.{}; "
+              "print((time.perf_counter() - start) * 1000, 'numpy' in sys.modules or 'PIL' in sys.modules)")
+    print("Core import (fresh interpreter):")
+    for name in STDLIB_MODULES:
+        result = subprocess.run([sys.executable, '-c', script.format(name)], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        elapsed, heavy = result.stdout.split()
+        note = "   LOADS NUMPY/PILLOW" if heavy == 'True' else ""
+        print(f"  core.{name:<11} {float(elapsed):6.1f} ms{note}")
+
+
+def _legacy_sv_square(hue_val, area_size):
+    """The color pickers' original per-pixel make_gradient()."""
+    if Image is not None:
+        img = Image.new('RGB', (area_size, area_size))
+        pixels = img.load()
+    else:
+        pixels = {} # Same per-pixel work without Pillow
+    for y_coord in range(area_size):
+        for x_coord in range(area_size):
+            saturation = x_coord / (area_size-1)
+            value = 1 - (y_coord / (area_size-1))
+            r_val, g_val, b_val = colorsys.hsv_to_rgb(hue_val, saturation, value)
+            pixels[x_coord, y_coord] = (int(r_val*255), int(g_val*255), int(b_val*255))
+    return pixels
+
+
+def _vectorized_sv_square(hue_val, area_size):
+    """The color pickers' current render path (array math, then one Pillow wrap)."""
+    from core.picker import render_sv_square
+    pixels = render_sv_square(hue_val, area_size)
+    if Image is not None:
+        return Image.frombuffer('RGB', (area_size, area_size), pixels, 'raw', 'RGB', 0, 1)
+    return pixels
+
+
+@benchmark('sv_square')
+def bench_sv_square():
+    """Per-hue render time of the color picker's saturation/value square."""
+    area_size = 180
+    print(f"Color picker SV square, {area_size}x{area_size}, time per hue change:")
+    for hue in (0.0, 0.33, 0.71):
+        before = time_per_call(_legacy_sv_square, hue, area_size, repeat=3, number=1)
+        after = time_per_call(_vectorized_sv_square, hue, area_size)
+        print(f"  hue {hue:.2f}: before {before:8.2f} ms   after {after:6.3f} ms   ({before / after:,.0f}x)")
+
+
+@benchmark('sv_cache')
+def bench_sv_cache():
+    """Hue-slider lookups through the picker's square cache, cold and warm."""
+    from core.picker import SVSquareCache
+    area_size = 180
+    cache = SVSquareCache()
+    cold = time_per_call(lambda: [cache.get(hue, area_size) for hue in range(360)], repeat=1, number=1)
+    warm = time_per_call(lambda: [cache.get(hue, area_size) for hue in range(360)])
+    stats = cache.stats()
+    print(f"Color picker square cache, {area_size}x{area_size}, sweep over 360 hues:")
+    print(f"  cold {cold / 360:.3f} ms/hue   warm {warm / 360 * 1000:.2f} us/hue   "
+          f"(hits {stats['hits']}, misses {stats['misses']}, {stats['entries']} entries)")
+
+
+@benchmark('palette')
+def bench_palette():
+    """Color Generator palettes for a set of base colors, computed and cached."""
+    from core import palettes
+    bases = [f"#{(i * 2654435761) & 0xFFFFFF:06X}" for i in range(1000)]
+    palettes._cached_palette.cache_clear()
+    cold = time_per_call(lambda: [palettes.get_palette(base) for base in bases], repeat=1, number=1)
+    warm = time_per_call(lambda: [palettes.get_palette(base) for base in bases])
+    info = palettes.palette_cache_info()
+    print(f"Color Generator palettes, {len(bases)} base colors:")
+    print(f"  computed {cold / len(bases) * 1000:6.2f} us/palette   cached {warm / len(bases) * 1000:5.2f} us/palette   "
+          f"(hits {info.hits}, misses {info.misses})")
+
+
+@benchmark('palette_bulk')
+def bench_palette_bulk():
+    """Palettes for a catalog of base colors, one at a time and vectorized."""
+    from core import palette_bulk, palettes
+    bases = [f"#{(i * 2654435761) & 0xFFFFFF:06X}" for i in range(20000)]
+    scalar = time_per_call(lambda: [palettes._compute_palette(base, 0) for base in bases], repeat=1, number=1)
+    bulk = time_per_call(lambda: palette_bulk.bulk_palettes(palette_bulk.parse_hex_colors(bases)[0]), repeat=3)
+    print(f"Color Generator palettes, {len(bases)} base colors (uncached):")
+    print(f"  one at a time {len(bases) / scalar * 1000:9,.0f} palette sets/s   "
+          f"vectorized {len(bases) / bulk * 1000:9,.0f} palette sets/s   ({scalar / bulk:.0f}x)")
+
+
+def _legacy_palette_image(colors):
+    """The palette export's original drawing code: font loaded and every label measured per export."""
+    from PIL import ImageDraw, ImageFont
+    swatch_width, swatch_height, hex_h = 250, 350, 40
+    img = Image.new('RGB', (swatch_width * len(colors), swatch_height + hex_h), color='#fff')
+    draw = ImageDraw.Draw(img)
+    try:
+        font = ImageFont.truetype("Montserrat-Bold.ttf", 80)
+    except IOError:
+        font = ImageFont.load_default()
+    for i, color in enumerate(colors):
+        x0 = i * swatch_width
+        draw.rectangle([x0, 0, x0 + swatch_width, swatch_height], fill=color)
+        bbox = draw.textbbox((0, 0), color.upper(), font=font)
+        text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        draw.text((x0 + (swatch_width - text_w) // 2, swatch_height + (hex_h - text_h) // 2),
+                  color.upper(), fill='#000', font=font)
+    return img
+
+
+@benchmark('palette_image')
+def bench_palette_image():
+    """Drawing palette export images, per export and with the font/metrics caches warm."""
+    if Image is None:
+        print("Palette images: skipped (Pillow is not installed)")
+        return
+    from contextlib import redirect_stdout
+    import io
+    from core import palettes, palette_image
+    palette_sets = [palettes.get_palette(f"#{(i * 2654435761) & 0xFFFFFF:06X}") for i in range(25)]
+    batch = [colors for palette_set in palette_sets for colors in palette_set.values()] # 100 palettes
+    with redirect_stdout(io.StringIO()): # Missing-font warnings
+        before = time_per_call(lambda: [_legacy_palette_image(colors) for colors in batch], repeat=3)
+        after = time_per_call(lambda: [palette_image.render_palette_image(colors) for colors in batch], repeat=3)
+    font_info = palette_image.load_font.cache_info()
+    print(f"Palette images, {len(batch)} palettes of 6 swatches:")
+    print(f"  before {before / len(batch):6.2f} ms/palette   after {after / len(batch):6.2f} ms/palette   "
+          f"(font loads {font_info.misses}, text sizes cached {palette_image.text_size.cache_info().currsize})")
+
+
+@benchmark('preset_search')
+def bench_preset_search():
+    """Preset library searches as the preset dialog runs them, on 100k saved gradients."""
+    import random
+    from core.presets import PresetStore
+    rng = random.Random(7)
+    words = ['Sunset', 'Ocean', 'Mint', 'Forest', 'Neon', 'Pastel', 'Fire', 'Ice', 'Dusk', 'Aurora']
+
+    def generated():
+        for i in range(100_000):
+            colors = [f"#{rng.getrandbits(24):06X}" for _ in range(rng.randint(2, 8))]
+            yield f"{rng.choice(words)} {i}", colors, None, [rng.choice(words).lower(), 'custom']
+
+    store = PresetStore(':memory:')
+    start = time.perf_counter()
+    store.add_many(generated())
+    print(f"Preset library, {store.count()} gradients (filled in {time.perf_counter() - start:.1f} s):")
+    searches = {
+        'everything': {},
+        'name prefix "sun"': {'text': 'sun'},
+        'tag "mint"': {'text': 'mint'},
+        'hue 200': {'hue': 200},
+        '4 stops, hue 200': {'stop_count': 4, 'hue': 200},
+        '"ocean", 4 stops, hue 200': {'text': 'ocean', 'stop_count': 4, 'hue': 200},
+    }
+    for label, filters in searches.items():
+        ms = time_per_call(lambda: store.search(limit=500, **filters), repeat=3)
+        print(f"  {label:28s} {ms:6.2f} ms")
+    store.close()
+
+
+@benchmark('text_stats')
+def bench_text_stats():
+    """Text Tools statistics after a one-character edit, on documents up to 8 MB."""
+    from core import text as text_core
+    line = "The quick brown fox jumps over the lazy dog, again and again.\n"
+    for size_mb in (1, 8):
+        text = line * (size_mb * 1024 * 1024 // len(line))
+        stats = text_core.LineStats(text)
+        middle = stats.line_total // 2
+        edited = line[:-1] + 'x'
+        before = time_per_call(text_core.text_stats, text, repeat=3)
+        after = time_per_call(lambda: (stats.replace_lines(middle, middle + 1, [edited]), stats.stats()))
+        print(f"Text stats per keystroke, {size_mb} MB ({stats.line_total} lines):")
+        print(f"  before {before:8.3f} ms   after {after:8.3f} ms   ({before / after:,.0f}x)")
+
+
+@benchmark('text_file')
+def bench_text_file():
+    """Statistics of a 64 MB log file: streamed through a memory map, and read whole as before."""
+    import os
+    import tempfile
+    from core import text as text_core, text_files
+    from core.memory import peak_rss_bytes
+    line = b"2024-01-01 12:00:00 INFO worker-3 processed request id=12345 in 12ms\n"
+    with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as f:
+        f.write(line * (64 * 1024 * 1024 // len(line)))
+    try:
+        size_mb = os.path.getsize(f.name) / 1e6
+        rss_before = peak_rss_bytes()
+        streamed = time_per_call(text_files.file_stats, f.name, repeat=2, number=1)
+        rss_streamed = peak_rss_bytes() # Measured before the whole-file read raises the peak
+
+        def read_whole():
+            with open(f.name, encoding='utf-8', errors='replace') as whole:
+                return text_core.text_stats(whole.read())
+        whole = time_per_call(read_whole, repeat=1, number=1)
+    finally:
+        os.remove(f.name)
+    print(f"Text file statistics, {size_mb:.0f} MB:")
+    print(f"  read whole {size_mb / whole * 1000:6.0f} MB/s   streamed {size_mb / streamed * 1000:6.0f} MB/s   "
+          f"(streaming raised peak RSS by {(rss_streamed - rss_before) / 1e6:.0f} MB)")
+
+
+def _legacy_sentence_case(text):
+    """Text Tools' original to_sentence_case(): lower(), re.sub with a callback, split, per-line fix-up, join."""
+    import re
+    text = text.lower()
+    text = re.sub(r'([.!?])(\s*)([a-z])', lambda m: m.group(1) + m.group(2) + m.group(3).upper(), text)
+    processed_lines = []
+    for line in text.split('\n'):
+        stripped_line = line.lstrip()
+        if stripped_line:
+            first_char_index = line.find(stripped_line[0])
+            processed_lines.append(line[:first_char_index] + stripped_line[0].upper() + stripped_line[1:])
+        else:
+            processed_lines.append(line)
+    return '\n'.join(processed_lines)
+
+
+@benchmark('sentence_case')
+def bench_sentence_case():
+    """Sentence case conversion of prose from 1 KB to 100 MB."""
+    from core import text as text_core
+    paragraph = ("the quick brown fox jumps over the lazy dog. it was a sunny day! what happened next? "
+                 "nobody knows.\n  another line starts here, with some words. and more follow it.\n\n")
+    print("Sentence case:")
+    for label, size in (('1 KB', 1024), ('100 KB', 100 * 1024), ('1 MB', 1024 ** 2), ('10 MB', 10 * 1024 ** 2),
+                        ('100 MB', 100 * 1024 ** 2)):
+        text = paragraph * (size // len(paragraph) + 1)
+        rounds = {'repeat': 1, 'number': 1} if size >= 10 * 1024 ** 2 else {'repeat': 3}
+        before = time_per_call(_legacy_sentence_case, text, **rounds)
+        after = time_per_call(text_core.to_sentence_case, text, **rounds)
+        print(f"  {label:>6}: before {before:9.2f} ms   after {after:9.2f} ms   ({before / after:.1f}x)")
+
+
+def main(argv=None):
+    names = (argv if argv is not None else sys.argv[1:]) or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)}. Available: {', '.join(BENCHMARKS)}")
+        return 2
+    for name in names:
+        BENCHMARKS[name]()
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,17 +1,15 @@
 # calc_tools.py
 import tkinter as tk
 from tkinter import ttk
-import calendar
-import datetime
 
 # Import constants and helper functions
 from constants import (
     PRIMARY_BG, SECONDARY_BG, TEXT_MUTED, INPUT_BG, INPUT_FG, ACCENT_BLUE,
     HOVER_ACCENT_BLUE, FONT_FAMILY, FONT_INPUT, UNITS_CATEGORIES,
-    LENGTH_CONVERSION_FACTORS, MASS_CONVERSION_FACTORS, VOLUME_CONVERSION_FACTORS,
     TEXT_LIGHT, WARNING_RED, SUCCESS_GREEN
 )
 import helpers
+from core import dates, units
 
 def create_unit_converter_widgets(app, parent_frame):
     """
@@ -582,49 +580,9 @@ def _perform_unit_conversion(app):
             app.unit_result_var.set("N/A")
             return
 
-        # Special case for temperature conversion (non-linear)
-        if from_u in ['°C', '°F'] and to_u in ['°C', '°F']:
-            if from_u == to_u:
-                result = value
-            elif from_u == '°C' and to_u == '°F':
-                result = (value * 9/5) + 32
-            elif from_u == '°F' and to_u == '°C':
-                result = (value - 32) * 5/9
-            else: # Should not happen with current unit lists
-                result = 'N/A'
-            app.unit_result_var.set(f"{result:.2f}" if isinstance(result, (float, int)) else str(result))
-            return
-
-        # For other unit types, find their category and use conversion factors
-        from_cat = None
-        to_cat = None
-        for cat, units in UNITS_CATEGORIES.items():
-            if from_u in units:
-                from_cat = cat
-            if to_u in units:
-                to_cat = cat
-
-        # Ensure both units belong to the same category
-        if from_cat != to_cat or from_cat is None:
-            app.unit_result_var.set("N/A")
-            return
-
-        # Get the appropriate conversion factors dictionary
-        factors = None
-        if from_cat == "Length":
-            factors = LENGTH_CONVERSION_FACTORS
-        elif from_cat == "Mass":
-            factors = MASS_CONVERSION_FACTORS
-        elif from_cat == "Volume":
-            factors = VOLUME_CONVERSION_FACTORS
-
-        if factors:
-            # Convert 'from' value to base unit, then from base unit to 'to' unit
-            base_val = value * factors[from_u]
-            result = base_val / factors[to_u]
-            app.unit_result_var.set(f"{result:.2f}")
-        else:
-            app.unit_result_var.set("N/A") # Should not happen if categories are correctly mapped
+        result = units.convert_unit(value, from_u, to_u)
+        # Units from different categories (or unknown units) can't be converted
+        app.unit_result_var.set("N/A" if result is None else f"{result:.2f}")
     except ValueError:
         app.unit_result_var.set("Invalid Input")
     except KeyError:
@@ -635,8 +593,7 @@ def _convert_height(app, *args):
     try:
         feet = float(app.feet_var.get() or 0)
         inches = float(app.inches_var.get() or 0)
-        total_inches = (feet * 12) + inches
-        cm = total_inches * 2.54
+        cm = units.feet_inches_to_cm(feet, inches)
         app.height_cm_var.set(f"{cm:.2f} cm")
     except ValueError:
         app.height_cm_var.set("Invalid")
@@ -646,11 +603,11 @@ def _convert_weight(app, *args):
     try:
         if getattr(app, '_weight_switch_state', 'lb_to_kg') == 'lb_to_kg':
             lbs = float(app.lbs_var.get() or 0)
-            kg = lbs * 0.453592
+            kg = units.lb_to_kg(lbs)
             app.weight_kg_var.set(f"{kg:.2f} kg")
         else: # kg_to_lb
             kg = float(app.lbs_var.get() or 0)
-            lbs = kg / 0.453592
+            lbs = units.kg_to_lb(kg)
             app.weight_kg_var.set(f"{lbs:.2f} lb")
     except ValueError:
         app.weight_kg_var.set("Invalid")
@@ -660,11 +617,11 @@ def _convert_distance(app, *args):
     try:
         if getattr(app, '_distance_switch_state', 'mile_to_km') == 'mile_to_km':
             miles = float(app.mile_var.get() or 0)
-            km = miles * 1.60934
+            km = units.miles_to_km(miles)
             app.km_var.set(f"{km:.2f} km")
         else: # km_to_mile
             km = float(app.mile_var.get() or 0)
-            miles = km / 1.60934
+            miles = units.km_to_miles(km)
             app.km_var.set(f"{miles:.2f} mile")
     except ValueError:
         app.km_var.set("Invalid")
@@ -678,7 +635,7 @@ def _convert_area(app, *args):
                 app.m2_var.set("")
                 return
             ft2 = float(val_str)
-            m2 = ft2 * 0.092903
+            m2 = units.sqft_to_sqm(ft2)
             app.m2_var.set(f"{m2:.2f} m²")
         else: # m2_to_ft2
             val_str = app.ft2_var.get()
@@ -686,7 +643,7 @@ def _convert_area(app, *args):
                 app.m2_var.set("")
                 return
             m2 = float(val_str)
-            ft2 = m2 / 0.092903
+            ft2 = units.sqm_to_sqft(m2)
             app.m2_var.set(f"{ft2:.2f} ft²")
     except ValueError:
         app.m2_var.set("Invalid")
@@ -696,11 +653,11 @@ def _convert_temp(app, *args):
     try:
         if getattr(app, '_temp_switch_state', 'f_to_c') == 'f_to_c':
             f_temp = float(app.f_var.get() or 0)
-            c_temp = (f_temp - 32) * 5/9
+            c_temp = units.fahrenheit_to_celsius(f_temp)
             app.c_var.set(f"{c_temp:.2f} °C")
         else: # c_to_f
             c_temp = float(app.f_var.get() or 0)
-            f_temp = (c_temp * 9/5) + 32
+            f_temp = units.celsius_to_fahrenheit(c_temp)
             app.c_var.set(f"{f_temp:.2f} °F")
     except ValueError:
         app.c_var.set("Invalid")
@@ -710,11 +667,11 @@ def _convert_speed(app, *args):
     try:
         if getattr(app, '_speed_switch_state', 'mph_to_kmh') == 'mph_to_kmh':
             mph = float(app.mph_var.get() or 0)
-            kmh = mph * 1.60934
+            kmh = units.mph_to_kmh(mph)
             app.kmh_var.set(f"{kmh:.2f} km/h")
         else: # kmh_to_mph
             kmh = float(app.mph_var.get() or 0)
-            mph = kmh / 1.60934
+            mph = units.kmh_to_mph(kmh)
             app.kmh_var.set(f"{mph:.2f} mph")
     except ValueError:
         app.kmh_var.set("Invalid")
@@ -915,53 +872,13 @@ def _calculate_age(app):
     year_str = app.birth_year_var.get().strip()
     month_str = app.birth_month_var.get().strip()
     day_str = app.birth_day_var.get().strip()
-    today = datetime.date.today()
 
     try:
-        # Validate year input (4 digits)
-        if not year_str or not year_str.isdigit() or len(year_str) != 4:
-            app.age_result_var.set("") # Clear result if year is invalid
+        birthdate = dates.parse_birthdate(year_str, month_str, day_str)
+        if birthdate is None:
+            app.age_result_var.set("") # Clear result while the date is incomplete or out of range
             return
-        year = int(year_str)
-
-        # Validate month input (1-12)
-        if not month_str or not month_str.isdigit():
-            month = 1 # Default to January if month is empty
-        else:
-            month = int(month_str)
-            if not (1 <= month <= 12):
-                app.age_result_var.set("")
-                return
-
-        # Validate day input based on month and year (including leap years)
-        if not day_str or not day_str.isdigit():
-            day = 1 # Default to 1st if day is empty
-        else:
-            day = int(day_str)
-            # calendar.monthrange returns (weekday_of_first_day, num_days_in_month)
-            if not (1 <= day <= calendar.monthrange(year, month)[1]):
-                app.age_result_var.set("")
-                return
-
-        birthdate = datetime.date(year, month, day)
-
-        # Calculate difference
-        years = today.year - birthdate.year
-        months = today.month - birthdate.month
-        days = today.day - birthdate.day
-
-        # Adjust for negative days (if current day is before birth day in the month)
-        if days < 0:
-            months -= 1
-            # Get days in previous month relative to today's date
-            prev_month = today.month - 1 if today.month > 1 else 12
-            prev_year = today.year if today.month > 1 else today.year - 1
-            days += calendar.monthrange(prev_year, prev_month)[1]
-
-        # Adjust for negative months (if current month is before birth month)
-        if months < 0:
-            years -= 1
-            months += 12
+        years, months, days = dates.age_between(birthdate)
 
         # Format result string based on input completeness
         result = f"{years} years"
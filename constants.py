@@ -125,6 +125,104 @@ HOVER_WARNING_RED = '#FFDAAC'     # Hover color for warning red elements
 # Duration in milliseconds for temporary status messages to be displayed.
 STATUS_MESSAGE_DURATION_MS = 2500
 
+# --- Preview Frame Interval ---
+# Minimum time in milliseconds between two repaints of the gradient preview
+# while dragging (about one display frame at 60 Hz).
+PREVIEW_FRAME_MS = 16
+
+# --- Preview Level of Detail ---
+# While the user drags a stop, turns the rotation dial or resizes the window,
+# the gradient preview is drawn with one sample per block of this many pixels
+# square. Once interaction has been idle for PREVIEW_IDLE_MS milliseconds the
+# preview is refined to full resolution.
+PREVIEW_INTERACTIVE_LOD = 4
+PREVIEW_IDLE_MS = 150
+
+# --- Radial Gradient Radius ---
+# Range of the radius slider, in percent of the distance from the radial
+# center to the farthest corner. At 100% the last stop is reached at that
+# corner; smaller radii fill the rest of the image with the last color.
+GRADIENT_RADIUS_MIN_PERCENT = 10
+GRADIENT_RADIUS_MAX_PERCENT = 200
+
+# --- Color Picker ---
+# Width and height of the pickers' saturation/value area in pixels.
+PICKER_AREA_SIZE = 180
+# Rendered saturation/value squares kept in memory (one per integer hue at the
+# default size, about 35 MB), and how long after startup the background
+# prefill of that cache begins.
+SV_CACHE_ENTRIES = 360
+SV_PREFILL_DELAY_MS = 1000
+
+# --- Parallel Export ---
+# PNG/JPEG exports with at least this many pixels are rendered in tiles by a
+# pool of worker processes; smaller ones aren't worth the process start-up.
+PARALLEL_EXPORT_MIN_PIXELS = 4_000_000
+# Default for the export "Workers" setting ("Auto" = one process per CPU core).
+DEFAULT_EXPORT_WORKERS = "Auto"
+
+# --- Background Export ---
+# How often, in milliseconds, the status bar is updated with the progress of
+# the export running in the background.
+EXPORT_POLL_MS = 100
+
+# --- Preset Gallery ---
+# Height in pixels of one row of the preset dialog, the size of a preset's
+# preview thumbnail, and how many thumbnails are kept between dialog openings
+# (about 36 KB each at this size).
+PRESET_ROW_HEIGHT = 76
+PRESET_THUMBNAIL_SIZE = (300, 40)
+PRESET_THUMBNAIL_CACHE_ENTRIES = 512
+
+# --- Preset Library ---
+# Saved gradients live in an SQLite file in this folder of the user's home
+# directory (see core/presets.py). The dialog searches again this many
+# milliseconds after the last keystroke and lists at most PRESET_SEARCH_LIMIT
+# matches; the gallery only builds widgets for the rows in view.
+PRESET_LIBRARY_DIR = '.quicktools'
+PRESET_LIBRARY_FILE = 'presets.sqlite3'
+PRESET_SEARCH_DELAY_MS = 150
+PRESET_SEARCH_LIMIT = 500
+PRESET_CUSTOM_TAG = 'custom' # Tag given to gradients saved with "Save Preset"
+# Hue filter choices of the preset dialog, in degrees; presets match within PRESET_HUE_TOLERANCE.
+PRESET_HUE_FILTERS = {
+    'Any Hue': None, 'Red': 0, 'Orange': 30, 'Yellow': 55, 'Green': 120,
+    'Cyan': 180, 'Blue': 220, 'Purple': 275, 'Pink': 325,
+}
+PRESET_HUE_TOLERANCE = 25
+
+# --- Palette Cache ---
+# Color Generator palettes kept per (base color, seed). A palette set is a few
+# hundred bytes, so this covers every color a session is likely to revisit.
+PALETTE_CACHE_SIZE = 4096
+# Seed used for the Complementary palette's variations when none is given, so
+# the same base color always shows (and exports) the same palette.
+DEFAULT_PALETTE_SEED = 0
+
+# --- Text Tools Refresh ---
+# Statistics and the converted result are refreshed once typing has paused
+# for TEXT_REFRESH_IDLE_MS. An edit larger than TEXT_STATS_THREAD_MIN_CHARS
+# (a big paste, say) is not counted in the GUI thread: the whole text is
+# recounted on a background thread instead, checked every TEXT_STATS_POLL_MS.
+TEXT_REFRESH_IDLE_MS = 150
+TEXT_STATS_THREAD_MIN_CHARS = 256 * 1024
+TEXT_STATS_POLL_MS = 50
+# Case conversion takes up to about 25 ms per million characters (sentence
+# case), so inputs up to TEXT_CONVERT_THREAD_MIN_CHARS are converted in the
+# GUI thread within about one display frame. Longer inputs are converted on a
+# background thread, TEXT_CONVERT_CHUNK_CHARS at a time: each piece takes a few
+# milliseconds, so a conversion made stale by further typing stops quickly and
+# the GUI thread is never kept from the GIL for long.
+TEXT_CONVERT_THREAD_MIN_CHARS = 512 * 1024
+TEXT_CONVERT_CHUNK_CHARS = 64 * 1024
+
+# --- Text Tools Files ---
+# A file opened in Text Tools is analyzed in a streaming pass (core/text_files.py)
+# instead of being loaded into the input box, which only shows its first
+# TEXT_PREVIEW_CHARS characters. Progress is reported every TEXT_FILE_POLL_MS.
+TEXT_PREVIEW_CHARS = 100_000
+TEXT_FILE_POLL_MS = 100
+
 # --- Font Definitions ---
 # Centralized font family and various sizes/styles for consistent typography.
 FONT_FAMILY = "Montserrat"
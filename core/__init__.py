@@ -0,0 +1,32 @@
+"""
+Pure-compute building blocks for Quick Tools.
+
+Nothing in this package imports tkinter, so these modules can be used from the
+GUI, from command-line scripts and from worker processes alike. This file
+imports none of them, so importing one module loads only what it needs.
+
+Standard library only (listed in STDLIB_MODULES); these import in
+milliseconds and never import a module from the second group:
+
+    colors    HEX/RGB/HSV conversions and simple color interpolation
+    palettes  Color Generator palettes and random gradient colors
+    units     Unit conversions
+    text      Case conversion and text statistics
+    text_files  Streaming statistics of text files too large to load (mmap)
+    dates     Birthdate parsing and age calculation
+    memory    Process memory measurements
+    jobs      Background job queue with progress and cancellation
+    presets   Searchable SQLite library of saved gradients and palettes
+
+Need NumPy or Pillow, and load it on import:
+
+    gradient  Vectorized gradient rendering (NumPy)
+    png       Streaming PNG encoder (NumPy)
+    parallel  Multi-process gradient rendering (NumPy)
+    picker    Color picker saturation/value squares (NumPy)
+    palette_bulk  The same palettes for many base colors at once (NumPy)
+    palette_image  Palette export images with cached fonts and layouts (Pillow)
+
+`python benchmarks.py core_import` checks the first group.
+"""
+STDLIB_MODULES = ('colors', 'palettes', 'units', 'text', 'text_files', 'dates', 'memory', 'jobs', 'presets')
@@ -0,0 +1,139 @@
+# core/colors.py
+"""
+Color conversions and simple color interpolation on HEX strings.
+
+Pure Python (only the standard library), so it imports in well under a
+millisecond; NumPy-based bulk rendering lives in core.gradient.
+"""
+import colorsys
+import re
+
+HEX_COLOR_RE = re.compile(r'^#([0-9a-fA-F]{6})$')
+
+
+def hex_to_rgb(hex_code: str) -> tuple:
+    """
+    Converts a HEX color code (e.g., '#RRGGBB') to an RGB tuple (R, G, B).
+
+    Args:
+        hex_code (str): The HEX color string.
+
+    Returns:
+        tuple: An RGB tuple (0-255, 0-255, 0-255).
+    """
+    hex_code = hex_code.lstrip('#')
+    return tuple(int(hex_code[i:i+2], 16) for i in (0, 2, 4))
+
+
+def rgb_to_hex(rgb_tuple: tuple) -> str:
+    """
+    Converts an RGB tuple (R, G, B) to a HEX color code (e.g., '#RRGGBB').
+
+    Args:
+        rgb_tuple (tuple): An RGB tuple (0-255, 0-255, 0-255).
+
+    Returns:
+        str: The HEX color string.
+    """
+    return '#{:02X}{:02X}{:02X}'.format(*rgb_tuple)
+
+
+def hsv_to_hex(h: float, s: float, v: float) -> str:
+    """
+    Converts HSV (Hue, Saturation, Value) to a HEX color code.
+
+    Args:
+        h (float): Hue (0.0 to 1.0).
+        s (float): Saturation (0.0 to 1.0).
+        v (float): Value (0.0 to 1.0).
+
+    Returns:
+        str: The HEX color string.
+    """
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return '#{:02X}{:02X}{:02X}'.format(int(r*255), int(g*255), int(b*255))
+
+
+def hls_to_hex(h: float, l: float, s: float) -> str:
+    """
+    Converts HLS (Hue, Lightness, Saturation) to a HEX color code.
+
+    Args:
+        h (float): Hue (0.0 to 1.0).
+        l (float): Lightness (0.0 to 1.0).
+        s (float): Saturation (0.0 to 1.0).
+
+    Returns:
+        str: The HEX color string.
+    """
+    r, g, b = colorsys.hls_to_rgb(h, l, s)
+    return '#{:02X}{:02X}{:02X}'.format(int(r*255), int(g*255), int(b*255))
+
+
+def is_valid_hex(hex_code: str) -> bool:
+    """
+    Checks if a string is a valid 7-character HEX color code (e.g., '#AABBCC').
+
+    Args:
+        hex_code (str): The string to validate.
+
+    Returns:
+        bool: True if valid, False otherwise.
+    """
+    return HEX_COLOR_RE.fullmatch(hex_code) is not None
+
+
+def interpolate_colors(color1: str, color2: str, t: float) -> str:
+    """
+    Interpolates between two HEX color codes using a factor t (0.0 to 1.0).
+
+    Args:
+        color1 (str): First HEX color.
+        color2 (str): Second HEX color.
+        t (float): Interpolation factor (0.0 = color1, 1.0 = color2).
+
+    Returns:
+        str: The interpolated HEX color code.
+    """
+    c1_rgb = hex_to_rgb(color1)
+    c2_rgb = hex_to_rgb(color2)
+
+    # Interpolate each RGB component
+    r = int(c1_rgb[0] + (c2_rgb[0] - c1_rgb[0]) * t)
+    g = int(c1_rgb[1] + (c2_rgb[1] - c1_rgb[1]) * t)
+    b = int(c1_rgb[2] + (c2_rgb[2] - c1_rgb[2]) * t)
+
+    return rgb_to_hex((r, g, b))
+
+
+def even_positions(n: int) -> list:
+    """
+    Returns n gradient stop positions spread evenly from 0.0 to 1.0.
+
+    A single stop sits in the middle (0.5).
+    """
+    return [i/(n-1) if n > 1 else 0.5 for i in range(n)]
+
+
+def even_gradient_color(colors: list, frac: float) -> str:
+    """
+    Returns the color at a fraction along a gradient whose stops are evenly spaced.
+
+    Args:
+        colors (list): HEX color codes, first to last.
+        frac (float): The position along the gradient (0.0 to 1.0).
+
+    Returns:
+        str: The HEX color code at that position.
+    """
+    if len(colors) == 1:
+        return colors[0] # Solid color if only one
+
+    # Find the position in the color array (e.g., if 3 colors, pos will be 0 to 2)
+    pos_in_array = frac * (len(colors) - 1)
+    idx = int(pos_in_array) # Integer part is the left color index
+
+    if idx >= len(colors) - 1: # At or beyond the last color
+        return colors[-1]
+    t = pos_in_array - idx # Fractional part for interpolation between idx and idx+1
+    return interpolate_colors(colors[idx], colors[idx + 1], t)
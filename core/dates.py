@@ -0,0 +1,84 @@
+# core/dates.py
+"""
+Birthdate parsing and age calculation.
+"""
+import calendar
+import datetime
+
+
+def parse_birthdate(year_str: str, month_str: str = '', day_str: str = ''):
+    """
+    Builds a birthdate from the calculator's year/month/day fields.
+
+    An empty month or day defaults to 1.
+
+    Args:
+        year_str (str): Four-digit year.
+        month_str (str): Month (1-12), may be empty.
+        day_str (str): Day of the month, may be empty.
+
+    Returns:
+        datetime.date: The birthdate, or None if a field is incomplete or out of range.
+
+    Raises:
+        ValueError: If the fields form an impossible date (e.g., year 0000).
+    """
+    year_str, month_str, day_str = year_str.strip(), month_str.strip(), day_str.strip()
+
+    # Validate year input (4 digits)
+    if not year_str or not year_str.isdigit() or len(year_str) != 4:
+        return None
+    year = int(year_str)
+
+    # Validate month input (1-12)
+    if not month_str or not month_str.isdigit():
+        month = 1 # Default to January if month is empty
+    else:
+        month = int(month_str)
+        if not (1 <= month <= 12):
+            return None
+
+    # Validate day input based on month and year (including leap years)
+    if not day_str or not day_str.isdigit():
+        day = 1 # Default to 1st if day is empty
+    else:
+        day = int(day_str)
+        # calendar.monthrange returns (weekday_of_first_day, num_days_in_month)
+        if not (1 <= day <= calendar.monthrange(year, month)[1]):
+            return None
+
+    return datetime.date(year, month, day)
+
+
+def age_between(birthdate, today=None):
+    """
+    Calculates an age as whole years, months and days.
+
+    Args:
+        birthdate (datetime.date): The date of birth.
+        today (datetime.date, optional): The reference date (defaults to today).
+
+    Returns:
+        tuple: (years, months, days).
+    """
+    today = today or datetime.date.today()
+
+    # Calculate difference
+    years = today.year - birthdate.year
+    months = today.month - birthdate.month
+    days = today.day - birthdate.day
+
+    # Adjust for negative days (if current day is before birth day in the month)
+    if days < 0:
+        months -= 1
+        # Get days in previous month relative to today's date
+        prev_month = today.month - 1 if today.month > 1 else 12
+        prev_year = today.year if today.month > 1 else today.year - 1
+        days += calendar.monthrange(prev_year, prev_month)[1]
+
+    # Adjust for negative months (if current month is before birth month)
+    if months < 0:
+        years -= 1
+        months += 12
+
+    return years, months, days
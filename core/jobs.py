@@ -0,0 +1,160 @@
+# core/jobs.py
+"""
+A background job queue for long-running exports.
+
+Jobs run one after another on a single worker thread, so several exports
+can be queued back to back while the GUI stays responsive. Each job reports
+its progress through Job.report(), which is also where cancellation takes
+effect: once a job is cancelled, its next report() raises JobCancelled and
+the job unwinds like any other exception.
+
+Nothing here touches tkinter. The GUI polls the queue from its own thread
+(see collect_finished() and the progress attributes of JobQueue.current),
+since Tk widgets may only be used from the thread running the main loop.
+"""
+import threading
+from collections import deque
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = 'queued', 'running', 'done', 'failed', 'cancelled'
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when it has been cancelled."""
+
+
+class Job:
+    """
+    One unit of background work and its progress.
+
+    The job function is called as func(job, *args, **kwargs) and its return
+    value becomes job.result. state, stage and progress are written by the
+    worker thread and can be read from any thread.
+    """
+
+    def __init__(self, name, func, args=(), kwargs=None):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.state = QUEUED
+        self.stage = 'Queued' # Short description of the current step, e.g. 'Rendering'
+        self.progress = 0.0 # Fraction of the work done, 0.0 to 1.0
+        self.result = None
+        self.error = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Asks the job to stop; it does at its next report() or check_cancelled()."""
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        """Raises JobCancelled if the job has been cancelled."""
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.name)
+
+    def report(self, done, total, stage=None):
+        """
+        Records progress from inside the job and honours cancellation.
+
+        Args:
+            done (int): Units of work completed.
+            total (int): Total units of work.
+            stage (str, optional): New value for job.stage.
+
+        Raises:
+            JobCancelled: If the job has been cancelled.
+        """
+        if stage is not None:
+            self.stage = stage
+        self.progress = min(done / total, 1.0) if total else 1.0
+        self.check_cancelled()
+
+
+class JobQueue:
+    """
+    Runs submitted jobs in order on one daemon worker thread.
+
+    Finished jobs (done, failed or cancelled) are kept until the owner
+    collects them with collect_finished(), so no result is missed between
+    two polls.
+    """
+
+    def __init__(self, name='jobs'):
+        self.name = name
+        self.current = None # The running Job, if any
+        self._queued = deque()
+        self._finished = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+
+    def submit(self, name, func, *args, **kwargs):
+        """
+        Queues func(job, *args, **kwargs) to run after the jobs already queued.
+
+        Returns:
+            Job: The queued job.
+        """
+        job = Job(name, func, args, kwargs)
+        with self._lock:
+            self._queued.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-worker", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        return job
+
+    def pending(self):
+        """Returns the jobs still waiting to run, in order."""
+        with self._lock:
+            return list(self._queued)
+
+    def cancel_current(self):
+        """Cancels the running job, if any. Returns the job or None."""
+        job = self.current
+        if job is not None:
+            job.cancel()
+        return job
+
+    def cancel_all(self):
+        """Cancels the running job and every queued one."""
+        with self._lock:
+            for job in self._queued:
+                job.cancel()
+        self.cancel_current()
+
+    def collect_finished(self):
+        """Returns the jobs that finished since the last call, oldest first."""
+        with self._lock:
+            finished = list(self._finished)
+            self._finished.clear()
+        return finished
+
+    def idle(self):
+        """True when nothing is queued, running or waiting to be collected."""
+        with self._lock:
+            return not self._queued and self.current is None and not self._finished
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._queued:
+                    self._wakeup.wait()
+                job = self._queued.popleft()
+                self.current = job
+            try:
+                job.check_cancelled() # Cancelled while still queued
+                job.state, job.stage = RUNNING, 'Starting'
+                job.result = job.func(job, *job.args, **job.kwargs)
+                job.state, job.progress = DONE, 1.0
+            except JobCancelled:
+                job.state = CANCELLED
+            except Exception as e:
+                job.state, job.error = FAILED, e
+            with self._lock:
+                self.current = None
+                self._finished.append(job)
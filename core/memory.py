@@ -0,0 +1,177 @@
+# core/memory.py
+"""
+Process memory measurements.
+"""
+import os
+import sys
+import threading
+
+
+def peak_rss_bytes():
+    """
+    Returns the peak resident set size of the current process.
+
+    Returns:
+        int: Peak RSS in bytes, or None if the platform doesn't report it.
+    """
+    try:
+        import resource
+    except ImportError:
+        return _peak_rss_windows()
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux and the BSDs report kilobytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _peak_rss_windows():
+    """Reads PeakWorkingSetSize through the Win32 process status API."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    try:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize
+    except (AttributeError, OSError):
+        return None
+
+
+class PeakMemoryMonitor:
+    """
+    Measures how much memory one piece of work adds at its peak, including the
+    child processes it starts (e.g. export worker pools).
+
+    While running, a background thread adds up the current memory of this
+    process and of all its descendants (worker pools started through a fork
+    server are grandchildren) every `interval` seconds. peak_bytes is the
+    largest total seen minus the total when the monitor started, so earlier
+    high-water marks (a large preview, a previous export) don't count.
+
+    Each process is measured by its proportional set size: a page shared by
+    n processes counts 1/n towards each of them, so pages shared between the
+    processes (shared libraries, the shared band buffers) are counted once
+    in the total rather than once per process. Kernels without
+    /proc/<pid>/smaps_rollup fall back to the resident set size, which
+    counts shared pages once per process and so errs on the high side.
+
+    Memory is read from /proc, so peak_bytes is None on platforms without it.
+
+    Usage:
+        with PeakMemoryMonitor() as monitor:
+            do_work()
+        print(monitor.peak_bytes)
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak_bytes = None
+        self._baseline = None
+        self._peak_total = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self._baseline = _tree_memory_bytes()
+        if self._baseline is not None:
+            self._peak_total = self._baseline
+            self._thread = threading.Thread(target=self._sample_until_stopped, name="memory-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+            self.peak_bytes = self._peak_total - self._baseline
+        return False
+
+    def _sample_until_stopped(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        total = _tree_memory_bytes()
+        if total is not None and total > self._peak_total:
+            self._peak_total = total
+
+
+def _tree_memory_bytes():
+    """Current memory of this process plus its live descendants, or None without /proc."""
+    own = _process_bytes(os.getpid())
+    if own is None:
+        return None
+    return own + sum(_process_bytes(pid) or 0 for pid in _descendant_pids())
+
+
+def _process_bytes(pid):
+    """Current PSS of a process, its RSS if the kernel doesn't report PSS, or None if neither can be read."""
+    pss = _pss_bytes(pid)
+    return pss if pss is not None else _rss_bytes(pid)
+
+
+def _pss_bytes(pid):
+    """Current PSS of a process from /proc/<pid>/smaps_rollup (Linux 4.14+), or None if it can't be read."""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) * 1024 # Reported in kB
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _rss_bytes(pid):
+    """Current RSS of a process from /proc/<pid>/statm, or None if it can't be read."""
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _descendant_pids():
+    """Process IDs of the children of this process, their children, and so on."""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue # The process exited meanwhile
+        # The command name (field 2) may contain spaces, so fields are counted after its closing parenthesis
+        fields = stat[stat.rfind(')') + 2:].split()
+        if len(fields) > 1:
+            children.setdefault(int(fields[1]), []).append(int(entry))
+
+    descendants = []
+    pending = [os.getpid()]
+    while pending:
+        found = children.get(pending.pop(), [])
+        descendants.extend(found)
+        pending.extend(found)
+    return descendants
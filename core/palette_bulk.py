@@ -0,0 +1,163 @@
+# core/palette_bulk.py
+"""
+Vectorized Color Generator palettes for many base colors at once.
+
+bulk_palettes() produces the same Analogous, Monochromatic, Shades and
+Complementary palettes as core.palettes.get_palette(), color for color, but
+does the HEX parsing, RGB/HLS conversions, offsets and SplitMix64 variation
+draws as NumPy array operations over the whole batch. The conversions follow
+colorsys step by step in float64, so results match the scalar path exactly.
+"""
+import numpy as np
+
+from constants import DEFAULT_PALETTE_SEED
+from core.palettes import (
+    PALETTE_NAMES, VARIATION_DRAWS, SPLITMIX_GAMMA, SPLITMIX_MUL1, SPLITMIX_MUL2, COLOR_MIX, seed_key
+)
+
+ONE_THIRD = 1.0/3.0
+ONE_SIXTH = 1.0/6.0
+TWO_THIRD = 2.0/3.0
+PALETTE_SIZE = 6
+
+# ASCII code -> hex digit value, 255 for anything that isn't a hex digit
+_HEX_DIGITS = np.full(256, 255, dtype=np.uint8)
+for _i, _ch in enumerate(b'0123456789abcdef'):
+    _HEX_DIGITS[_ch] = _i
+    _HEX_DIGITS[ord(chr(_ch).upper())] = _i
+_HEX_CHARS = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+
+def parse_hex_colors(hex_codes):
+    """
+    Parses '#RRGGBB' strings (any case, surrounding whitespace ignored).
+
+    Args:
+        hex_codes (list): HEX color strings.
+
+    Returns:
+        tuple: (rgb, valid) where rgb is a uint8 array of shape (N, 3) and
+        valid a bool array of shape (N,). Rows of invalid codes are zero.
+    """
+    codes = np.array([code.strip().encode('ascii', 'replace') for code in hex_codes],
+                     dtype='S8') # One byte longer than '#RRGGBB' to catch longer codes
+    raw = codes.view(np.uint8).reshape(len(codes), 8)
+    digits = _HEX_DIGITS[raw[:, 1:7]]
+    valid = (raw[:, 0] == ord('#')) & (raw[:, 7] == 0) & (digits != 255).all(axis=1)
+    digits[~valid] = 0
+    rgb = (digits[:, 0::2] << 4) | digits[:, 1::2]
+    return rgb, valid
+
+
+def format_hex_colors(rgb):
+    """
+    Formats a uint8 array of shape (..., 3) as '#RRGGBB' strings.
+
+    Returns:
+        numpy.ndarray: Bytes array of dtype 'S7' and shape rgb.shape[:-1].
+    """
+    rgb = np.asarray(rgb, dtype=np.uint8)
+    chars = np.empty(rgb.shape[:-1] + (7,), dtype=np.uint8)
+    chars[..., 0] = ord('#')
+    chars[..., 1::2] = _HEX_CHARS[rgb >> 4]
+    chars[..., 2::2] = _HEX_CHARS[rgb & 0x0F]
+    return chars.view('S7')[..., 0]
+
+
+def rgb_to_hls(r, g, b):
+    """Array version of colorsys.rgb_to_hls for float64 channels in [0, 1]."""
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    gray = rangec == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = (h / 6.0) % 1.0
+    return np.where(gray, 0.0, h), l, np.where(gray, 0.0, s)
+
+
+def _v(m1, m2, hue):
+    hue = hue % 1.0
+    return np.where(hue < ONE_SIXTH, m1 + (m2 - m1) * hue * 6.0,
+                    np.where(hue < 0.5, m2,
+                             np.where(hue < TWO_THIRD, m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0, m1)))
+
+
+def hls_to_rgb_bytes(h, l, s):
+    """
+    Array version of colorsys.hls_to_rgb followed by int(channel * 255).
+
+    Returns:
+        numpy.ndarray: uint8 array of shape h.shape + (3,).
+    """
+    h, l, s = np.broadcast_arrays(h, l, s)
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    gray = s == 0.0
+    out = np.empty(h.shape + (3,), dtype=np.uint8)
+    for i, offset in enumerate((ONE_THIRD, 0.0, -ONE_THIRD)):
+        channel = np.where(gray, l, _v(m1, m2, h + offset))
+        out[..., i] = (channel * 255).astype(np.int64) # Truncates like int()
+    return out
+
+
+def variation_draws(rgb, seed=DEFAULT_PALETTE_SEED, count=VARIATION_DRAWS):
+    """
+    Array version of core.palettes.variation_draws().
+
+    Args:
+        rgb (numpy.ndarray): uint8 array of shape (N, 3).
+        seed (int or str): Palette seed.
+        count (int): Numbers to draw per color.
+
+    Returns:
+        numpy.ndarray: float64 array of shape (N, count).
+    """
+    rgb = rgb.astype(np.uint64)
+    color = (rgb[:, 0] << np.uint64(16)) | (rgb[:, 1] << np.uint64(8)) | rgb[:, 2]
+    state = np.uint64(seed_key(seed)) ^ (color * np.uint64(COLOR_MIX)) # uint64 arithmetic wraps like & MASK64
+    draws = np.empty((len(rgb), count), dtype=np.float64)
+    for i in range(count):
+        state = state + np.uint64(SPLITMIX_GAMMA)
+        z = (state ^ (state >> np.uint64(30))) * np.uint64(SPLITMIX_MUL1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(SPLITMIX_MUL2)
+        z ^= z >> np.uint64(31)
+        draws[:, i] = (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+    return draws
+
+
+def bulk_palettes(rgb, seed=DEFAULT_PALETTE_SEED):
+    """
+    Builds the Color Generator palettes for many base colors.
+
+    Args:
+        rgb (numpy.ndarray): Base colors, uint8 array of shape (N, 3)
+            (see parse_hex_colors()).
+        seed (int or str): Seed for the Complementary variations, as for get_palette().
+
+    Returns:
+        dict: Palette name -> uint8 array of shape (N, 6, 3), in PALETTE_NAMES order.
+    """
+    rgb = np.asarray(rgb, dtype=np.uint8).reshape(-1, 3)
+    r, g, b = [rgb[:, i, np.newaxis] / 255.0 for i in range(3)]
+    h, l, s = rgb_to_hls(r, g, b) # (N, 1) each, broadcast against the 6 palette steps
+    steps = np.arange(PALETTE_SIZE)
+    palettes = {}
+
+    # Same offsets as core.palettes._compute_palette()
+    palettes['Analogous'] = hls_to_rgb_bytes((h + (steps-2) * (1/12)) % 1.0, l, s)
+    palettes['Monochromatic'] = hls_to_rgb_bytes(h, 0.12 + (steps * (0.76/5)), s)
+    palettes['Shades'] = hls_to_rgb_bytes(h, l, steps / 5.0)
+
+    draws = variation_draws(rgb, seed)
+    nl = np.minimum(np.maximum(l + (-0.18 + 0.36 * draws[:, 0::2]), 0.12), 0.88)
+    ns = np.minimum(np.maximum(s + (-0.22 + 0.44 * draws[:, 1::2]), 0.15), 1.0)
+    hues = np.where(steps < 3, h, (h + 0.5) % 1.0)
+    palettes['Complementary'] = hls_to_rgb_bytes(hues, nl, ns)
+    return {name: palettes[name] for name in PALETTE_NAMES}
@@ -0,0 +1,117 @@
+# core/palette_image.py
+"""
+Palette images: a row of color swatches with their HEX codes underneath.
+
+Loading a TrueType font (or failing to, and falling back to Pillow's default)
+and measuring text are the slow parts of drawing a palette, and they give
+the same answers every time. Fonts are cached by name and size, HEX label
+measurements by font and text, and swatch layouts by palette length. Exporting
+all four palettes, or hundreds in a batch, loads the font once and measures
+each distinct HEX code once.
+
+Needs Pillow; does not import tkinter.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = ImageDraw = ImageFont = None
+
+SWATCH_WIDTH = 250
+SWATCH_HEIGHT = 350
+HEX_AREA_HEIGHT = 40 # Height of white area for hex text
+HEX_FONT_NAME = "Montserrat-Bold.ttf" # Or change to any .ttf you want
+HEX_FONT_SIZE = 80
+TEXT_SIZE_CACHE_ENTRIES = 4096
+
+# Image size and one (swatch box, text area origin) pair per color
+PaletteLayout = namedtuple('PaletteLayout', ['size', 'swatches', 'labels'])
+
+
+@lru_cache(maxsize=16)
+def load_font(name, size):
+    """
+    Loads a TrueType font, falling back to Pillow's default font if it can't be found.
+
+    The result is cached, so a missing font is looked up (and warned about) once.
+    """
+    try:
+        return ImageFont.truetype(name, size)
+    except IOError:
+        print(f"Warning: Font '{name}' not found. Using default font.")
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1)
+def _measure_draw():
+    return ImageDraw.Draw(Image.new('RGB', (1, 1))) # Only used for text metrics
+
+
+@lru_cache(maxsize=TEXT_SIZE_CACHE_ENTRIES)
+def text_size(font_name, font_size, text):
+    """
+    Returns the (width, height) of a text's bounding box in a font.
+
+    Args:
+        font_name (str): Font file name, as for load_font().
+        font_size (int): Font size in points.
+        text (str): The text to measure.
+    """
+    font = load_font(font_name, font_size)
+    draw = _measure_draw()
+    try:
+        # textbbox is more accurate for font metrics
+        bbox = draw.textbbox((0, 0), text, font=font)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+    except Exception: # Fallback for older Pillow versions or issues
+        return draw.textsize(text, font=font)
+
+
+@lru_cache(maxsize=32)
+def swatch_layout(count, swatch_width=SWATCH_WIDTH, swatch_height=SWATCH_HEIGHT, hex_height=HEX_AREA_HEIGHT):
+    """
+    Returns where each swatch and HEX label of a palette image goes.
+
+    Returns:
+        PaletteLayout: size is the image (width, height); swatches holds each
+        swatch's [x0, y0, x1, y1] box and labels the (x0, y0) of the white area
+        under it, which is swatch_width by hex_height pixels.
+    """
+    swatches = tuple((i * swatch_width, 0, (i + 1) * swatch_width, swatch_height) for i in range(count))
+    labels = tuple((i * swatch_width, swatch_height) for i in range(count))
+    return PaletteLayout((swatch_width * count, swatch_height + hex_height), swatches, labels)
+
+
+def render_palette_image(colors, font_name=HEX_FONT_NAME, font_size=HEX_FONT_SIZE, progress=None):
+    """
+    Draws a palette as swatches with each HEX code centered underneath.
+
+    Args:
+        colors (list): HEX colors, drawn left to right.
+        font_name (str): Font file for the HEX codes.
+        font_size (int): Font size for the HEX codes.
+        progress (callable, optional): Called as progress(swatches_done, len(colors))
+            before each swatch.
+
+    Returns:
+        PIL.Image.Image: The RGB image.
+    """
+    layout = swatch_layout(len(colors))
+    img = Image.new('RGB', layout.size, color='#fff')
+    draw = ImageDraw.Draw(img)
+    font = load_font(font_name, font_size)
+    label_width, label_height = SWATCH_WIDTH, HEX_AREA_HEIGHT
+
+    for i, (color, box, (label_x, label_y)) in enumerate(zip(colors, layout.swatches, layout.labels)):
+        if progress is not None:
+            progress(i, len(colors))
+        draw.rectangle(box, fill=color) # Draw color swatch
+
+        hex_text = color.upper()
+        # Center text in the white area
+        text_w, text_h = text_size(font_name, font_size, hex_text)
+        draw.text((label_x + (label_width - text_w) // 2, label_y + (label_height - text_h) // 2),
+                  hex_text, fill='#000', font=font)
+    return img
@@ -0,0 +1,245 @@
+# core/palettes.py
+"""
+Color palette generation.
+
+get_palette() builds the Color Generator palettes around a base color. The
+Complementary palette's variations are drawn from a SplitMix64 stream keyed
+on the base color and a seed, so a (base color, seed) pair always gives the
+same palettes, results can be kept in a bounded LRU cache, and
+core.palette_bulk can draw the same numbers for many colors at once.
+
+random_gradient_colors() picks the colors for a random gradient in a given
+style; it takes an optional random.Random so callers control the randomness.
+"""
+import colorsys
+import hashlib
+import random
+from functools import lru_cache
+
+from constants import GRADIENT_STYLES, PALETTE_CACHE_SIZE, DEFAULT_PALETTE_SEED
+from core.colors import hex_to_rgb, hls_to_hex, hsv_to_hex
+
+PALETTE_NAMES = ('Analogous', 'Monochromatic', 'Shades', 'Complementary')
+HARMONY_STYLES = ('Analogous', 'Complementary', 'Triadic', 'Tetradic')
+
+# Complementary variations: (lightness, saturation) offsets for each of 6 colors
+VARIATION_DRAWS = 12
+
+# SplitMix64 constants (see Steele, Lea & Flood, "Fast splittable pseudorandom number generators")
+MASK64 = (1 << 64) - 1
+SPLITMIX_GAMMA = 0x9E3779B97F4A7C15
+SPLITMIX_MUL1 = 0xBF58476D1CE4E5B9
+SPLITMIX_MUL2 = 0x94D049BB133111EB
+COLOR_MIX = 0xD1B54A32D192ED03 # Spreads neighbouring RGB values across the 64-bit state
+
+
+def get_palette(base_hex, seed=DEFAULT_PALETTE_SEED):
+    """
+    Generates various color palettes (Analogous, Monochromatic, Shades, Complementary)
+    based on a given base HEX color.
+
+    Results are cached per (base color, seed); repeated calls only copy the
+    cached colors.
+
+    Args:
+        base_hex (str): The base color in HEX format (e.g., "#RRGGBB"), any case.
+        seed (int or str): Seed for the Complementary variations.
+
+    Returns:
+        dict: A dictionary where keys are palette names and values are lists of HEX colors.
+
+    Raises:
+        ValueError: If base_hex is not a valid HEX color.
+    """
+    cached = _cached_palette(base_hex.strip().upper(), seed)
+    return {name: list(colors) for name, colors in cached}
+
+
+def palette_cache_info():
+    """Returns the palette cache's hits, misses, maxsize and currsize."""
+    return _cached_palette.cache_info()
+
+
+def seed_key(seed):
+    """
+    Turns a palette seed into the 64-bit key of its variation stream.
+
+    Integers are used as is (modulo 2**64); anything else is hashed by its
+    string form, so string seeds give the same palettes in every process.
+    """
+    if isinstance(seed, int):
+        return seed & MASK64
+    return int.from_bytes(hashlib.sha256(str(seed).encode('utf-8')).digest()[:8], 'little')
+
+
+def variation_draws(rgb, seed=DEFAULT_PALETTE_SEED, count=VARIATION_DRAWS):
+    """
+    Returns the uniform [0, 1) numbers behind a base color's Complementary palette.
+
+    Args:
+        rgb (tuple): The base color as (R, G, B), 0-255 each.
+        seed (int or str): Palette seed.
+        count (int): How many numbers to draw.
+
+    Returns:
+        list: count floats, each a multiple of 2**-53.
+    """
+    r, g, b = rgb
+    state = (seed_key(seed) ^ (((r << 16) | (g << 8) | b) * COLOR_MIX)) & MASK64
+    draws = []
+    for _ in range(count):
+        state = (state + SPLITMIX_GAMMA) & MASK64
+        z = state
+        z = ((z ^ (z >> 30)) * SPLITMIX_MUL1) & MASK64
+        z = ((z ^ (z >> 27)) * SPLITMIX_MUL2) & MASK64
+        z ^= z >> 31
+        draws.append((z >> 11) * (1.0 / (1 << 53)))
+    return draws
+
+
+@lru_cache(maxsize=PALETTE_CACHE_SIZE)
+def _cached_palette(base_hex, seed):
+    palettes = _compute_palette(base_hex, seed)
+    return tuple((name, tuple(colors)) for name, colors in palettes.items()) # Immutable, shared by callers
+
+
+def _compute_palette(base_hex, seed):
+    """Builds the four palettes for a base color and seed."""
+    rgb = hex_to_rgb(base_hex)
+    r, g, b = [x/255.0 for x in rgb]
+    h, l, s = colorsys.rgb_to_hls(r, g, b) # Hue, Lightness, Saturation
+    palettes = {}
+
+    # Analogous: Colors adjacent on the color wheel (30 deg steps, 1/12 of 360 deg)
+    palettes['Analogous'] = [hls_to_hex((h + (i-2) * (1/12)) % 1.0, l, s) for i in range(6)]
+
+    # Monochromatic: Lightness steps from 0.12 to 0.88 for the same hue and saturation
+    palettes['Monochromatic'] = [hls_to_hex(h, 0.12 + (i * (0.76/5)), s) for i in range(6)]
+
+    # Shades: Saturation steps from 0.0 (gray) to 1.0 (full color) for the same hue and lightness
+    palettes['Shades'] = [hls_to_hex(h, l, i / 5.0) for i in range(6)]
+
+    # Complementary: Base color and its complement, with random lightness/saturation variations
+    draws = iter(variation_draws(rgb, seed))
+    def varied(hue):
+        nl = min(max(l + (-0.18 + 0.36 * next(draws)), 0.12), 0.88)
+        ns = min(max(s + (-0.22 + 0.44 * next(draws)), 0.15), 1.0)
+        return hls_to_hex(hue, nl, ns)
+
+    complement = (h + 0.5) % 1.0
+    palettes['Complementary'] = [varied(h) for _ in range(3)] + [varied(complement) for _ in range(3)]
+    return palettes
+
+
+def _harmony_colors(style, palette, n, rng):
+    """Builds n colors around a random base color following a color-wheel harmony."""
+    base_hex = rng.choice(palette)
+    h, s, v = colorsys.rgb_to_hsv(*[x/255.0 for x in hex_to_rgb(base_hex)])
+    colors = []
+
+    if style == 'Analogous':
+        angle_range = rng.uniform(30, 90) # Variable angle range for analogy
+        start_offset = rng.uniform(-angle_range/2, angle_range/2)
+        for i in range(n):
+            angle = start_offset + (i * angle_range / max(n-1, 1))
+            new_h = (h + angle/360) % 1.0
+            new_s = min(max(s + rng.uniform(-0.15, 0.15), 0.3), 1.0)
+            new_v = min(max(v + rng.uniform(-0.2, 0.2), 0.4), 1.0)
+            colors.append(hsv_to_hex(new_h, new_s, new_v))
+
+    elif style == 'Complementary':
+        comp_h = (h + 0.5) % 1.0
+        for i in range(n):
+            current_h = h if i % 2 == 0 else comp_h
+            new_h = (current_h + rng.uniform(-15, 15)/360) % 1.0
+            new_s = min(max(s + rng.uniform(-0.2, 0.2), 0.4), 1.0)
+            new_v = min(max(v + rng.uniform(-0.25, 0.25), 0.3), 1.0)
+            colors.append(hsv_to_hex(new_h, new_s, new_v))
+
+    elif style == 'Triadic':
+        triad_hues = [(h + i * 120/360) % 1.0 for i in range(3)]
+        for i in range(n):
+            base_h = triad_hues[i % 3]
+            new_h = (base_h + rng.uniform(-10, 10)/360) % 1.0
+            new_s = min(max(s + rng.uniform(-0.18, 0.18), 0.35), 1.0)
+            new_v = min(max(v + rng.uniform(-0.22, 0.22), 0.35), 1.0)
+            colors.append(hsv_to_hex(new_h, new_s, new_v))
+
+    elif style == 'Tetradic':
+        tetrad_hues = [(h + i * 90/360) % 1.0 for i in range(4)]
+        for i in range(n):
+            base_h = tetrad_hues[i % 4]
+            new_h = (base_h + rng.uniform(-8, 8)/360) % 1.0
+            new_s = min(max(s + rng.uniform(-0.15, 0.15), 0.4), 1.0)
+            new_v = min(max(v + rng.uniform(-0.2, 0.2), 0.4), 1.0)
+            colors.append(hsv_to_hex(new_h, new_s, new_v))
+
+    return colors
+
+
+def _theme_colors(style, palette, n, rng):
+    """Picks (or derives) n colors from a themed palette such as Warm, Cool or Pastel."""
+    if len(palette) >= n:
+        if n == 2: # For 2 colors, pick distinct ones
+            colors = rng.sample(palette, 2)
+        elif n <= len(palette) // 2: # For small n, ensure spacing
+            step = len(palette) // n
+            start = rng.randint(0, step-1)
+            colors = [palette[(start + i*step) % len(palette)] for i in range(n)]
+        else: # General random selection
+            colors = rng.sample(palette, n)
+    else:
+        # Interpolate if more colors are needed than in the palette
+        colors = []
+        for i in range(n):
+            base_color = palette[i % len(palette)]
+            h_base, s_base, v_base = colorsys.rgb_to_hsv(*[x/255.0 for x in hex_to_rgb(base_color)])
+
+            # Add controlled variation based on style
+            if style == 'Vibrant':
+                new_h = (h_base + rng.uniform(-30, 30)/360) % 1.0
+                new_s = min(max(s_base + rng.uniform(-0.1, 0.1), 0.7), 1.0)
+                new_v = min(max(v_base + rng.uniform(-0.15, 0.15), 0.6), 1.0)
+            elif style == 'Pastel':
+                new_h = (h_base + rng.uniform(-20, 20)/360) % 1.0
+                new_s = min(max(s_base + rng.uniform(-0.15, 0.05), 0.2), 0.6)
+                new_v = min(max(v_base + rng.uniform(-0.05, 0.1), 0.8), 1.0)
+            elif style == 'Muted':
+                new_h = (h_base + rng.uniform(-25, 25)/360) % 1.0
+                new_s = min(max(s_base + rng.uniform(-0.1, 0.1), 0.1), 0.5)
+                new_v = min(max(v_base + rng.uniform(-0.1, 0.1), 0.4), 0.8)
+            else:
+                new_h = (h_base + rng.uniform(-20, 20)/360) % 1.0
+                new_s = min(max(s_base + rng.uniform(-0.12, 0.12), 0.3), 1.0)
+                new_v = min(max(v_base + rng.uniform(-0.15, 0.15), 0.4), 1.0)
+
+            colors.append(hsv_to_hex(new_h, new_s, new_v))
+
+    if rng.random() < 0.3: # Occasionally shuffle for more variety
+        rng.shuffle(colors)
+    return colors
+
+
+def random_gradient_colors(style, n, rng=None, avoid=None, max_attempts=15):
+    """
+    Generates the colors of a random gradient in the given style.
+
+    Args:
+        style (str): A key of constants.GRADIENT_STYLES (unknown styles use the first one).
+        n (int): Number of colors.
+        rng (random.Random, optional): Source of randomness.
+        avoid (tuple, optional): A previous result to avoid repeating.
+        max_attempts (int): How many times to retry when the result equals avoid.
+
+    Returns:
+        list: n HEX color codes.
+    """
+    rng = rng or random.Random()
+    palette = GRADIENT_STYLES.get(style, list(GRADIENT_STYLES.values())[0])
+    build = _harmony_colors if style in HARMONY_STYLES else _theme_colors
+
+    for attempt in range(max_attempts):
+        colors = build(style, palette, n, rng)
+        if tuple(colors) != avoid:
+            break # Found a new unique gradient
+    return colors
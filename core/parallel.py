@@ -0,0 +1,145 @@
+# core/parallel.py
+"""
+Multi-process gradient rendering.
+
+Large exports are split into horizontal tiles that are rendered by a pool of
+worker processes. Workers write straight into a shared-memory output buffer,
+so only the tile coordinates and the gradient description are pickled, never
+pixel data. Every tile computes its fractions from absolute image coordinates,
+so the tiles join without seams.
+"""
+import ctypes
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.gradient import GradientModel, band_rows_for, gradient_fractions
+
+# Per-process model reused across tiles, so each worker converts the stops once
+_worker_model = None
+
+
+def resolve_workers(workers=None):
+    """
+    Turns a workers setting into a process count.
+
+    Args:
+        workers (int, optional): Requested worker count. None or 0 means one per CPU core.
+
+    Returns:
+        int: The number of worker processes to use (at least 1).
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def process_context():
+    """
+    Returns the multiprocessing context worker pools are started with.
+
+    Pools are started from background threads of the GUI, and forking a
+    multi-threaded process can deadlock the child, so workers are started
+    by a fork server where the platform has one and spawned otherwise.
+    Nothing is inherited from the parent: workers get everything they need
+    through pickled arguments and shared memory.
+
+    The fork server imports this module (and with it NumPy) before forking
+    any worker, so the workers share those pages instead of each importing
+    NumPy again.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(['__main__', __name__])
+    return context
+
+
+def _render_tile(shm_name, shape, row_offset, y0, y1, colors, positions, geometry):
+    """
+    Worker entry point: renders image rows y0 to y1 into a shared buffer.
+
+    The buffer holds image rows starting at row_offset.
+    """
+    global _worker_model
+    if _worker_model is None:
+        _worker_model = GradientModel()
+    _worker_model.set_stops(colors, positions)
+
+    width, height, gradient_type, angle, center, radius = geometry
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frac = gradient_fractions(width, height, gradient_type, angle, center, radius, y0, y1)
+        _worker_model.sample_exact(frac, out=np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)[y0 - row_offset:y1 - row_offset])
+    finally:
+        shm.close()
+    return y1 - y0
+
+
+def _submit_rows(pool, shm, shape, row_offset, y0, y1, model, geometry):
+    """Queues tiles covering image rows y0 to y1 and returns their futures."""
+    width = geometry[0]
+    tile_rows = band_rows_for(width)
+    return [pool.submit(_render_tile, shm.name, shape, row_offset, ty0, min(ty0 + tile_rows, y1),
+                        list(model.colors), list(model.positions), geometry)
+            for ty0 in range(y0, y1, tile_rows)]
+
+
+def iter_bands_parallel(model, width, height, gradient_type='linear', angle=0, center=(0.5, 0.5),
+                        radius=None, workers=None):
+    """
+    Renders the gradient across worker processes, one group of rows at a time.
+
+    A drop-in replacement for GradientModel.iter_bands() when the consumer
+    (e.g. a PNG encoder) has to see rows in order. Workers render into two
+    shared buffers of workers * BAND_PIXELS pixels in turn: while the caller
+    consumes one group, the next is already being rendered, and memory stays
+    bounded whatever the image size. Groups are yielded straight from the
+    shared buffers (the last one as a copy, so it outlives the iteration);
+    a yielded array is rendered into again once the caller asks for the
+    group after next.
+
+    Yields:
+        tuple: (y0, pixels) where pixels is a uint8 array of shape (rows, width, 3).
+    """
+    workers = resolve_workers(workers)
+    geometry = (width, height, gradient_type, angle, center, radius)
+    group_rows = min(band_rows_for(width) * workers, height)
+    shape = (group_rows, width, 3)
+
+    nbytes = group_rows * width * 3
+    buffers = [shared_memory.SharedMemory(create=True, size=max(nbytes, 1)) for _ in range(2)]
+    # NumPy doesn't hold on to the buffer export it builds a view from, so a
+    # plain view wouldn't stop close() from unmapping memory a caller can
+    # still reach. A ctypes array over the buffer keeps the export open.
+    views = [np.frombuffer((ctypes.c_ubyte * max(nbytes, 1)).from_buffer(shm.buf), dtype=np.uint8)
+             [:nbytes].reshape(shape) for shm in buffers]
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=process_context()) as pool:
+            starts = list(range(0, height, group_rows))
+            pending = _submit_rows(pool, buffers[0], shape, 0, 0, min(group_rows, height), model, geometry)
+            for i, y0 in enumerate(starts):
+                y1 = min(y0 + group_rows, height)
+                for future in pending:
+                    future.result()
+                if i + 1 < len(starts):
+                    # Start the next group before handing this one to the caller
+                    ny0 = starts[i + 1]
+                    pending = _submit_rows(pool, buffers[(i + 1) % 2], shape, ny0, ny0,
+                                           min(ny0 + group_rows, height), model, geometry)
+                # Group i + 2 reuses this buffer, and it is only submitted once the caller asks for group i + 1
+                if y1 < height:
+                    yield y0, views[i % 2][:y1 - y0]
+                else:
+                    yield y0, views[i % 2][:y1 - y0].copy()
+    finally:
+        del views
+        for shm in buffers:
+            try:
+                shm.close()
+            except BufferError:
+                pass # A caller kept an earlier group; the memory is unmapped once that array is gone
+            shm.unlink()
@@ -0,0 +1,166 @@
+# core/picker.py
+"""
+Rendering for the color pickers' saturation/value square.
+
+The square shows every saturation (left to right) and value (top to bottom)
+for one hue. For a fixed hue, HSV to RGB conversion picks the same sector for
+every pixel, so each channel is either the value ramp itself or one of three
+products of the saturation and value ramps. The whole square is built with a
+few array operations instead of one colorsys call per pixel.
+
+SVSquareCache keeps recently rendered squares keyed by integer hue and size,
+so scrubbing the hue slider back and forth only looks them up.
+"""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=8)
+def sv_ramps(size):
+    """
+    Returns the saturation and value ramps for a square of the given size.
+
+    Returns:
+        tuple: (saturation, value) float64 arrays of shapes (1, size) and
+        (size, 1); saturation runs 0 to 1 left to right, value 1 to 0 top to
+        bottom, matching the pixel coordinates of the square.
+    """
+    steps = np.arange(size, dtype=np.float64) / max(size - 1, 1)
+    saturation = steps[np.newaxis, :]
+    value = (1 - steps)[:, np.newaxis]
+    saturation.flags.writeable = False
+    value.flags.writeable = False
+    return saturation, value
+
+
+def render_sv_square(hue, size):
+    """
+    Renders the saturation/value square for a hue.
+
+    Produces exactly what colorsys.hsv_to_rgb followed by int(channel * 255)
+    gives for each pixel.
+
+    Args:
+        hue (float): Hue (0.0 to 1.0).
+        size (int): Width and height of the square in pixels.
+
+    Returns:
+        numpy.ndarray: C-contiguous uint8 array of shape (size, size, 3).
+    """
+    saturation, value = sv_ramps(size)
+
+    # Same steps as colorsys.hsv_to_rgb, with the hue sector fixed for the whole square
+    sector = int(hue * 6.0)
+    f = (hue * 6.0) - sector
+    sector = sector % 6
+    v = np.broadcast_to(value, (size, size))
+    p = value * (1.0 - saturation)
+    q = value * (1.0 - saturation * f)
+    t = value * (1.0 - saturation * (1.0 - f))
+    channels = ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))[sector]
+
+    pixels = np.empty((size, size, 3), dtype=np.uint8)
+    for i, channel in enumerate(channels):
+        pixels[:, :, i] = channel * 255 # float -> uint8 truncates, like int()
+    return pixels
+
+
+class SVSquareCache:
+    """
+    A size-bounded, thread-safe LRU cache of saturation/value squares.
+
+    Squares are keyed by integer hue in degrees (0-359) and size. Lookups
+    from the GUI thread count as hits or misses; squares rendered ahead of
+    time by start_prefill() are counted separately as prefilled.
+    """
+
+    def __init__(self, max_entries=360):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.prefilled = 0
+        self._entries = OrderedDict() # (hue_degrees, size) -> uint8 array, oldest first
+        self._lock = threading.Lock()
+        self._prefill_thread = None
+        self._stop_prefill = threading.Event()
+
+    def get(self, hue_degrees, size):
+        """
+        Returns the square for a hue, rendering and caching it on a miss.
+
+        Args:
+            hue_degrees (float): Hue in degrees; rounded to the nearest integer.
+            size (int): Width and height of the square in pixels.
+
+        Returns:
+            numpy.ndarray: Read-only uint8 array of shape (size, size, 3).
+        """
+        key = (int(round(hue_degrees)) % 360, size)
+        with self._lock:
+            pixels = self._entries.get(key)
+            if pixels is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pixels
+            self.misses += 1
+        return self._store(key, self._render(key))
+
+    def stats(self):
+        """Returns the cache counters and current size as a dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'prefilled': self.prefilled,
+                    'entries': len(self._entries), 'max_entries': self.max_entries,
+                    'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def start_prefill(self, size, hues=range(360)):
+        """
+        Renders the squares for the given hues on a background thread.
+
+        Entries already cached are skipped, and prefilling stops early once
+        the cache is full so it never evicts squares the GUI has used.
+        Does nothing if a prefill is already running.
+        """
+        if self._prefill_thread is not None and self._prefill_thread.is_alive():
+            return
+        self._stop_prefill.clear()
+        self._prefill_thread = threading.Thread(target=self._prefill, args=(size, list(hues)),
+                                                name='sv-square-prefill', daemon=True)
+        self._prefill_thread.start()
+
+    def stop_prefill(self):
+        """Asks a running prefill to stop after its current square."""
+        self._stop_prefill.set()
+
+    def _prefill(self, size, hues):
+        for hue in hues:
+            if self._stop_prefill.is_set():
+                return
+            key = (hue % 360, size)
+            with self._lock:
+                if key in self._entries:
+                    continue
+                if len(self._entries) >= self.max_entries:
+                    return
+            self._store(key, self._render(key), prefill=True)
+
+    def _render(self, key):
+        hue_degrees, size = key
+        pixels = render_sv_square(hue_degrees / 360, size)
+        pixels.flags.writeable = False # Shared between callers
+        return pixels
+
+    def _store(self, key, pixels, prefill=False):
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                return existing # Rendered concurrently by the other thread
+            self._entries[key] = pixels
+            if prefill:
+                self.prefilled += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return pixels
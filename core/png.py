@@ -0,0 +1,115 @@
+# core/png.py
+"""
+Streaming PNG encoder.
+
+PngWriter accepts an image a band of rows at a time and compresses each band
+into the file as it arrives, so memory use depends on the band size rather
+than on the image size. Only 8-bit RGB images are supported, which is all the
+gradient exporter produces.
+"""
+import struct
+import zlib
+
+import numpy as np
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Compressed bytes collected before they are written out as one IDAT chunk.
+IDAT_CHUNK_SIZE = 1 << 20
+
+
+class PngWriter:
+    """
+    Writes an RGB PNG file row band by row band.
+
+    Rows are stored with the PNG "Up" filter (each byte minus the byte above
+    it), which turns smooth gradients into long runs that zlib compresses well.
+
+    Usage:
+        with PngWriter(path, width, height) as png:
+            for band in bands:
+                png.write_rows(band)
+    """
+
+    def __init__(self, path, width, height, compress_level=6):
+        """
+        Args:
+            path (str): Output file path.
+            width (int): Image width in pixels.
+            height (int): Image height in pixels.
+            compress_level (int): zlib compression level (0 to 9).
+        """
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self._file = open(path, 'wb')
+        self._compressor = zlib.compressobj(compress_level)
+        self._pending = [] # Compressed data not yet written as an IDAT chunk
+        self._pending_size = 0
+        self._previous_row = np.zeros(width * 3, dtype=np.uint8) # Row above the next band
+
+        self._file.write(PNG_SIGNATURE)
+        # 8 bits per channel, color type 2 (RGB), default compression/filter, no interlace
+        self._write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+
+    def write_rows(self, pixels):
+        """
+        Appends a band of rows to the image.
+
+        Args:
+            pixels (numpy.ndarray): uint8 array of shape (rows, width, 3).
+        """
+        rows = pixels.shape[0]
+        if self.rows_written + rows > self.height:
+            raise ValueError("More rows written than the image height.")
+
+        flat = pixels.reshape(rows, self.width * 3)
+        scanlines = np.empty((rows, self.width * 3 + 1), dtype=np.uint8)
+        scanlines[:, 0] = 2 # Filter type "Up"
+        np.subtract(flat[0], self._previous_row, out=scanlines[0, 1:])
+        np.subtract(flat[1:], flat[:-1], out=scanlines[1:, 1:])
+        self._previous_row[:] = flat[-1]
+
+        self._queue(self._compressor.compress(scanlines))
+        self.rows_written += rows
+
+    def close(self):
+        """Finishes the compressed stream and closes the file."""
+        if self._file is None:
+            return
+        try:
+            if self.rows_written == self.height:
+                self._queue(self._compressor.flush())
+                self._flush_idat()
+                self._write_chunk(b'IEND', b'')
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is None and self.rows_written != self.height:
+            raise ValueError(f"PNG ended after {self.rows_written} of {self.height} rows.")
+
+    def _queue(self, data):
+        """Collects compressed data and writes an IDAT chunk once enough is pending."""
+        if data:
+            self._pending.append(data)
+            self._pending_size += len(data)
+        if self._pending_size >= IDAT_CHUNK_SIZE:
+            self._flush_idat()
+
+    def _flush_idat(self):
+        if self._pending:
+            self._write_chunk(b'IDAT', b''.join(self._pending))
+            self._pending = []
+            self._pending_size = 0
+
+    def _write_chunk(self, tag, data):
+        self._file.write(struct.pack('>I', len(data)))
+        self._file.write(tag)
+        self._file.write(data)
+        self._file.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(tag))))
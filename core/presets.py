@@ -0,0 +1,348 @@
+# core/presets.py
+"""
+A persistent, indexed library of user gradients and palettes (SQLite).
+
+Each preset stores its colors, optional stop positions, a kind ('gradient' or
+'palette') and the columns the preset dialog filters on: the stop count and
+a dominant hue precomputed on insert. Names, hues, stop counts and tags are
+all indexed, so name-prefix search and filtering stay in the milliseconds
+for libraries of 100k+ presets.
+
+On first use a new library is seeded with constants.GRADIENT_PRESETS, tagged
+'built-in', so built-in and user presets are searched the same way.
+
+Names and tags are stored stripped of surrounding whitespace and are limited
+to MAX_NAME_LENGTH and MAX_TAG_LENGTH characters; a preset needs at least
+MIN_COLORS colors. Presets that break these rules are rejected with a
+ValueError rather than truncated.
+"""
+import colorsys
+import math
+import os
+import sqlite3
+import time
+from collections import namedtuple
+
+from constants import GRADIENT_PRESETS
+from core.colors import hex_to_rgb, is_valid_hex
+
+KINDS = ('gradient', 'palette')
+BUILT_IN_TAG = 'built-in'
+MIN_DOMINANT_SATURATION = 0.08 # Presets whose colors are all grayer than this have no dominant hue
+MIN_COLORS = 2 # A gradient needs two stops, so one-color presets are rejected
+MAX_NAME_LENGTH = 100 # Characters, after stripping
+MAX_TAG_LENGTH = 40
+
+Preset = namedtuple('Preset', ['id', 'name', 'kind', 'colors', 'positions', 'tags'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL COLLATE NOCASE,
+    kind TEXT NOT NULL DEFAULT 'gradient',
+    colors TEXT NOT NULL,       -- space-separated '#RRGGBB'
+    positions TEXT,             -- space-separated stop positions, NULL = evenly spaced
+    stop_count INTEGER NOT NULL,
+    hue INTEGER,                -- dominant hue in degrees (0-359), NULL for grays
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS presets_kind_name ON presets (kind, name);
+CREATE INDEX IF NOT EXISTS presets_kind_hue ON presets (kind, hue);
+CREATE INDEX IF NOT EXISTS presets_kind_stops_hue ON presets (kind, stop_count, hue);
+-- kind and name are copied from presets so a tag's presets can be read in name order
+CREATE TABLE IF NOT EXISTS preset_tags (
+    tag TEXT NOT NULL COLLATE NOCASE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL COLLATE NOCASE,
+    preset_id INTEGER NOT NULL REFERENCES presets (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, kind, name, preset_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS preset_tags_preset ON preset_tags (preset_id);
+"""
+
+MAX_QUERY_PARAMS = 500 # Ids per 'IN (...)' query, well under SQLite's variable limit
+NAME_PREFIX_END = '\U0010ffff' # Sorts after any character, so [prefix, prefix + this) is a prefix range
+COLUMNS = "p.id, p.name, p.kind, p.colors, p.positions"
+
+
+def dominant_hue(colors):
+    """
+    Returns the saturation-weighted average hue of a set of colors.
+
+    Hues are averaged on the color wheel (so red at 350 and 10 degrees
+    averages to 0, not 180) and weighted by saturation, so grays don't pull
+    the result around.
+
+    Returns:
+        int: Hue in degrees (0-359), or None if every color is nearly gray.
+    """
+    x = y = 0.0
+    weight = 0.0
+    for color in colors:
+        h, s, v = colorsys.rgb_to_hsv(*[c / 255.0 for c in hex_to_rgb(color)])
+        if s < MIN_DOMINANT_SATURATION or v == 0:
+            continue
+        angle = h * 2 * math.pi
+        x += s * math.cos(angle)
+        y += s * math.sin(angle)
+        weight += s
+    if weight == 0 or (x == 0 and y == 0):
+        return None
+    return int(round(math.degrees(math.atan2(y, x)))) % 360
+
+
+def hue_ranges(hue, tolerance):
+    """Splits a hue window of +-tolerance degrees into ranges that don't wrap past 0/360."""
+    low, high = hue - tolerance, hue + tolerance
+    if tolerance >= 180:
+        return [(0, 359)]
+    if low < 0:
+        return [(0, high), (low + 360, 359)]
+    if high > 359:
+        return [(low, 359), (0, high - 360)]
+    return [(low, high)]
+
+
+class PresetStore:
+    """
+    User presets in an SQLite database file.
+
+    A connection is opened per store and used from the thread that created
+    it (the GUI thread); every write is committed immediately.
+    """
+
+    def __init__(self, path, seed_built_ins=True):
+        """
+        Opens (and creates, if needed) the library at path.
+
+        Args:
+            path (str): Database file; ':memory:' for a throwaway library.
+            seed_built_ins (bool): Fill a new library with GRADIENT_PRESETS.
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA foreign_keys = ON')
+        self._conn.execute('PRAGMA journal_mode = WAL') # Readers don't wait on a save in progress
+        self._conn.executescript(SCHEMA)
+        if seed_built_ins and self.count() == 0:
+            self.add_many((name, colors, None, (BUILT_IN_TAG,)) for name, colors in GRADIENT_PRESETS.items())
+
+    def close(self):
+        self._conn.close()
+
+    def add(self, name, colors, positions=None, tags=(), kind='gradient'):
+        """
+        Saves one preset.
+
+        Args:
+            name (str): Display name (need not be unique), at most MAX_NAME_LENGTH characters.
+            colors (list): At least MIN_COLORS HEX colors ('#RRGGBB').
+            positions (list, optional): Ascending stop positions from 0 to 1, one per color.
+            tags (iterable): Free-form tags of at most MAX_TAG_LENGTH characters,
+                matched case-insensitively. Tags that differ only in ASCII case
+                are the same tag, and the first spelling given is kept.
+            kind (str): 'gradient' or 'palette'.
+
+        Returns:
+            int: The new preset's id.
+
+        Raises:
+            ValueError: If the name, colors, positions, tags or kind are invalid.
+        """
+        return self.add_many([(name, colors, positions, tags)], kind=kind)[0]
+
+    def add_many(self, presets, kind='gradient'):
+        """
+        Saves many presets in one transaction (much faster than add() in a loop).
+
+        Args:
+            presets (iterable): (name, colors, positions, tags) tuples, as for add().
+            kind (str): 'gradient' or 'palette' for all of them.
+
+        Returns:
+            list: The new ids, in order.
+
+        Raises:
+            ValueError: As for add(); nothing is saved if any preset is invalid.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"unknown preset kind {kind!r}")
+        ids = []
+        now = time.time()
+        with self._conn:
+            for name, colors, positions, tags in presets:
+                row = _preset_row(name, colors, positions)
+                tags = _clean_tags(tags)
+                cursor = self._conn.execute(
+                    'INSERT INTO presets (name, kind, colors, positions, stop_count, hue, created) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)', (row[0], kind) + row[1:] + (now,))
+                preset_id = cursor.lastrowid
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO preset_tags (tag, kind, name, preset_id) VALUES (?, ?, ?, ?)',
+                    [(tag, kind, row[0], preset_id) for tag in tags])
+                ids.append(preset_id)
+        return ids
+
+    def delete(self, preset_id):
+        """Removes a preset and its tags."""
+        with self._conn:
+            self._conn.execute('DELETE FROM presets WHERE id = ?', (preset_id,))
+
+    def get(self, preset_id):
+        """Returns a Preset by id, or None."""
+        found = self._select(f'SELECT {COLUMNS} FROM presets p WHERE p.id = ?', [preset_id])
+        return found[0] if found else None
+
+    def count(self):
+        """Returns the number of presets in the library."""
+        return self._conn.execute('SELECT COUNT(*) FROM presets').fetchone()[0]
+
+    def tags(self):
+        """Returns every tag in use, sorted."""
+        return [row[0] for row in self._conn.execute('SELECT DISTINCT tag FROM preset_tags ORDER BY tag')]
+
+    def search(self, text='', kind='gradient', stop_count=None, hue=None, hue_tolerance=20, tag=None, limit=200):
+        """
+        Finds presets, ordered by name.
+
+        text matches the start of the name or a whole tag, hue matches
+        dominant hues within hue_tolerance degrees (wrapping around red), tag
+        and stop_count match exactly.
+
+        Each query behind a search reads an index in name order (the names of
+        one kind, or the presets of one tag), so LIMIT ends it after the first
+        `limit` matches instead of sorting every match. A text search runs
+        one query for name prefixes and one for the tag and merges them.
+
+        Args:
+            text (str): Name prefix or tag, case-insensitive ('' = any).
+            kind (str, optional): 'gradient' or 'palette' (None = both).
+            stop_count (int, optional): Exact number of colors.
+            hue (int, optional): Dominant hue in degrees.
+            hue_tolerance (int): Half-width of the hue window in degrees.
+            tag (str, optional): Required tag.
+            limit (int): Maximum number of presets returned.
+
+        Returns:
+            list: Preset tuples.
+        """
+        conditions, params = _filter_conditions(kind, stop_count, hue, hue_tolerance)
+        text, tag = text.strip(), (tag or '').strip()
+        name_range = ['p.name >= ? AND p.name < ?'], [text, text + NAME_PREFIX_END]
+        tagged_text = ['p.id IN (SELECT preset_id FROM preset_tags WHERE tag = ?)'], [text]
+
+        if tag and text:
+            queries = [_tag_query(tag, kind, *_join(conditions, params, *name_range)),
+                       _tag_query(tag, kind, *_join(conditions, params, *tagged_text))]
+        elif tag:
+            queries = [_tag_query(tag, kind, conditions, params)]
+        elif text:
+            queries = [_name_query(*_join(conditions, params, *name_range)),
+                       _tag_query(text, kind, conditions, params)]
+        else:
+            queries = [_name_query(conditions, params)]
+
+        found = {}
+        for sql, query_params in queries:
+            for preset in self._select(sql + ' LIMIT ?', query_params + [limit]):
+                found[preset.id] = preset
+        # Same order as the NOCASE collation: ASCII letters folded, ties by id
+        return sorted(found.values(), key=lambda preset: (_nocase(preset.name), preset.id))[:limit]
+
+    def _select(self, sql, params):
+        rows = self._conn.execute(sql, params).fetchall()
+        # Tags are fetched for the returned rows only, after LIMIT has applied
+        tags = {}
+        ids = [row[0] for row in rows]
+        for start in range(0, len(ids), MAX_QUERY_PARAMS):
+            chunk = ids[start:start + MAX_QUERY_PARAMS]
+            for preset_id, tag in self._conn.execute(
+                    f'SELECT preset_id, tag FROM preset_tags WHERE preset_id IN ({",".join("?" * len(chunk))}) '
+                    'ORDER BY tag', chunk):
+                tags.setdefault(preset_id, []).append(tag)
+        return [Preset(preset_id, name, kind, colors.split(),
+                       [float(p) for p in positions.split()] if positions else None,
+                       tags.get(preset_id, []))
+                for preset_id, name, kind, colors, positions in rows]
+
+
+def _preset_row(name, colors, positions):
+    """Validates a preset and returns its (name, colors, positions, stop_count, hue) column values."""
+    name = str(name).strip()
+    if not name:
+        raise ValueError("a preset needs a name")
+    if len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f"preset names are limited to {MAX_NAME_LENGTH} characters")
+    colors = [color.strip().upper() for color in colors]
+    if len(colors) < MIN_COLORS or not all(is_valid_hex(color) for color in colors):
+        raise ValueError(f"a preset needs at least {MIN_COLORS} '#RRGGBB' colors")
+    if positions is not None:
+        positions = [float(p) for p in positions]
+        if len(positions) != len(colors):
+            raise ValueError("positions must have one entry per color")
+        if (not all(math.isfinite(p) for p in positions) or any(b < a for a, b in zip(positions, positions[1:]))
+                or positions[0] < 0 or positions[-1] > 1):
+            raise ValueError("positions must be ascending values from 0 to 1")
+        positions = ' '.join(repr(p) for p in positions)
+    return name, ' '.join(colors), positions, len(colors), dominant_hue(colors)
+
+
+def _clean_tags(tags):
+    """Strips tags, drops empty ones and case-insensitive repeats, and rejects overlong ones."""
+    cleaned, seen = [], set()
+    for tag in tags:
+        tag = str(tag).strip()
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"tags are limited to {MAX_TAG_LENGTH} characters")
+        if tag and _nocase(tag) not in seen: # The tag column is NOCASE
+            seen.add(_nocase(tag))
+            cleaned.append(tag)
+    return cleaned
+
+
+def _nocase(name):
+    """Folds ASCII letters only, like SQLite's NOCASE collation."""
+    return name.translate(_ASCII_LOWER)
+
+
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+def _join(conditions, params, more_conditions, more_params):
+    return conditions + more_conditions, params + more_params
+
+
+def _filter_conditions(kind, stop_count, hue, hue_tolerance):
+    """Returns the WHERE conditions and parameters for the kind, stop count and hue filters."""
+    conditions, params = [], []
+    if kind is not None:
+        conditions.append('p.kind = ?')
+        params.append(kind)
+    if stop_count is not None:
+        conditions.append('p.stop_count = ?')
+        params.append(stop_count)
+    if hue is not None:
+        ranges = hue_ranges(int(hue) % 360, hue_tolerance)
+        conditions.append('(' + ' OR '.join('p.hue BETWEEN ? AND ?' for _ in ranges) + ')')
+        params += [bound for hue_range in ranges for bound in hue_range]
+    return conditions, params
+
+
+def _name_query(conditions, params):
+    """Presets matching the conditions, read through the (kind, name) index."""
+    where = ('WHERE ' + ' AND '.join(conditions)) if conditions else ''
+    return f'SELECT {COLUMNS} FROM presets p {where} ORDER BY p.name, p.id', params
+
+
+def _tag_query(tag, kind, conditions, params):
+    """Presets with a tag that match the conditions, read in name order from the tag's primary key."""
+    tag_conditions, tag_params = ['t.tag = ?'], [tag]
+    if kind is not None:
+        tag_conditions.append('t.kind = ?')
+        tag_params.append(kind)
+    # CROSS JOIN keeps preset_tags as the outer loop, so its order is the result order
+    return (f'SELECT {COLUMNS} FROM preset_tags t CROSS JOIN presets p ON p.id = t.preset_id '
+            f'WHERE {" AND ".join(tag_conditions + conditions)} ORDER BY t.name, t.preset_id',
+            tag_params + params)
@@ -0,0 +1,217 @@
+# core/text.py
+"""
+Text case conversion and text statistics.
+"""
+import re
+from array import array
+
+WORD_RE = re.compile(r'\b\w+\b')
+_ASCII_WORD_MARKS = bytes(0x61 if chr(i).isalnum() or chr(i) == '_' else 0x20 for i in range(128)) + b' ' * 128
+CASE_TYPES = ('upper', 'lower', 'title', 'sentence')
+
+# ASCII characters after which a text can be split without changing how its
+# case converts: they are neither cased nor case-ignorable (which . : ' ^ `
+# are), so neither title() nor the final-sigma rule of lower() looks past them.
+_SPLIT_AFTER_CHARS = ''.join(chr(i) for i in range(128) if not chr(i).isalpha() and chr(i) not in ".:'^`")
+_LAST_SPLIT_RE = re.compile(f"[{re.escape(_SPLIT_AFTER_CHARS)}][^{re.escape(_SPLIT_AFTER_CHARS)}]*\\Z")
+
+# to_sentence_case(): each match ends just before a character to capitalize.
+# Sentence starts after '.', '!' or '?' (one regex per mark, so each starts with
+# a literal) and line starts; the whitespace in between is consumed, the
+# capitalized character is not, so no match can hide another.
+_SENTENCE_CAPITALIZE_RES = (
+    re.compile(r'\.\s*(?=[a-z])'), re.compile(r'!\s*(?=[a-z])'), re.compile(r'\?\s*(?=[a-z])'),
+    re.compile(r'\n[^\S\n]*(?=\S)'),
+)
+_LEADING_SPACE_RE = re.compile(r'[^\S\n]*')
+_ASCII_UPPER = bytes(range(256)).upper()
+
+
+def text_stats(text: str) -> tuple:
+    """
+    Counts characters, words and lines in a text.
+
+    Returns:
+        tuple: (char_count, word_count, line_count). An empty text has 0 lines.
+    """
+    char_count = len(text)
+    word_count = count_words(text)
+    line_count = text.count('\n') + 1 if text else 0 # Count newlines + 1 for total lines
+    return char_count, word_count, line_count
+
+
+def count_words(text: str) -> int:
+    """Returns the number of words (runs of \\w characters) in a text."""
+    if text.isascii():
+        # Word characters become 'a' and everything else ' ', so each word
+        # starts at a ' a' (or at the very beginning); bytes.count runs in C
+        marks = text.encode('ascii').translate(_ASCII_WORD_MARKS)
+        return marks.count(b' a') + marks.startswith(b'a')
+    return WORD_RE.subn('', text)[1] # Counts matches without building a list of them
+
+
+class LineStats:
+    """
+    Character, word and line counts of a text, cached per line.
+
+    A word never spans a newline, so the counts of a text are the sums of
+    the counts of its lines. When part of the text is edited, only the lines
+    the edit touched are recounted (replace_lines()) and the totals are
+    adjusted by the difference, so an edit costs time in proportion to its
+    size, not the size of the text.
+    """
+
+    def __init__(self, text: str = ''):
+        self.reset(text)
+
+    def reset(self, text: str = ''):
+        """Recounts a whole new text."""
+        self._chars = array('q') # Characters of each line, excluding its newline
+        self._words = array('q') # Words of each line
+        self.char_total = 0
+        self.word_total = 0
+        self.replace_lines(0, 0, text.split('\n'))
+
+    @property
+    def line_total(self) -> int:
+        """Number of lines, counting an empty text as one empty line."""
+        return len(self._chars)
+
+    def replace_lines(self, first: int, last: int, lines: list):
+        """
+        Replaces the counts of lines first to last - 1 with those of new lines.
+
+        Args:
+            first (int): Index of the first replaced line (0-based).
+            last (int): Index after the last replaced line; equal to first to
+                insert lines without replacing any.
+            lines (list): The new lines' text, without newlines.
+        """
+        chars = array('q', [len(line) for line in lines])
+        words = array('q', [count_words(line) for line in lines])
+        self.char_total += sum(chars) - sum(self._chars[first:last])
+        self.word_total += sum(words) - sum(self._words[first:last])
+        self._chars[first:last] = chars
+        self._words[first:last] = words
+
+    def stats(self) -> tuple:
+        """
+        Returns:
+            tuple: (char_count, word_count, line_count), the same as text_stats()
+            of the whole text.
+        """
+        newlines = len(self._chars) - 1
+        char_count = self.char_total + newlines
+        return char_count, self.word_total, (newlines + 1) if char_count else 0
+
+
+def convert_case(text: str, case_type: str) -> str:
+    """
+    Converts text to the given case.
+
+    Args:
+        text (str): The input text.
+        case_type (str): 'upper', 'lower', 'title' or 'sentence'. Anything
+            else returns the text unchanged.
+
+    Returns:
+        str: The converted text.
+    """
+    if case_type == 'upper':
+        return text.upper()
+    if case_type == 'lower':
+        return text.lower()
+    if case_type == 'title':
+        return text.title()
+    if case_type == 'sentence':
+        return to_sentence_case(text)
+    return text
+
+
+class StreamingCaseConverter:
+    """
+    Converts a text to another case piece by piece.
+
+    Joining the output of convert() for each piece, then finish(), gives
+    exactly convert_case() of the whole text, wherever the pieces were split.
+    Only a short tail is held back between pieces: the text after the last
+    character the conversion never looks past (see _SPLIT_AFTER_CHARS), so
+    memory stays bounded unless the text has a very long run without any
+    space, digit or ASCII punctuation. Sentence case also carries whether the
+    next character starts a line or follows a sentence-ending mark.
+    """
+
+    def __init__(self, case_type: str):
+        self.case_type = case_type
+        self._pending = '' # Unconverted tail of the previous pieces
+        self._line_start = True # Only whitespace since the last newline
+        self._after_stop = False # Only whitespace since the last '.', '!' or '?'
+
+    def convert(self, text: str) -> str:
+        """Takes the next piece of text and returns the converted text that is ready."""
+        if self.case_type == 'upper': # Each character converts on its own
+            return text.upper()
+        if self.case_type not in CASE_TYPES:
+            return text
+        text = self._pending + text
+        match = _LAST_SPLIT_RE.search(text)
+        split = match.start() + 1 if match else 0
+        self._pending = text[split:]
+        return self._convert(text[:split])
+
+    def finish(self) -> str:
+        """Returns the rest of the converted text, after the last piece."""
+        text, self._pending = self._pending, ''
+        return self._convert(text)
+
+    def _convert(self, text):
+        if not text or self.case_type != 'sentence':
+            return convert_case(text, self.case_type)
+        # A one-character prefix puts to_sentence_case() in the state the
+        # previous pieces left: '\n' at a line start, '.' after a full stop,
+        # '0' (no effect on anything) otherwise
+        prefix = '\n' if self._line_start else '.' if self._after_stop else '0'
+        converted = to_sentence_case(prefix + text)[1:]
+
+        last_line = text[text.rfind('\n') + 1:]
+        if not last_line or last_line.isspace():
+            self._line_start = self._line_start or '\n' in text
+        else:
+            self._line_start = False
+        content = text.rstrip()
+        if content:
+            self._after_stop = content[-1] in '.!?'
+        return converted
+
+
+def to_sentence_case(text: str) -> str:
+    """
+    Converts the given text to sentence case.
+    (Capitalizes the first letter of each sentence and after punctuation).
+
+    The text is lowercased, then two kinds of characters are capitalized:
+    a letter a-z whose previous non-whitespace character is '.', '!' or '?',
+    and the first non-whitespace character of each line. They are found by
+    a few regex scans with no per-match callbacks, then capitalized in place
+    in a bytearray for ASCII text (the usual case), or joined from slices.
+    """
+    text = text.lower() # Start by converting all to lowercase
+    positions = [match.end() for pattern in _SENTENCE_CAPITALIZE_RES for match in pattern.finditer(text)]
+    first = _LEADING_SPACE_RE.match(text).end()
+    if first < len(text) and text[first] != '\n':
+        positions.append(first) # The first line
+    if not positions:
+        return text
+
+    if text.isascii():
+        chars = bytearray(text, 'ascii')
+        for position in positions: # Order and repeats don't matter here
+            chars[position] = _ASCII_UPPER[chars[position]]
+        return chars.decode('ascii')
+
+    pieces, start = [], 0
+    for position in sorted(set(positions)):
+        pieces += (text[start:position], text[position].upper())
+        start = position + 1
+    pieces.append(text[start:])
+    return ''.join(pieces)
@@ -0,0 +1,149 @@
+# core/text_files.py
+"""
+Text files too large to load into the Text Tools widget.
+
+Files are memory-mapped and decoded in fixed-size chunks, so memory use stays
+near the chunk size however large the file is: each chunk is copied out of
+the map, decoded and processed, and the pages behind it are handed back to
+the OS (madvise, where the platform has it) before the next one is read.
+
+Text is decoded as UTF-8 with invalid bytes replaced and universal newlines,
+exactly like open(path, encoding='utf-8', errors='replace').read(), and
+chunk boundaries never change a result: a character, a '\\r\\n' pair or a word
+split between two chunks is handled as if the file had been read whole.
+
+Case conversion streams the same way, from one file to another, and writes
+exactly what converting the whole text at once would (line endings kept).
+"""
+import codecs
+import io
+import mmap
+import os
+import re
+from contextlib import closing
+
+from core.text import StreamingCaseConverter, count_words
+
+CHUNK_SIZE = 4 * 1024 * 1024 # Bytes decoded at a time
+WORD_CHAR_RE = re.compile(r'\w')
+
+
+def iter_text_chunks(path, chunk_size=CHUNK_SIZE, progress=None, translate_newlines=True):
+    """
+    Yields the decoded text of a file, chunk by chunk.
+
+    Args:
+        path (str): The file to read.
+        chunk_size (int): Bytes read per chunk; a chunk's text has at most
+            this many characters.
+        progress (callable, optional): Called as progress(bytes_done, total_bytes)
+            before the first chunk and after each one.
+        translate_newlines (bool): Turn '\\r\\n' and '\\r' into '\\n', as open()
+            does by default. When False, line endings are kept as they are.
+
+    Yields:
+        str: Consecutive pieces of the text (never empty).
+    """
+    size = os.path.getsize(path)
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    if translate_newlines:
+        decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+    if progress is not None:
+        progress(0, size)
+    if size == 0: # mmap can't map an empty file
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(0, size, chunk_size):
+            end = min(start + chunk_size, size)
+            text = decoder.decode(mapped[start:end], final=end == size)
+            _release_pages(mapped, start, end)
+            if progress is not None:
+                progress(end, size)
+            if text:
+                yield text
+
+
+def _release_pages(mapped, start, end):
+    """Lets the OS drop the mapped pages of a processed byte range (they are re-read if touched again)."""
+    if hasattr(mapped, 'madvise'):
+        start -= start % mmap.PAGESIZE
+        mapped.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+def file_stats(path, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Counts characters, words and lines in a text file without loading it whole.
+
+    Args:
+        path (str): The file to analyze.
+        chunk_size (int): Bytes decoded at a time.
+        progress (callable, optional): As for iter_text_chunks().
+
+    Returns:
+        tuple: (char_count, word_count, line_count), the same as
+        core.text.text_stats() of the whole decoded file.
+    """
+    chars = words = newlines = 0
+    word_at_end = False # The previous chunk ended inside a word
+    for text in iter_text_chunks(path, chunk_size, progress):
+        chars += len(text)
+        newlines += text.count('\n')
+        words += count_words(text)
+        if word_at_end and WORD_CHAR_RE.match(text):
+            words -= 1 # A word split across the boundary was counted in both chunks
+        word_at_end = WORD_CHAR_RE.match(text[-1]) is not None
+    return chars, words, (newlines + 1) if chars else 0
+
+
+def read_preview(path, max_chars):
+    """
+    Returns the start of a text file, for showing in a widget.
+
+    Args:
+        path (str): The file to read.
+        max_chars (int): Maximum number of characters returned.
+
+    Returns:
+        tuple: (text, truncated), where truncated is True if the file has more.
+    """
+    pieces, length = [], 0
+    with closing(iter_text_chunks(path, chunk_size=min(CHUNK_SIZE, max_chars + 1))) as chunks:
+        for text in chunks:
+            pieces.append(text)
+            length += len(text)
+            if length > max_chars:
+                break
+    text = ''.join(pieces)
+    return text[:max_chars], len(text) > max_chars
+
+
+def convert_file(source, destination, case_type, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Writes a text file converted to another case, without loading it whole.
+
+    The output (UTF-8, line endings as in the source) is byte for byte what
+    core.text.convert_case() of the whole decoded source would give. If the
+    conversion fails or is interrupted, the partial destination is removed.
+
+    Args:
+        source (str): The file to convert.
+        destination (str): The file to write; must not be the source.
+        case_type (str): 'upper', 'lower', 'title' or 'sentence'.
+        chunk_size (int): Bytes decoded at a time.
+        progress (callable, optional): As for iter_text_chunks().
+
+    Raises:
+        ValueError: If destination is the source file.
+    """
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        raise ValueError("the converted file can't replace its source")
+    converter = StreamingCaseConverter(case_type)
+    try:
+        with open(destination, 'w', encoding='utf-8', newline='') as out:
+            for text in iter_text_chunks(source, chunk_size, progress, translate_newlines=False):
+                out.write(converter.convert(text))
+            out.write(converter.finish())
+    except BaseException: # Including a cancelled job
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
@@ -0,0 +1,108 @@
+# core/units.py
+"""
+Unit conversions used by the calculator tab.
+"""
+from constants import (
+    UNITS_CATEGORIES, LENGTH_CONVERSION_FACTORS, MASS_CONVERSION_FACTORS, VOLUME_CONVERSION_FACTORS
+)
+
+TEMPERATURE_UNITS = ('°C', '°F')
+
+# Conversion factors to each category's base unit
+CATEGORY_FACTORS = {
+    'Length': LENGTH_CONVERSION_FACTORS,
+    'Mass': MASS_CONVERSION_FACTORS,
+    'Volume': VOLUME_CONVERSION_FACTORS,
+}
+
+CM_PER_INCH = 2.54
+KG_PER_POUND = 0.453592
+KM_PER_MILE = 1.60934
+SQM_PER_SQFT = 0.092903
+
+
+def unit_category(unit):
+    """Returns the UNITS_CATEGORIES name a unit belongs to, or None."""
+    for category, units in UNITS_CATEGORIES.items():
+        if unit in units:
+            return category
+    return None
+
+
+def convert_unit(value, from_unit, to_unit):
+    """
+    Converts a value between two units of the same category.
+
+    Temperatures are converted with their offset formulas; every other
+    category goes through its base unit using the factors in constants.
+
+    Args:
+        value (float): The value to convert.
+        from_unit (str): Unit of value (e.g., 'm', 'lb', '°C').
+        to_unit (str): Unit to convert to.
+
+    Returns:
+        float: The converted value, or None if the units can't be converted
+        into each other (unknown units or different categories).
+    """
+    # Special case for temperature conversion (non-linear)
+    if from_unit in TEMPERATURE_UNITS and to_unit in TEMPERATURE_UNITS:
+        if from_unit == to_unit:
+            return value
+        if from_unit == '°C':
+            return celsius_to_fahrenheit(value)
+        return fahrenheit_to_celsius(value)
+
+    category = unit_category(from_unit)
+    if category is None or category != unit_category(to_unit):
+        return None
+    factors = CATEGORY_FACTORS.get(category)
+    if factors is None:
+        return None
+    # Convert 'from' value to base unit, then from base unit to 'to' unit
+    return value * factors[from_unit] / factors[to_unit]
+
+
+def feet_inches_to_cm(feet, inches):
+    """Converts a height in feet and inches to centimeters."""
+    return ((feet * 12) + inches) * CM_PER_INCH
+
+
+def lb_to_kg(lbs):
+    return lbs * KG_PER_POUND
+
+
+def kg_to_lb(kg):
+    return kg / KG_PER_POUND
+
+
+def miles_to_km(miles):
+    return miles * KM_PER_MILE
+
+
+def km_to_miles(km):
+    return km / KM_PER_MILE
+
+
+def sqft_to_sqm(ft2):
+    return ft2 * SQM_PER_SQFT
+
+
+def sqm_to_sqft(m2):
+    return m2 / SQM_PER_SQFT
+
+
+def fahrenheit_to_celsius(f_temp):
+    return (f_temp - 32) * 5/9
+
+
+def celsius_to_fahrenheit(c_temp):
+    return (c_temp * 9/5) + 32
+
+
+def mph_to_kmh(mph):
+    return mph * KM_PER_MILE
+
+
+def kmh_to_mph(kmh):
+    return kmh / KM_PER_MILE
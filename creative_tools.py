@@ -1,13 +1,17 @@
 # creative_tools.py
 import tkinter as tk
-from tkinter import ttk, filedialog as fd, Toplevel
-import random
+from tkinter import ttk, filedialog as fd, Toplevel, simpledialog
 import colorsys
 import time
 import math
+from contextlib import contextmanager
 from functools import partial
 import os
 import re
+import sqlite3
+import sys
+
+import numpy as np
 
 try:
     from PIL import Image, ImageTk, ImageDraw, ImageFont
@@ -23,9 +27,20 @@ except ImportError:
 from constants import (
     PRIMARY_BG, SECONDARY_BG, PALETTE_INDIGO, ACCENT_BLUE, TEXT_LIGHT, TEXT_MUTED,
     INPUT_BG, INPUT_FG, WARNING_RED, SUCCESS_GREEN, HOVER_ACCENT_BLUE,
-    FONT_FAMILY, FONT_INPUT, GRADIENT_STYLES, GRADIENT_PRESETS
+    FONT_FAMILY, FONT_INPUT, GRADIENT_STYLES, PREVIEW_FRAME_MS,
+    PREVIEW_INTERACTIVE_LOD, PREVIEW_IDLE_MS, PARALLEL_EXPORT_MIN_PIXELS, PICKER_AREA_SIZE, EXPORT_POLL_MS,
+    GRADIENT_RADIUS_MIN_PERCENT, GRADIENT_RADIUS_MAX_PERCENT,
+    PRESET_ROW_HEIGHT, PRESET_THUMBNAIL_SIZE, PRESET_THUMBNAIL_CACHE_ENTRIES, PRESET_LIBRARY_DIR,
+    PRESET_LIBRARY_FILE, PRESET_SEARCH_DELAY_MS, PRESET_SEARCH_LIMIT, PRESET_CUSTOM_TAG, PRESET_HUE_FILTERS,
+    PRESET_HUE_TOLERANCE
 )
 import helpers
+from core import gradient
+from core import colors as colors_core, palettes as palettes_core, palette_image
+from core.jobs import DONE as JOB_DONE, FAILED as JOB_FAILED
+from core.memory import PeakMemoryMonitor
+from core.parallel import resolve_workers
+from core.presets import MIN_COLORS as MIN_PRESET_COLORS, PresetStore
 
 def build_creative_tools_tab(app, notebook):
     """
@@ -176,9 +191,9 @@ def build_creative_tools_tab(app, notebook):
         # Export as JPEG text link
         def export_handler(palette_name, event=None):
             hex_code = app.creative_hex_var.get().strip()
-            if not hex_code.startswith('#') or len(hex_code) != 7:
+            if not helpers.is_valid_hex(hex_code):
                 return
-            palettes = _get_palette(hex_code)
+            palettes = palettes_core.get_palette(hex_code) # Same seed, so the export matches the swatches shown
             colors = palettes.get(palette_name)
             if colors:
                 _export_palette_to_jpeg(app, colors, palette_name)
@@ -207,48 +222,31 @@ def build_creative_tools_tab(app, notebook):
 
     # Initial palette generation
     def _generate_palettes(app_instance, sections):
-        hex_code = app_instance.creative_hex_var.get().strip()
-        if not hex_code.startswith('#') or len(hex_code) != 7:
-            # Optionally show an error or just return
-            return
-        palettes = _get_palette(hex_code)
+        hex_code = app_instance.creative_hex_var.get().strip().upper()
+        if not helpers.is_valid_hex(hex_code) or hex_code == app_instance._palette_hex:
+            return # Half-typed or unchanged HEX: keep the swatches as they are
+        app_instance._palette_hex = hex_code
+        palettes = palettes_core.get_palette(hex_code)
         for name, section_frame in sections.items():
-            for widget in section_frame.winfo_children():
-                widget.destroy() # Clear previous swatches
-
-            colors = palettes.get(name)
-            if colors:
-                for i, c in enumerate(colors):
-                    # Color swatch
-                    swatch = tk.Frame(section_frame, bg=c, width=64, height=64, bd=2, relief='ridge', cursor='hand2')
-                    swatch.grid(row=0, column=i, padx=8, pady=(4,2))
-                    swatch.bind('<Button-1>', lambda e, hexval=c: app_instance.creative_hex_var.set(hexval.upper())) # Set main hex input on click
-
-                    # Hex label with copy effect
-                    hex_label = tk.Label(section_frame, text=c.upper(), font=(FONT_FAMILY, 11), bg=PRIMARY_BG, fg=INPUT_FG, bd=0, padx=8, pady=2)
-                    hex_label.grid(row=1, column=i, padx=8, pady=(0,6))
-
-                    # Copy effect for hex label
-                    def copy_hex_effect(event, hexval, label_widget):
-                        helpers.copy_to_clipboard_helper(app_instance, hexval, f"{hexval} copied!")
-                        orig_text = label_widget.cget('text')
-                        orig_bg = label_widget.cget('bg')
-                        orig_fg = label_widget.cget('fg')
-                        label_widget.config(text='✔ Copied!', fg='#222', bg='#eaffc2')
-                        label_widget.after(900, lambda: label_widget.config(text=orig_text, fg=orig_fg, bg=orig_bg))
-                    hex_label.bind('<Button-1>', partial(copy_hex_effect, hexval=c.upper(), label_widget=hex_label))
-
-                    # Hover effect for hex label
-                    def on_hex_hover(event, label_widget):
-                        label_widget.config(bg=ACCENT_BLUE, fg='#222', cursor='hand2')
-                    def on_hex_leave(event, label_widget, orig_bg, orig_fg):
-                        label_widget.config(bg=orig_bg, fg=orig_fg, cursor='arrow')
-                    hex_label.bind('<Enter>', partial(on_hex_hover, label_widget=hex_label))
-                    hex_label.bind('<Leave>', partial(on_hex_leave, label_widget=hex_label, orig_bg=PRIMARY_BG, orig_fg=INPUT_FG))
-
-                # Make columns expand equally
-                for i in range(len(colors)):
-                    section_frame.grid_columnconfigure(i, weight=1)
+            colors = palettes.get(name) or []
+            pool = app_instance._palette_swatches.setdefault(name, [])
+            # Only create or destroy widgets when the number of colors changes
+            while len(pool) < len(colors):
+                pool.append(_create_palette_swatch(app_instance, section_frame, len(pool)))
+            while len(pool) > len(colors):
+                swatch, hex_label = pool.pop()
+                swatch.destroy()
+                hex_label.destroy()
+                section_frame.grid_columnconfigure(len(pool), weight=0)
+
+            for (swatch, hex_label), c in zip(pool, colors):
+                c = c.upper()
+                if hex_label.hex_value == c:
+                    continue
+                hex_label.hex_value = c
+                swatch.config(bg=c)
+                if not hex_label.copy_pending:
+                    hex_label.config(text=c)
 
     # Initial palette generation when the tab is first loaded
     app.creative_hex_var.trace_add('write', lambda *_: _generate_palettes(app, palette_sections))
@@ -263,65 +261,53 @@ def build_creative_tools_tab(app, notebook):
     _build_gradient_generator_section(app, scrollable_frame)
 
 
-def _get_palette(base_hex):
+def _create_palette_swatch(app, section_frame, column):
     """
-    Generates various color palettes (Analogous, Monochromatic, Shades, Complementary)
-    based on a given base HEX color.
+    Creates one palette swatch and its HEX label in a palette section.
+
+    The pair is reused across palette updates: the handlers read the color
+    from hex_label.hex_value when they fire, so changing colors only needs a
+    config() call instead of new widgets and bindings.
 
     Args:
-        base_hex (str): The base color in HEX format (e.g., "#RRGGBB").
+        app: The main application instance.
+        section_frame (tk.Frame): The palette section to place the pair in.
+        column (int): Grid column of the pair.
 
     Returns:
-        dict: A dictionary where keys are palette names and values are lists of HEX colors.
-    """
-    import colorsys
-    import random
-
-    base_rgb = helpers.hex_to_rgb(base_hex)
-    r, g, b = [x/255.0 for x in base_rgb]
-    h, l, s = colorsys.rgb_to_hls(r, g, b) # Hue, Lightness, Saturation
-    palettes = {}
-
-    # Analogous: Colors adjacent on the color wheel
-    def analogous_func(i):
-        nh = (h + (i-2) * (1/12)) % 1.0 # 30 deg steps on hue (1/12 of 360 deg)
-        nr, ng, nb = colorsys.hls_to_rgb(nh, l, s)
-        return helpers.rgb_to_hex((int(nr*255), int(ng*255), int(nb*255)))
-    palettes['Analogous'] = [analogous_func(i) for i in range(6)]
-
-    # Monochromatic: Variations of lightness for the same hue and saturation
-    def mono_func(i):
-        nl = 0.12 + (i * (0.76/5)) # Lightness steps from 0.12 to 0.88
-        nr, ng, nb = colorsys.hls_to_rgb(h, nl, s)
-        return helpers.rgb_to_hex((int(nr*255), int(ng*255), int(nb*255)))
-    palettes['Monochromatic'] = [mono_func(i) for i in range(6)]
-
-    # Shades: Variations of saturation for the same hue and lightness
-    def shade_func(i):
-        ns = i / 5.0 # Saturation steps from 0.0 (gray) to 1.0 (full color)
-        nr, ng, nb = colorsys.hls_to_rgb(h, l, ns)
-        return helpers.rgb_to_hex((int(nr*255), int(ng*255), int(nb*255)))
-    palettes['Shades'] = [shade_func(i) for i in range(6)]
-
-    # Complementary: Base color and its complement, with variations
-    def comp_base(i):
-        # Vary lightness and saturation for base colors randomly
-        nl = min(max(l + random.uniform(-0.18, 0.18), 0.12), 0.88)
-        ns = min(max(s + random.uniform(-0.22, 0.22), 0.15), 1.0)
-        nr, ng, nb = colorsys.hls_to_rgb(h, nl, ns)
-        return helpers.rgb_to_hex((int(nr*255), int(ng*255), int(nb*255)))
-
-    def comp_complement(i):
-        nhh = (h + 0.5) % 1.0 # Complementary hue
-        # Vary lightness and saturation for complementary colors randomly
-        nl = min(max(l + random.uniform(-0.18, 0.18), 0.12), 0.88)
-        ns = min(max(s + random.uniform(-0.22, 0.22), 0.15), 1.0)
-        nr, ng, nb = colorsys.hls_to_rgb(nhh, nl, ns)
-        return helpers.rgb_to_hex((int(nr*255), int(ng*255), int(nb*255)))
-
-    random.seed() # Initialize random seed
-    palettes['Complementary'] = [comp_base(i) for i in range(3)] + [comp_complement(i) for i in range(3)]
-    return palettes
+        tuple: (swatch, hex_label).
+    """
+    # Color swatch
+    swatch = tk.Frame(section_frame, bg=PRIMARY_BG, width=64, height=64, bd=2, relief='ridge', cursor='hand2')
+    swatch.grid(row=0, column=column, padx=8, pady=(4,2))
+
+    # Hex label with copy effect
+    hex_label = tk.Label(section_frame, text='', font=(FONT_FAMILY, 11), bg=PRIMARY_BG, fg=INPUT_FG, bd=0, padx=8, pady=2)
+    hex_label.grid(row=1, column=column, padx=8, pady=(0,6))
+    hex_label.hex_value = None # Color currently shown by this pair
+    hex_label.copy_pending = False # True while the "Copied!" flash is showing
+    section_frame.grid_columnconfigure(column, weight=1)
+
+    swatch.bind('<Button-1>', lambda e: app.creative_hex_var.set(hex_label.hex_value)) # Set main hex input on click
+
+    # Copy effect for hex label
+    def copy_hex_effect(event):
+        hexval = hex_label.hex_value
+        helpers.copy_to_clipboard_helper(app, hexval, f"{hexval} copied!")
+        orig_bg = hex_label.cget('bg')
+        orig_fg = hex_label.cget('fg')
+        hex_label.copy_pending = True
+        hex_label.config(text='✔ Copied!', fg='#222', bg='#eaffc2')
+        def reset():
+            hex_label.copy_pending = False
+            hex_label.config(text=hex_label.hex_value, fg=orig_fg, bg=orig_bg) # The palette may have changed meanwhile
+        hex_label.after(900, reset)
+    hex_label.bind('<Button-1>', copy_hex_effect)
+
+    # Hover effect for hex label
+    hex_label.bind('<Enter>', lambda e: hex_label.config(bg=ACCENT_BLUE, fg='#222', cursor='hand2'))
+    hex_label.bind('<Leave>', lambda e: hex_label.config(bg=PRIMARY_BG, fg=INPUT_FG, cursor='arrow'))
+    return swatch, hex_label
 
 
 def _show_color_picker(app, x=None, y=None, on_pick_callback=None):
@@ -351,35 +337,14 @@ def _show_color_picker(app, x=None, y=None, on_pick_callback=None):
         hue_var = tk.DoubleVar(value=h*360) # Hue as 0-359 degrees
         hex_var = tk.StringVar(value=initial_hex.upper()) # Current hex value
 
-        area_size = 180 # Size of the main color selection area (saturation/value)
+        area_size = PICKER_AREA_SIZE # Size of the main color selection area (saturation/value)
         left_margin = 20 # Left padding for elements
-        gradient_img = None
-        gradient_tk = None
 
         color_area = tk.Label(picker, bd=2, relief='ridge', bg=PRIMARY_BG)
         color_area.place(x=left_margin, y=40, width=area_size, height=area_size)
 
-        def make_gradient(hue_val):
-            """Creates the HSV gradient image for the color selection area."""
-            img = Image.new('RGB', (area_size, area_size))
-            pixels = img.load() # Optimize pixel access
-            for y_coord in range(area_size):
-                for x_coord in range(area_size):
-                    saturation = x_coord / (area_size-1) # X-axis maps to saturation
-                    value = 1 - (y_coord / (area_size-1)) # Y-axis maps to value (inverted)
-                    r_val, g_val, b_val = colorsys.hsv_to_rgb(hue_val, saturation, value)
-                    pixels[x_coord, y_coord] = (int(r_val*255), int(g_val*255), int(b_val*255))
-            return img
-
-        def update_gradient(*_):
-            """Updates the gradient image when the hue slider changes."""
-            nonlocal gradient_img, gradient_tk
-            hue = hue_var.get() / 360 # Convert hue back to 0-1 range
-            gradient_img = make_gradient(hue)
-            gradient_tk = ImageTk.PhotoImage(gradient_img)
-            color_area.config(image=gradient_tk)
-
-        update_gradient() # Initial draw
+        # Draws the square now and returns a per-frame coalesced redraw for hue changes
+        update_gradient = _attach_sv_area(app, color_area, hue_var, area_size)
 
         def area_pick(event):
             """Handles mouse clicks/drags on the color selection area."""
@@ -426,10 +391,14 @@ def _show_color_picker(app, x=None, y=None, on_pick_callback=None):
                     app.creative_hex_var.set(val.upper()) # Update main app's hex var
                     # Re-calculate palettes in main app if callback exists
                     if on_pick_callback:
-                        on_pick_callback()
+                        regenerate_palettes()
                 except ValueError:
                     pass # Ignore invalid hex codes without erroring out
 
+        # Dragging across the area writes a new hex per motion event; rebuild the
+        # palettes once per frame at most. Scheduled on the root window so the
+        # last update still runs if the picker closes right after a pick.
+        regenerate_palettes = _coalesce_to_frame(app.root, on_pick_callback) if on_pick_callback else None
         hex_var.trace_add('write', update_from_hex)
 
         # Set window size and position
@@ -463,53 +432,89 @@ def _show_color_picker(app, x=None, y=None, on_pick_callback=None):
         picker.lift()
         picker.focus_force()
 
+def _coalesce_to_frame(widget, func):
+    """
+    Wraps func so that any number of calls within one display frame run it once.
+
+    The first call schedules func PREVIEW_FRAME_MS later on widget's event
+    loop; further calls before then are absorbed. Arguments (e.g. from
+    variable traces) are ignored, and the call is dropped if the widget has
+    been destroyed in the meantime.
+
+    Returns:
+        callable: The coalescing wrapper.
+    """
+    pending = [None]
+
+    def run():
+        pending[0] = None
+        if widget.winfo_exists():
+            func()
+
+    def request(*_):
+        if pending[0] is None:
+            pending[0] = widget.after(PREVIEW_FRAME_MS, run)
+    return request
+
+def _attach_sv_area(app, color_area, hue_var, size):
+    """
+    Shows the saturation/value square for hue_var in a color picker's area label.
+
+    One PhotoImage is created for the lifetime of the picker and updated in
+    place with paste(). Redraws are coalesced to one per frame and skipped when
+    the integer hue hasn't changed.
+
+    Args:
+        app: The main application instance.
+        color_area (tk.Label): The label that displays the square.
+        hue_var (tk.DoubleVar): Hue in degrees.
+        size (int): Width and height of the square in pixels.
+
+    Returns:
+        callable: Requests a redraw; meant for hue_var traces.
+    """
+    photo = ImageTk.PhotoImage('RGB', (size, size), master=color_area)
+    color_area.config(image=photo)
+    color_area.image = photo # Tk doesn't keep a reference of its own
+    shown_hue = [None]
+
+    def render():
+        hue = int(round(hue_var.get())) % 360
+        if hue != shown_hue[0]:
+            shown_hue[0] = hue
+            photo.paste(_make_sv_image(app, hue, size))
+
+    render() # Initial draw
+    return _coalesce_to_frame(color_area, render)
+
+def _make_sv_image(app, hue_degrees, size):
+    """
+    Creates the saturation/value image for a color picker's selection area.
+
+    Squares come from app.sv_square_cache, which is shared by both pickers and
+    keyed by integer hue, so revisiting a hue costs only a lookup.
+
+    Args:
+        app: The main application instance.
+        hue_degrees (float): Hue in degrees (0 to 359).
+        size (int): Width and height of the square area in pixels.
+
+    Returns:
+        PIL.Image.Image: RGB image with saturation along X and value (inverted) along Y.
+    """
+    pixels = app.sv_square_cache.get(hue_degrees, size)
+    return Image.frombuffer('RGB', (size, size), pixels, 'raw', 'RGB', 0, 1)
+
 def _export_palette_to_jpeg(app, colors, palette_name):
     """
     Exports a color palette as a JPEG image with color swatches and HEX codes.
+
+    The file is chosen here; drawing and encoding run on the export queue.
     """
     if Image is None or ImageDraw is None or ImageFont is None:
         tk.messagebox.showerror("Missing Dependency", "Pillow (PIL) is required to export JPEGs. Please install it with: pip install Pillow")
         return
 
-    # --- MANUAL SETTINGS FOR EXPORT ---
-    swatch_width = 250
-    swatch_height = 350
-    hex_h = 40 # Height of white area for hex text
-    hex_font_size = 80 # Adjust for text size
-    hex_font_name = "Montserrat-Bold.ttf" # Or change to any .ttf you want
-
-    n = len(colors)
-    img_width = swatch_width * n
-    img_height = swatch_height + hex_h
-    img = Image.new('RGB', (img_width, img_height), color='#fff')
-    draw = ImageDraw.Draw(img)
-
-    try:
-        # Try to load custom font, fallback to default if not found
-        font = ImageFont.truetype(hex_font_name, hex_font_size)
-    except IOError:
-        print(f"Warning: Font '{hex_font_name}' not found. Using default font.")
-        font = ImageFont.load_default()
-
-    for i, color in enumerate(colors):
-        x0 = i * swatch_width
-        x1 = x0 + swatch_width
-        draw.rectangle([x0, 0, x1, swatch_height], fill=color) # Draw color swatch
-
-        hex_text = color.upper()
-        # Center text in the white area
-        try:
-            # textbbox is more accurate for font metrics
-            bbox = draw.textbbox((0, 0), hex_text, font=font)
-            text_w = bbox[2] - bbox[0]
-            text_h = bbox[3] - bbox[1]
-        except Exception: # Fallback for older Pillow versions or issues
-            text_w, text_h = draw.textsize(hex_text, font=font)
-
-        text_x = x0 + (swatch_width - text_w) // 2
-        text_y = swatch_height + (hex_h - text_h) // 2
-        draw.text((text_x, text_y), hex_text, fill='#000', font=font)
-
     # File dialog for saving
     filetypes = [("JPEG Image", "*.jpeg"), ("JPG Image", "*.jpg")]
     base_name = f"{palette_name}_palette"
@@ -552,11 +557,16 @@ def _export_palette_to_jpeg(app, colors, palette_name):
 
     if filename:
         app._last_palette_export_dir = os.path.dirname(filename) # Save the directory
-        try:
-            img.save(filename, format='JPEG', quality=92) # Save image with quality
-            app.update_status(f"Palette '{palette_name}' exported successfully!", SUCCESS_GREEN)
-        except Exception as e:
-            app.update_status(f"Failed to export palette: {str(e)}", WARNING_RED)
+        _queue_export(app, f"palette '{palette_name}'", _palette_jpeg_job, list(colors), filename, palette_name)
+
+def _palette_jpeg_job(job, colors, filename, palette_name):
+    """Export queue job: draws a palette image and saves it as a JPEG."""
+    img = palette_image.render_palette_image(
+        colors, progress=lambda done, total: job.report(done, total, stage="Drawing"))
+    job.report(len(colors), len(colors), stage="Encoding")
+    with _discard_on_failure(filename):
+        img.save(filename, format='JPEG', quality=92) # Save image with quality
+    return f"Palette '{palette_name}' exported successfully!"
 
 def _build_gradient_generator_section(app, parent):
     """
@@ -595,6 +605,21 @@ def _build_gradient_generator_section(app, parent):
     # Bind style change to re-generate gradient and redraw
     app.gradient_style_var.trace_add('write', lambda *_: _generate_gradient_random(app))
 
+    # Radial gradient controls: radius slider and how to move the center
+    radial_row = tk.Frame(section, bg=PRIMARY_BG)
+    radial_row.pack(anchor='center', pady=(4, 0))
+    tk.Label(radial_row, text="Radial Radius:", font=(FONT_FAMILY, 11), bg=PRIMARY_BG).pack(side='left', padx=(0, 2))
+    radius_slider = tk.Scale(radial_row, from_=GRADIENT_RADIUS_MIN_PERCENT, to=GRADIENT_RADIUS_MAX_PERCENT,
+                             orient='horizontal', variable=app.gradient_radius_var, showvalue=True, length=160,
+                             bg=PRIMARY_BG, fg="#888", highlightthickness=0, troughcolor=SECONDARY_BG, bd=0, resolution=1)
+    radius_slider.pack(side='left')
+    tk.Label(radial_row, text="%", font=(FONT_FAMILY, 10), bg=PRIMARY_BG).pack(side='left', padx=(0, 12))
+    _create_tooltip(radius_slider, "Radius of radial gradients (100% = the last color is reached at the farthest corner)")
+    tk.Label(radial_row, text="⊕ Shift-click the preview to move the radial center",
+             font=(FONT_FAMILY, 9), bg=PRIMARY_BG, fg=TEXT_MUTED).pack(side='left')
+    # Live preview while sliding, refined once the slider rests
+    app.gradient_radius_var.trace_add('write', lambda *_: _draw_gradient_preview(app, interactive=True))
+
 
     # Generate & Preset Buttons Row
     btn_row = tk.Frame(section, bg=PRIMARY_BG)
@@ -622,6 +647,15 @@ def _build_gradient_generator_section(app, parent):
     preset_btn.pack(side='left', padx=(0, 8))
     app._button_hover_colors[preset_btn] = {'original': SECONDARY_BG, 'hover': HOVER_ACCENT_BLUE}
 
+    save_preset_btn = tk.Button(
+        preset_rotate_frame, text="Save Preset", command=lambda: _save_gradient_preset(app),
+        font=(FONT_FAMILY, 11, 'bold'),
+        bg=SECONDARY_BG, fg=INPUT_FG, relief='flat', padx=16, pady=6, cursor='hand2', bd=0,
+        activebackground=HOVER_ACCENT_BLUE, activeforeground=INPUT_FG
+    )
+    save_preset_btn.pack(side='left', padx=(0, 8))
+    app._button_hover_colors[save_preset_btn] = {'original': SECONDARY_BG, 'hover': HOVER_ACCENT_BLUE}
+
     # Circular Rotation Control (for Linear gradients)
     class CircularDial(tk.Canvas):
         """A custom Tkinter Canvas widget to act as a circular dial for angle input."""
@@ -687,7 +721,7 @@ def _build_gradient_generator_section(app, parent):
     rot_entry.pack(side='left', padx=(4, 0))
     _create_tooltip(rot_entry, "Set gradient angle (0-359°)")
     # Update on entry change
-    app.gradient_rotation_var.trace_add('write', lambda *_: (dial._draw_dial(), _draw_gradient_preview(app)))
+    app.gradient_rotation_var.trace_add('write', lambda *_: (dial._draw_dial(), _draw_gradient_preview(app, interactive=True)))
 
     # Instructions label
     instructions = tk.Label(section, text="💡 Drag color stops • Double-click canvas to add • Right-click stop to delete • Double-click stop to edit color",
@@ -736,7 +770,7 @@ def _build_gradient_generator_section(app, parent):
             # Only resize if there's a significant change
             if abs(new_w - current_w) > 2 or abs(new_h - current_h) > 2:
                 app.gradient_preview_canvas.config(width=new_w, height=new_h)
-                _draw_gradient_preview(app) # Redraw gradient after resize
+                _draw_gradient_preview(app, interactive=True) # Redraw gradient after resize
             delattr(app, '_resize_timer')
 
         app._resize_timer = app.root.after(50, do_resize) # 50ms debounce
@@ -751,6 +785,7 @@ def _build_gradient_generator_section(app, parent):
     app.gradient_preview_canvas.bind('<B1-Motion>', lambda e: _on_gradient_stop_drag(app, e)) # Global drag on canvas for safety
     app.gradient_preview_canvas.bind('<ButtonRelease-1>', lambda e: _on_gradient_stop_release(app, e)) # Global release
     app.gradient_preview_canvas.bind('<Double-Button-1>', lambda e: _on_gradient_canvas_double_click(app, e)) # Double-click to add stop
+    app.gradient_preview_canvas.bind('<Shift-Button-1>', lambda e: _on_gradient_center_click(app, e)) # Shift-click to move radial center
 
     # HEX Codes Row (will be populated dynamically)
     app.gradient_hex_frame = tk.Frame(section, bg=PRIMARY_BG)
@@ -780,6 +815,14 @@ def _build_gradient_generator_section(app, parent):
     export_btn.pack(side='left', padx=(0, 10))
     app._button_hover_colors[export_btn] = {'original': SECONDARY_BG, 'hover': HOVER_ACCENT_BLUE}
 
+    # Cancels the running background export (enabled while one runs)
+    app.export_cancel_btn = tk.Button(btns_frame, text="Cancel", command=lambda: _cancel_export(app),
+                        font=(FONT_FAMILY, 10), state='disabled',
+                        bg=SECONDARY_BG, fg=INPUT_FG, relief='flat', padx=10, pady=4, cursor='hand2', bd=0,
+                        activebackground=HOVER_ACCENT_BLUE, activeforeground=INPUT_FG)
+    app.export_cancel_btn.pack(side='left', padx=(0, 10))
+    app._button_hover_colors[app.export_cancel_btn] = {'original': SECONDARY_BG, 'hover': HOVER_ACCENT_BLUE}
+
     # Export Size settings
     size_frame = tk.Frame(btns_frame, bg=PRIMARY_BG)
     size_frame.pack(side='left', padx=(0, 0))
@@ -789,6 +832,9 @@ def _build_gradient_generator_section(app, parent):
     tk.Label(size_frame, text="×", font=(FONT_FAMILY, 9), bg=PRIMARY_BG).pack(side='left')
     height_entry = tk.Entry(size_frame, textvariable=app.export_height_var, font=(FONT_FAMILY, 9), width=4)
     height_entry.pack(side='left', padx=(0, 2))
+    tk.Label(size_frame, text="Workers:", font=(FONT_FAMILY, 9), bg=PRIMARY_BG).pack(side='left', padx=(6, 0))
+    workers_entry = tk.Entry(size_frame, textvariable=app.export_workers_var, font=(FONT_FAMILY, 9), width=4)
+    workers_entry.pack(side='left', padx=(2, 0))
 
     _generate_gradient_random(app) # Generate an initial random gradient on load
 
@@ -798,187 +844,145 @@ def _generate_gradient_random(app):
     Generates a random gradient based on the selected style and number of colors.
     Attempts to prevent immediate repetition of the previous gradient.
     """
-    import random
-    import colorsys
-    import time
-
     style = app.gradient_style_var.get()
     n = app.gradient_num_colors_var.get()
-    palette = GRADIENT_STYLES.get(style, list(GRADIENT_STYLES.values())[0])
-
-    # Enhanced random seeding for better variance
-    random.seed(time.time_ns() + random.randint(0, 10_000_000))
-
-    # Prevent immediate repetition
-    if not hasattr(app, '_last_gradient_signature'):
-        app._last_gradient_signature = None
-
-    max_attempts = 15 # Max attempts to find a non-repetitive gradient
-    for attempt in range(max_attempts):
-        colors = []
-        if style in ['Analogous', 'Complementary', 'Triadic', 'Tetradic']:
-            # Harmony-based generation
-            base_hex = random.choice(palette)
-            h, s, v = colorsys.rgb_to_hsv(*[x/255.0 for x in helpers.hex_to_rgb(base_hex)])
-
-            if style == 'Analogous':
-                angle_range = random.uniform(30, 90) # Variable angle range for analogy
-                start_offset = random.uniform(-angle_range/2, angle_range/2)
-                for i in range(n):
-                    angle = start_offset + (i * angle_range / max(n-1, 1))
-                    new_h = (h + angle/360) % 1.0
-                    new_s = min(max(s + random.uniform(-0.15, 0.15), 0.3), 1.0)
-                    new_v = min(max(v + random.uniform(-0.2, 0.2), 0.4), 1.0)
-                    colors.append(helpers.hsv_to_hex(new_h, new_s, new_v))
-
-            elif style == 'Complementary':
-                comp_h = (h + 0.5) % 1.0
-                for i in range(n):
-                    current_h = h if i % 2 == 0 else comp_h
-                    new_h = (current_h + random.uniform(-15, 15)/360) % 1.0
-                    new_s = min(max(s + random.uniform(-0.2, 0.2), 0.4), 1.0)
-                    new_v = min(max(v + random.uniform(-0.25, 0.25), 0.3), 1.0)
-                    colors.append(helpers.hsv_to_hex(new_h, new_s, new_v))
-
-            elif style == 'Triadic':
-                triad_hues = [(h + i * 120/360) % 1.0 for i in range(3)]
-                for i in range(n):
-                    base_h = triad_hues[i % 3]
-                    new_h = (base_h + random.uniform(-10, 10)/360) % 1.0
-                    new_s = min(max(s + random.uniform(-0.18, 0.18), 0.35), 1.0)
-                    new_v = min(max(v + random.uniform(-0.22, 0.22), 0.35), 1.0)
-                    colors.append(helpers.hsv_to_hex(new_h, new_s, new_v))
-
-            elif style == 'Tetradic':
-                tetrad_hues = [(h + i * 90/360) % 1.0 for i in range(4)]
-                for i in range(n):
-                    base_h = tetrad_hues[i % 4]
-                    new_h = (base_h + random.uniform(-8, 8)/360) % 1.0
-                    new_s = min(max(s + random.uniform(-0.15, 0.15), 0.4), 1.0)
-                    new_v = min(max(v + random.uniform(-0.2, 0.2), 0.4), 1.0)
-                    colors.append(helpers.hsv_to_hex(new_h, new_s, new_v))
-        else:
-            # Theme-based generation (e.g., Warm, Cool, Vibrant)
-            if len(palette) >= n:
-                if n == 2: # For 2 colors, pick distinct ones
-                    colors = random.sample(palette, 2)
-                elif n <= len(palette) // 2: # For small n, ensure spacing
-                    step = len(palette) // n
-                    start = random.randint(0, step-1)
-                    colors = [palette[(start + i*step) % len(palette)] for i in range(n)]
-                else: # General random selection
-                    colors = random.sample(palette, n)
-            else:
-                # Interpolate if more colors are needed than in the palette
-                for i in range(n):
-                    base_color = palette[i % len(palette)]
-                    h_base, s_base, v_base = colorsys.rgb_to_hsv(*[x/255.0 for x in helpers.hex_to_rgb(base_color)])
-
-                    # Add controlled variation based on style
-                    if style == 'Vibrant':
-                        new_h = (h_base + random.uniform(-30, 30)/360) % 1.0
-                        new_s = min(max(s_base + random.uniform(-0.1, 0.1), 0.7), 1.0)
-                        new_v = min(max(v_base + random.uniform(-0.15, 0.15), 0.6), 1.0)
-                    elif style == 'Pastel':
-                        new_h = (h_base + random.uniform(-20, 20)/360) % 1.0
-                        new_s = min(max(s_base + random.uniform(-0.15, 0.05), 0.2), 0.6)
-                        new_v = min(max(v_base + random.uniform(-0.05, 0.1), 0.8), 1.0)
-                    elif style == 'Muted':
-                        new_h = (h_base + random.uniform(-25, 25)/360) % 1.0
-                        new_s = min(max(s_base + random.uniform(-0.1, 0.1), 0.1), 0.5)
-                        new_v = min(max(v_base + random.uniform(-0.1, 0.1), 0.4), 0.8)
-                    else:
-                        new_h = (h_base + random.uniform(-20, 20)/360) % 1.0
-                        new_s = min(max(s_base + random.uniform(-0.12, 0.12), 0.3), 1.0)
-                        new_v = min(max(v_base + random.uniform(-0.15, 0.15), 0.4), 1.0)
-
-                    colors.append(helpers.hsv_to_hex(new_h, new_s, new_v))
-
-            if random.random() < 0.3: # Occasionally shuffle for more variety
-                random.shuffle(colors)
-
-        signature = tuple(colors)
-        if signature != app._last_gradient_signature:
-            break # Found a new unique gradient
+
+    # Prevent immediate repetition of the previous gradient
+    colors = palettes_core.random_gradient_colors(style, n, avoid=app._last_gradient_signature)
 
     app._last_gradient_signature = tuple(colors)
     app._gradient_colors = colors
     # Initialize positions evenly for new colors
-    app._gradient_positions = [i/(n-1) if n > 1 else 0.5 for i in range(n)]
+    app._gradient_positions = colors_core.even_positions(n)
     _draw_gradient_preview(app)
     _draw_gradient_hexes(app)
 
-def _draw_gradient_preview(app):
+def _draw_gradient_preview(app, interactive=False):
     """
     Draws the gradient on the preview canvas based on current colors, type, and rotation.
+
+    Args:
+        app: The main application instance.
+        interactive (bool): True while the user is still changing the gradient
+            (dragging, turning the dial, resizing). The background is then drawn
+            at a reduced level of detail and refined once interaction settles.
+    """
+    _paint_gradient_background(app, interactive)
+    _sync_gradient_center_marker(app)
+    _sync_gradient_stops(app)
+
+def _paint_gradient_background(app, interactive=False):
+    """
+    Brings the gradient background layer up to date and blits the changed region.
+
+    The frame is rendered off-canvas by app._gradient_raster, which only
+    re-samples pixels affected by what changed since the last paint, and is
+    shown through a single canvas image item that is updated in place.
+    Interactive paints use PREVIEW_INTERACTIVE_LOD and schedule a full-resolution
+    pass after PREVIEW_IDLE_MS; the level currently on screen is
+    app._gradient_raster.lod.
     """
+    if app._gradient_repaint_job is not None:
+        app.root.after_cancel(app._gradient_repaint_job)
+        app._gradient_repaint_job = None
+    if app._gradient_refine_job is not None:
+        app.root.after_cancel(app._gradient_refine_job)
+        app._gradient_refine_job = None
+
     c = app.gradient_preview_canvas
-    c.delete('all')
     w = int(c['width'])
     h = int(c['height'])
 
-    if app.gradient_type_var.get() == 'Radial':
-        # Radial gradient using concentric rectangles for performance
-        cx, cy = w / 2, h / 2
-        max_radius = min(w, h) // 2
-        steps = 50 # Number of concentric steps
-
-        for i in range(steps, 0, -1): # Draw from outside in
-            frac = i / steps
-            color = _interpolate_gradient(app, frac)
-            radius = (frac * max_radius * 1.5) # Slightly larger to cover edges
-            x1, y1 = max(0, cx - radius), max(0, cy - radius)
-            x2, y2 = min(w, cx + radius), min(h, cy + radius)
-            c.create_rectangle(x1, y1, x2, y2, fill=color, outline=color)
-    else: # Linear gradient
-        angle = app.gradient_rotation_var.get()
-        theta = math.radians(angle)
-        cos_theta = math.cos(theta)
-        sin_theta = math.sin(theta)
-
-        strips = min(h, 60) # Number of horizontal strips to draw for linear gradient
-        strip_height = h / strips
+    lod = PREVIEW_INTERACTIVE_LOD if interactive else 1
+    raster = app._gradient_raster
+    dirty = raster.update(w, h, app.gradient_type_var.get(), app.gradient_rotation_var.get(),
+                          app._gradient_center, _gradient_radius(app, w, h), lod=lod)
+    if interactive:
+        app._gradient_refine_job = app.root.after(PREVIEW_IDLE_MS, lambda: _paint_gradient_background(app))
+    if dirty is None:
+        return # Nothing changed since the last paint
+
+    photo = app._gradient_preview_photo
+    if photo is None:
+        app._gradient_preview_photo = photo = tk.PhotoImage(master=c, width=w, height=h)
+        c.create_image(0, 0, image=photo, anchor='nw', tags=('gradient',))
+        c.tag_lower('gradient')
+
+    if raster.lod > 1:
+        # Send only the block-resolution frame and let Tk zoom it into place
+        if app._gradient_lod_photo is None:
+            app._gradient_lod_photo = tk.PhotoImage(master=c)
+        app._gradient_lod_photo.configure(data=gradient.encode_ppm(raster.pixels), format='PPM')
+        photo.configure(width=w, height=h)
+        photo.tk.call(photo.name, 'copy', app._gradient_lod_photo.name,
+                      '-zoom', raster.lod, raster.lod, '-to', 0, 0, w, h)
+    elif dirty == (0, 0, w, h):
+        photo.configure(width=0, height=0) # Let the new frame set the size
+        photo.configure(data=gradient.encode_ppm(raster.pixels), format='PPM')
+    else:
+        # Only send the changed rectangle to Tk
+        x0, y0, x1, y1 = dirty
+        photo.tk.call(photo.name, 'put', gradient.encode_ppm(raster.pixels[y0:y1, x0:x1]),
+                      '-format', 'PPM', '-to', x0, y0)
 
-        for i in range(strips):
-            y = i * strip_height
-            row_colors = []
+def _schedule_gradient_repaint(app, interactive=False):
+    """
+    Requests a background repaint on the next display frame. Any number of
+    requests before that frame collapse into a single repaint.
+    """
+    if app._gradient_repaint_job is None:
+        app._gradient_repaint_job = app.root.after(PREVIEW_FRAME_MS, lambda: _paint_gradient_background(app, interactive))
 
-            # Sample colors across the width for this row
-            for x_coord in range(0, w, max(1, w//40)): # Sample every ~40 pixels horizontally
-                # Normalize coordinates to [-0.5, 0.5] for rotation math
-                nx = (x_coord / (w-1)) - 0.5 if w > 1 else 0
-                ny = (y / (h-1)) - 0.5 if h > 1 else 0
+def _gradient_radius(app, width, height):
+    """Returns the radial gradient radius in pixels for an image of the given size."""
+    return gradient.relative_radius(width, height, app._gradient_center, app.gradient_radius_var.get() / 100)
 
-                # Apply rotation transformation and normalize to 0-1 range
-                frac = nx * cos_theta + ny * sin_theta + 0.5
-                frac = min(max(frac, 0), 1) # Clamp fraction between 0 and 1
+def _sync_gradient_center_marker(app, marker_radius=5):
+    """
+    Shows a ring at the radial gradient center (the point Shift-click moves)
+    while the gradient is radial, and hides it otherwise.
+    """
+    c = app.gradient_preview_canvas
+    if app._gradient_center_item is None:
+        app._gradient_center_item = c.create_oval(0, 0, 0, 0, outline='#333', width=2, tags=('center_marker',))
+    if app.gradient_type_var.get() != 'Radial':
+        c.itemconfig(app._gradient_center_item, state='hidden')
+        return
 
-                color = _interpolate_gradient(app, frac)
-                row_colors.append((x_coord, color))
+    x = app._gradient_center[0] * int(c['width'])
+    y = app._gradient_center[1] * int(c['height'])
+    c.coords(app._gradient_center_item, x - marker_radius, y - marker_radius, x + marker_radius, y + marker_radius)
+    c.itemconfig(app._gradient_center_item, state='normal')
+    c.tag_raise('center_marker')
 
-            # Draw rectangles for this row
-            for j in range(len(row_colors)):
-                x_start = row_colors[j][0]
-                color = row_colors[j][1]
+def _stop_handle_coords(pos, w, h, stop_radius=7):
+    """Returns the oval bounding box of a stop handle at a fractional position."""
+    x_stop = int(round(pos * (w - 1)))
+    y_stop = h // 2 # Stops are drawn in the middle vertically
+    return (x_stop - stop_radius, y_stop - stop_radius, x_stop + stop_radius, y_stop + stop_radius)
 
-                if j < len(row_colors) - 1:
-                    x_end = row_colors[j + 1][0]
-                else:
-                    x_end = w # Last rectangle extends to canvas edge
+def _sync_gradient_stops(app):
+    """
+    Matches the persistent stop handle items to the current stops. Handles are
+    created or deleted only when the number of stops changes; otherwise they
+    are just moved and recolored.
+    """
+    c = app.gradient_preview_canvas
+    w = int(c['width'])
+    h = int(c['height'])
+    items = app._gradient_stop_items
 
-                y1_coord = int(y)
-                y2_coord = int(y + strip_height + 1) # Slight overlap to prevent gaps
-                c.create_rectangle(x_start, y1_coord, x_end, y2_coord, fill=color, outline=color)
+    while len(items) > len(app._gradient_positions):
+        c.delete(items.pop())
+    while len(items) < len(app._gradient_positions):
+        idx = len(items)
+        # Tag each oval for event handling
+        items.append(c.create_oval(0, 0, 0, 0, outline='#333', width=2, tags=(f'stop_{idx}', 'stop')))
 
-    # Draw draggable stops on top
-    stop_radius = 7
     for idx, pos in enumerate(app._gradient_positions):
-        x_stop = int(round(pos * (w - 1)))
-        y_stop = h // 2 # Stops are drawn in the middle vertically
-        # Draw the oval stop, filled with its color, and tag it for event handling
-        c.create_oval(x_stop - stop_radius, y_stop - stop_radius, x_stop + stop_radius, y_stop + stop_radius,
-                      fill=app._gradient_colors[idx], outline='#333', width=2, tags=(f'stop_{idx}', 'stop'))
-
+        c.coords(items[idx], *_stop_handle_coords(pos, w, h))
+        c.itemconfig(items[idx], fill=app._gradient_colors[idx])
+    c.tag_raise('stop')
 
 def _interpolate_gradient(app, frac):
     """
@@ -991,42 +995,27 @@ def _interpolate_gradient(app, frac):
     Returns:
         str: The interpolated HEX color code.
     """
-    stops = app._gradient_positions
-    colors = app._gradient_colors
-
-    # Handle edge cases where fraction is outside defined stops
-    if frac <= stops[0]:
-        return colors[0]
-    if frac >= stops[-1]:
-        return colors[-1]
-
-    # Find the two stops that 'frac' is between
-    for i in range(1, len(stops)):
-        if frac < stops[i]:
-            left_stop_idx, right_stop_idx = i-1, i
-            break
-    else: # Should not be reached if frac is within bounds and stops exist
-        return colors[-1]
-
-    # Calculate interpolation factor 'f' between the two bounding stops
-    f = (frac - stops[left_stop_idx]) / (stops[right_stop_idx] - stops[left_stop_idx])
-
-    # Get RGB components of the two bounding colors
-    c1_rgb = helpers.hex_to_rgb(colors[left_stop_idx])
-    c2_rgb = helpers.hex_to_rgb(colors[right_stop_idx])
-
-    # Interpolate each RGB component
-    r = int(c1_rgb[0] + (c2_rgb[0] - c1_rgb[0]) * f)
-    g = int(c1_rgb[1] + (c2_rgb[1] - c1_rgb[1]) * f)
-    b = int(c1_rgb[2] + (c2_rgb[2] - c1_rgb[2]) * f)
-
-    return helpers.rgb_to_hex((r, g, b))
+    # Sampled from the model's compiled lookup table, which is only rebuilt
+    # when the stops or colors actually change.
+    return app.gradient_model.color_at(frac)
 
 def _draw_gradient_hexes(app):
     """
     Draws the HEX code labels for each gradient stop, with dynamic sizing and effects.
+
+    Rows are pooled in app._gradient_hex_rows and reconfigured in place; widgets
+    are only created or destroyed when the number of stops changes, and nothing
+    is touched when the colors and preview width are the same as last time.
     """
     frame = app.gradient_hex_frame
+    colors = [color.upper() for color in app._gradient_colors]
+    num_colors = len(colors)
+    canvas_width = int(app.gradient_preview_canvas['width']) if hasattr(app, 'gradient_preview_canvas') else 600
+
+    drawn = (tuple(colors), canvas_width)
+    if drawn == app._gradient_hex_drawn:
+        return
+    app._gradient_hex_drawn = drawn
 
     # Store frame dimensions to prevent layout changes during redraw
     # This helps in maintaining a stable UI for HEX code row
@@ -1037,14 +1026,6 @@ def _draw_gradient_hexes(app):
         frame_width = frame_height = None
         app._gradient_hex_frame_configured = True # Mark as configured after first setup
 
-    # Destroy all existing widgets in the frame before redrawing
-    for w in frame.winfo_children():
-        w.destroy()
-    app._gradient_hex_labels = [] # Reset list for hover effects
-
-    num_colors = len(app._gradient_colors)
-    canvas_width = int(app.gradient_preview_canvas['width']) if hasattr(app, 'gradient_preview_canvas') else 600
-
     # Dynamic sizing logic based on number of colors
     if num_colors <= 3:
         canvas_w, canvas_h = 112, 36
@@ -1088,94 +1069,37 @@ def _draw_gradient_hexes(app):
         preview_size = max(10, int(preview_size * scale_factor))
         spacing = max(1, int(spacing * scale_factor))
         font_size = max(7, int(font_size * scale_factor))
-
-
-    for idx, color in enumerate(app._gradient_colors):
-        # Styled border frame for each hex code
-        hex_border_frame = tk.Frame(frame, bg=PRIMARY_BG)
-        hex_border_frame.pack(side='left', padx=(0, spacing))
-
-        # Canvas for colored border around the entry
-        border_canvas = tk.Canvas(hex_border_frame, width=canvas_w, height=canvas_h, highlightthickness=0, bg=PRIMARY_BG, bd=0)
-        border_canvas.pack(side='left', padx=0, pady=0)
-
-        # Hex code entry widget
-        hex_var = tk.StringVar(value=color.upper())
-        hex_entry = tk.Entry(hex_border_frame, textvariable=hex_var, font=(FONT_FAMILY, font_size), width=12, justify='center',
-                             relief='flat', bd=0, highlightthickness=0, bg=INPUT_BG, fg=INPUT_FG, exportselection=0,
-                             selectbackground=color if helpers.is_valid_hex(color) else '#cccccc',
-                             selectforeground=INPUT_FG, cursor='hand2')
-        hex_entry.place(x=entry_x, y=entry_y, width=entry_w, height=entry_h)
-
-        # Draw border rectangle
-        border_color = color if helpers.is_valid_hex(color) else '#222'
-        border_rect = border_canvas.create_rectangle(2, 2, canvas_w-2, canvas_h-2, outline=border_color, width=2)
-
-        # Color preview square (small swatch)
-        color_preview = tk.Canvas(hex_border_frame, width=preview_size, height=preview_size, bg=color,
-                                  highlightthickness=1, highlightbackground='#333')
-        color_preview.place(x=preview_x, y=preview_y)
-        color_preview.bind('<Button-1>', partial(_edit_gradient_color, app, color_index=idx))
-
-        # Hover effects for color swatch (left-click to edit, right-click to copy)
-        def on_swatch_enter(event, swatch_widget=color_preview):
-            swatch_widget.config(highlightbackground='#b5eab5', highlightthickness=2)
-            swatch_widget.config(cursor='hand2')
-        def on_swatch_leave(event, swatch_widget=color_preview):
-            swatch_widget.config(highlightbackground='#333', highlightthickness=1)
-            swatch_widget.config(cursor='')
-        def on_swatch_click(event, current_color=color, swatch_widget=color_preview, entry_widget=hex_entry):
-            helpers.copy_to_clipboard_helper(app, current_color, f"{current_color.upper()} copied!")
-            # Flash effect
-            orig_bg = swatch_widget['highlightbackground']
-            orig_text = entry_widget.get()
-            orig_fg = entry_widget['fg']
-            orig_entry_bg = entry_widget['bg']
-            swatch_widget.config(highlightbackground='#4CAF50', highlightthickness=3)
-            entry_widget.delete(0, 'end')
-            entry_widget.insert(0, "✔ Copied!")
-            entry_widget.config(fg='#222', bg='#eaffc2')
-            def reset_swatch():
-                swatch_widget.config(highlightbackground=orig_bg, highlightthickness=1)
-                entry_widget.delete(0, 'end')
-                entry_widget.insert(0, orig_text)
-                entry_widget.config(fg=orig_fg, bg=orig_entry_bg)
-            swatch_widget.after(900, reset_swatch)
-        color_preview.bind('<Enter>', on_swatch_enter)
-        color_preview.bind('<Leave>', on_swatch_leave)
-        color_preview.bind('<Button-3>', partial(on_swatch_click, current_color=color)) # Right-click to copy
-
-        # Copy to clipboard effect and hover effect for hex entry
-        def copy_effect(event=None, entry_widget=hex_entry, current_color=color, border_canvas_widget=border_canvas, border_rect_id=border_rect):
-            helpers.copy_to_clipboard_helper(app, current_color, f"{current_color.upper()} copied!")
-            orig_bg = entry_widget['bg']
-            orig_fg = entry_widget['fg']
-            orig_text = entry_widget.get()
-            entry_widget.config(bg='#eaffc2', fg='#222')
-            entry_widget.delete(0, 'end')
-            entry_widget.insert(0, "✔ Copied!")
-            border_canvas_widget.itemconfig(border_rect_id, outline='#4CAF50') # Change border color
-            def reset():
-                entry_widget.delete(0, 'end')
-                entry_widget.insert(0, orig_text)
-                entry_widget.config(bg=orig_bg, fg=orig_fg)
-                border_canvas_widget.itemconfig(border_rect_id, outline=border_color) # Revert border
-            entry_widget.after(900, reset)
-        hex_entry.bind('<Button-1>', copy_effect) # Left-click to copy
-
-        # Hover effect for hex entry
-        def on_enter_hex(event, entry_widget=hex_entry, border_canvas_widget=border_canvas, border_rect_id=border_rect):
-            entry_widget.config(bg="#eaffcc")
-            border_canvas_widget.itemconfig(border_rect_id, outline="#b5eab5")
-        def on_leave_hex(event, entry_widget=hex_entry, border_canvas_widget=border_canvas, border_rect_id=border_rect):
-            entry_widget.config(bg=INPUT_BG)
-            border_canvas_widget.itemconfig(border_rect_id, outline=border_color)
-        hex_entry.bind('<Enter>', on_enter_hex)
-        hex_entry.bind('<Leave>', on_leave_hex)
-
-        _create_tooltip(color_preview, f"Left-click to edit • Right-click to copy {color.upper()}")
-        _create_tooltip(hex_entry, f"Click to copy {color.upper()}")
-        app._gradient_hex_labels.append(hex_entry) # Store for potential future use (e.g., refreshing effects)
+    layout = (canvas_w, canvas_h, entry_w, entry_h, entry_x, entry_y, preview_size, preview_x, preview_y, font_size, spacing)
+
+    # Grow or shrink the pool; rows are packed left to right, so the last ones go first
+    rows = app._gradient_hex_rows
+    while len(rows) < num_colors:
+        rows.append(_create_gradient_hex_row(app, frame, len(rows)))
+    while len(rows) > num_colors:
+        rows.pop()['frame'].destroy()
+
+    for row, color in zip(rows, colors):
+        if row['color'] == color and row['layout'] == layout:
+            continue
+        if row['layout'] != layout:
+            row['frame'].pack_configure(padx=(0, spacing))
+            row['border_canvas'].config(width=canvas_w, height=canvas_h)
+            row['border_canvas'].coords(row['border_rect'], 2, 2, canvas_w-2, canvas_h-2)
+            row['entry'].config(font=(FONT_FAMILY, font_size))
+            row['entry'].place_configure(x=entry_x, y=entry_y, width=entry_w, height=entry_h)
+            row['preview'].config(width=preview_size, height=preview_size)
+            row['preview'].place_configure(x=preview_x, y=preview_y)
+            row['layout'] = layout
+        row['color'] = color
+        valid = helpers.is_valid_hex(color)
+        row['border_color'] = color if valid else '#222'
+        row['border_canvas'].itemconfig(row['border_rect'], outline=row['border_color'])
+        row['entry'].config(selectbackground=color if valid else '#cccccc')
+        row['preview'].config(bg=color)
+        if not row['copy_pending']:
+            row['var'].set(color)
+
+    app._gradient_hex_labels = [row['entry'] for row in rows] # Store for potential future use (e.g., refreshing effects)
 
     # Maintain frame dimensions if they were previously set
     if frame_width and frame_height:
@@ -1183,6 +1107,97 @@ def _draw_gradient_hexes(app):
         if frame.winfo_reqwidth() != frame_width or frame.winfo_reqheight() != frame_height:
             frame.config(width=frame_width, height=frame_height)
 
+def _create_gradient_hex_row(app, frame, idx):
+    """
+    Creates the pooled widgets for the HEX code row of one gradient stop.
+
+    The handlers look up the row's current color when they fire, so
+    _draw_gradient_hexes() can recolor and resize the row in place.
+
+    Args:
+        app: The main application instance.
+        frame (tk.Frame): The HEX code row frame.
+        idx (int): Index of the gradient stop the row shows.
+
+    Returns:
+        dict: The row's widgets and the color/layout it currently shows.
+    """
+    # Styled border frame for each hex code
+    hex_border_frame = tk.Frame(frame, bg=PRIMARY_BG)
+    hex_border_frame.pack(side='left')
+
+    # Canvas for colored border around the entry
+    border_canvas = tk.Canvas(hex_border_frame, highlightthickness=0, bg=PRIMARY_BG, bd=0)
+    border_canvas.pack(side='left', padx=0, pady=0)
+    border_rect = border_canvas.create_rectangle(0, 0, 0, 0, width=2)
+
+    # Hex code entry widget
+    hex_var = tk.StringVar()
+    hex_entry = tk.Entry(hex_border_frame, textvariable=hex_var, width=12, justify='center',
+                         relief='flat', bd=0, highlightthickness=0, bg=INPUT_BG, fg=INPUT_FG, exportselection=0,
+                         selectforeground=INPUT_FG, cursor='hand2')
+    hex_entry.place(x=0, y=0)
+
+    # Color preview square (small swatch)
+    color_preview = tk.Canvas(hex_border_frame, highlightthickness=1, highlightbackground='#333')
+    color_preview.place(x=0, y=0)
+
+    row = {'frame': hex_border_frame, 'border_canvas': border_canvas, 'border_rect': border_rect,
+           'entry': hex_entry, 'var': hex_var, 'preview': color_preview,
+           'color': None, 'border_color': '#222', 'layout': None, 'copy_pending': False}
+
+    def flash_copied():
+        helpers.copy_to_clipboard_helper(app, row['color'], f"{row['color']} copied!")
+        row['copy_pending'] = True
+        hex_var.set("✔ Copied!")
+        hex_entry.config(fg='#222', bg='#eaffc2')
+    def reset_copied():
+        row['copy_pending'] = False
+        hex_var.set(row['color']) # The stop may have been recolored meanwhile
+        hex_entry.config(fg=INPUT_FG, bg=INPUT_BG)
+
+    # Tooltips first: they bind <Enter>/<Leave>, the hover effects below are added on top
+    _create_tooltip(color_preview, lambda: f"Left-click to edit • Right-click to copy {row['color']}")
+    _create_tooltip(hex_entry, lambda: f"Click to copy {row['color']}")
+
+    # Hover effects for color swatch (left-click to edit, right-click to copy)
+    def on_swatch_enter(event):
+        color_preview.config(highlightbackground='#b5eab5', highlightthickness=2, cursor='hand2')
+    def on_swatch_leave(event):
+        color_preview.config(highlightbackground='#333', highlightthickness=1, cursor='')
+    def on_swatch_click(event):
+        flash_copied()
+        color_preview.config(highlightbackground='#4CAF50', highlightthickness=3)
+        def reset_swatch():
+            color_preview.config(highlightbackground='#333', highlightthickness=1)
+            reset_copied()
+        color_preview.after(900, reset_swatch)
+    color_preview.bind('<Enter>', on_swatch_enter, add='+')
+    color_preview.bind('<Leave>', on_swatch_leave, add='+')
+    color_preview.bind('<Button-1>', lambda e: _edit_gradient_color(app, color_index=idx))
+    color_preview.bind('<Button-3>', on_swatch_click) # Right-click to copy
+
+    # Copy to clipboard effect and hover effect for hex entry
+    def copy_effect(event=None):
+        flash_copied()
+        border_canvas.itemconfig(border_rect, outline='#4CAF50') # Change border color
+        def reset():
+            reset_copied()
+            border_canvas.itemconfig(border_rect, outline=row['border_color']) # Revert border
+        hex_entry.after(900, reset)
+    hex_entry.bind('<Button-1>', copy_effect) # Left-click to copy
+
+    # Hover effect for hex entry
+    def on_enter_hex(event):
+        hex_entry.config(bg="#eaffcc")
+        border_canvas.itemconfig(border_rect, outline="#b5eab5")
+    def on_leave_hex(event):
+        hex_entry.config(bg=INPUT_BG)
+        border_canvas.itemconfig(border_rect, outline=row['border_color'])
+    hex_entry.bind('<Enter>', on_enter_hex, add='+')
+    hex_entry.bind('<Leave>', on_leave_hex, add='+')
+    return row
+
 def _edit_gradient_color(app, color_index):
     """
     Opens a minimalist color picker for editing a specific gradient color stop.
@@ -1217,32 +1232,13 @@ def _edit_gradient_color(app, color_index):
         hue_var = tk.DoubleVar(value=h*360)
         hex_var = tk.StringVar(value=initial_hex.upper())
 
-        area_size = 180
+        area_size = PICKER_AREA_SIZE
         left_margin = 20
-        gradient_img = None
-        gradient_tk = None
 
         color_area = tk.Label(picker, bd=2, relief='ridge', bg=PRIMARY_BG)
         color_area.place(x=left_margin, y=40, width=area_size, height=area_size)
 
-        def make_gradient(hue_val):
-            img = Image.new('RGB', (area_size, area_size))
-            pixels = img.load()
-            for y_coord in range(area_size):
-                for x_coord in range(area_size):
-                    saturation = x_coord / (area_size-1)
-                    value = 1 - (y_coord / (area_size-1))
-                    r_val, g_val, b_val = colorsys.hsv_to_rgb(hue_val, saturation, value)
-                    pixels[x_coord, y_coord] = (int(r_val*255), int(g_val*255), int(b_val*255))
-            return img
-
-        def update_gradient(*_):
-            nonlocal gradient_img, gradient_tk
-            hue = hue_var.get() / 360
-            gradient_img = make_gradient(hue)
-            gradient_tk = ImageTk.PhotoImage(gradient_img)
-            color_area.config(image=gradient_tk)
-        update_gradient()
+        update_gradient = _attach_sv_area(app, color_area, hue_var, area_size)
 
         def area_pick(event):
             x_click, y_click = event.x, event.y
@@ -1326,7 +1322,8 @@ def _create_tooltip(widget, text):
 
     Args:
         widget: The Tkinter widget to attach the tooltip to.
-        text (str): The text to display in the tooltip.
+        text (str or callable): The text to display in the tooltip, or a
+            function returning it when the tooltip is shown.
     """
     def on_enter(event):
         tooltip = Toplevel(widget) # Use widget as master for proper parenting
@@ -1334,7 +1331,7 @@ def _create_tooltip(widget, text):
         # Position tooltip slightly below and to the right of the mouse cursor
         tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
 
-        label = tk.Label(tooltip, text=text, font=(FONT_FAMILY, 9),
+        label = tk.Label(tooltip, text=text() if callable(text) else text, font=(FONT_FAMILY, 9),
                        bg='#ffffe0', fg='#000000', relief='solid', bd=1)
         label.pack()
 
@@ -1398,8 +1395,9 @@ def _on_gradient_stop_drag(app, event):
 
     app._gradient_positions[idx] = new_pos # Update the stop's position
 
-    # During drag, only redraw the canvas preview for smoother interaction
-    _draw_gradient_preview(app)
+    # Move the handle right away; the background catches up on the next frame
+    c.coords(app._gradient_stop_items[idx], *_stop_handle_coords(new_pos, w, int(c['height'])))
+    _schedule_gradient_repaint(app, interactive=True)
 
 def _on_gradient_stop_release(app, event):
     """
@@ -1511,6 +1509,26 @@ def _on_gradient_canvas_double_click(app, event):
     _draw_gradient_hexes(app) # Redraw HEX codes
     app.update_status(f"Added new color stop: {new_color}!", SUCCESS_GREEN)
 
+def _on_gradient_center_click(app, event):
+    """
+    Handles Shift-click on the gradient canvas to move the center of a radial gradient.
+    """
+    if app.gradient_type_var.get() != 'Radial':
+        return
+
+    c = app.gradient_preview_canvas
+    w = int(c['width'])
+    h = int(c['height'])
+
+    # Store the center as fractions so it scales with the export size
+    cx = min(max(event.x / w, 0.0), 1.0)
+    cy = min(max(event.y / h, 0.0), 1.0)
+    app._gradient_center = (cx, cy)
+
+    _draw_gradient_preview(app)
+    app.update_status(f"Radial center moved to {cx*100:.0f}%, {cy*100:.0f}%", SUCCESS_GREEN)
+    return "break" # Don't start a stop drag
+
 def _copy_all_gradient_hex(app):
     """Copies all gradient HEX codes to the clipboard, separated by spaces."""
     hexes = ' '.join(app._gradient_colors)
@@ -1533,22 +1551,34 @@ def _export_gradient(app, format_type):
         app.update_status("Invalid export dimensions! Please enter positive numbers.", WARNING_RED)
         return
 
+    workers_text = app.export_workers_var.get().strip()
+    try:
+        workers = None if workers_text.lower() in ('', 'auto') else int(workers_text)
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers must be positive.")
+    except ValueError:
+        app.update_status("Invalid worker count! Enter a positive number or 'Auto'.", WARNING_RED)
+        return
+
     if format_type == "CSS Code":
         _export_css_gradient(app)
     elif format_type == "SVG":
         _export_svg_gradient(app, width, height)
     else: # PNG or JPEG
-        _export_image_gradient(app, format_type, width, height)
+        _export_image_gradient(app, format_type, width, height, workers)
 
 
 def _export_css_gradient(app):
     """Generates and displays CSS code for the current gradient."""
     gradient_type = app.gradient_type_var.get().lower()
+    # A CSS circle can't be sized in percent, so the radius is applied to the
+    # stops instead: they are placed along the default farthest-corner ray.
+    scale = app.gradient_radius_var.get() / 100 if gradient_type == "radial" else 1
 
     color_stops_css = []
     # Create CSS color stops (e.g., "#RRGGBB 0%")
     for i, color in enumerate(app._gradient_colors):
-        pos = app._gradient_positions[i] * 100
+        pos = app._gradient_positions[i] * 100 * scale
         color_stops_css.append(f"{color} {pos:.1f}%")
 
     css_code = ""
@@ -1557,7 +1587,8 @@ def _export_css_gradient(app):
         angle = app.gradient_rotation_var.get()
         css_code = f"background: linear-gradient({angle}deg, {', '.join(color_stops_css)});"
     else: # Radial gradient
-        css_code = f"background: radial-gradient(circle, {', '.join(color_stops_css)});"
+        cx, cy = app._gradient_center
+        css_code = f"background: radial-gradient(circle at {cx*100:.1f}% {cy*100:.1f}%, {', '.join(color_stops_css)});"
 
     # Show CSS code in a popup window
     css_window = tk.Toplevel(app.root)
@@ -1631,8 +1662,11 @@ def _export_svg_gradient(app, width, height):
         svg_content += f'''
     <linearGradient id="gradient" x1="0%" y1="0%" x2="100%" y2="0%">''' # Default horizontal for simplicity
     else: # Radial
+        # Same extent as the preview and the PNG/JPEG export
+        cx, cy = app._gradient_center
+        radius = _gradient_radius(app, width, height)
         svg_content += f'''
-    <radialGradient id="gradient" cx="50%" cy="50%" r="50%">'''
+    <radialGradient id="gradient" gradientUnits="userSpaceOnUse" cx="{cx*width:.2f}" cy="{cy*height:.2f}" r="{radius:.2f}">'''
 
     # Add color stops to SVG
     for i, color in enumerate(app._gradient_colors):
@@ -1652,18 +1686,36 @@ def _export_svg_gradient(app, width, height):
   <rect width="{width}" height="{height}" fill="url(#gradient)"/>
 </svg>'''
 
-    try:
+    _queue_export(app, os.path.basename(file), _svg_export_job, file, svg_content)
+
+def _svg_export_job(job, file, svg_content):
+    """Export queue job: writes the SVG document."""
+    job.report(0, 1, stage="Writing")
+    with _discard_on_failure(file):
         with open(file, 'w', encoding='utf-8') as f:
             f.write(svg_content)
-        app.update_status("SVG gradient exported successfully!", SUCCESS_GREEN)
-    except Exception as e:
-        app.update_status(f"Failed to export SVG: {str(e)}", WARNING_RED)
+    return "SVG gradient exported successfully!"
 
-def _export_image_gradient(app, format_type, width, height):
+def _export_image_gradient(app, format_type, width, height, workers=None):
     """
     Exports the current gradient as a raster image (PNG or JPEG).
+
+    The file is chosen here and the job is put on the export queue, so the
+    window stays responsive while it renders. PNGs are streamed to disk band
+    by band (see core.gradient.save_png), so their size is only limited by
+    disk space. JPEGs are rendered in memory and encoded with Pillow. Images
+    of PARALLEL_EXPORT_MIN_PIXELS or more are rendered by a pool of worker
+    processes, and the status bar reports the rendering throughput in
+    megapixels per second.
+
+    Args:
+        app: The main application instance.
+        format_type (str): "PNG" or "JPEG".
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        workers (int, optional): Number of worker processes (None = one per CPU core).
     """
-    if Image is None or ImageDraw is None:
+    if format_type != "PNG" and (Image is None or ImageDraw is None):
         tk.messagebox.showerror("Missing Dependency",
                             "Pillow (PIL) is required to export images. Please install it with: pip install Pillow")
         return
@@ -1677,70 +1729,156 @@ def _export_image_gradient(app, format_type, width, height):
     if not file:
         return
 
-    # Create a new blank image
-    img = Image.new('RGB', (width, height), color='white')
-    draw = ImageDraw.Draw(img)
+    workers = resolve_workers(workers) if width * height >= PARALLEL_EXPORT_MIN_PIXELS else 1
+    # The job renders a snapshot, so editing the gradient meanwhile doesn't affect it
+    geometry = (app.gradient_type_var.get(), app.gradient_rotation_var.get(),
+                app._gradient_center, _gradient_radius(app, width, height))
+    job_func = _png_export_job if format_type == "PNG" else _jpeg_export_job
+    _queue_export(app, os.path.basename(file), job_func, app.gradient_model.snapshot(), file,
+                  width, height, geometry, workers)
 
-    gradient_type = app.gradient_type_var.get().lower()
-
-    if gradient_type == "radial":
-        center_x, center_y = width // 2, height // 2
-        # Calculate max radius to cover corners of the image
-        max_radius = ((width/2)**2 + (height/2)**2)**0.5
-
-        # Draw concentric circles from outside to inside for smoother gradient
-        num_rings = min(max(width, height), 500) # Adaptive quality
-        ring_step = max_radius / num_rings if num_rings > 0 else 1
-
-        for ring_idx in range(num_rings, 0, -1): # Iterate from outer ring inwards
-            radius = ring_idx * ring_step
-            # Fraction from center (0) to max radius (1)
-            frac = min(radius / max_radius, 1.0)
-            color_hex = _interpolate_gradient(app, frac)
-            color_rgb = helpers.hex_to_rgb(color_hex) # Convert hex to RGB tuple
-
-            # Draw filled circle (ellipse with equal width/height)
-            bbox = [center_x - radius, center_y - radius,
-                   center_x + radius, center_y + radius]
-            draw.ellipse(bbox, fill=color_rgb, outline=color_rgb) # Outline same as fill to avoid borders
-    else: # Linear gradient
-        angle = app.gradient_rotation_var.get()
-        theta = math.radians(angle)
-        cos_theta = math.cos(theta)
-        sin_theta = math.sin(theta)
+def _png_export_job(job, model, file, width, height, geometry, workers):
+    """
+    Export queue job: renders the gradient into a PNG file one band of rows at a time.
 
-        # Iterate over each pixel (or small strip) to calculate color
-        for x_coord in range(width):
-            for y_coord in range(height):
-                # Normalize coordinates to [-0.5, 0.5] range
-                nx = (x_coord / (width-1)) - 0.5 if width > 1 else 0
-                ny = (y_coord / (height-1)) - 0.5 if height > 1 else 0
+    Memory use stays bounded by the band size whatever the output size. The
+    result reports throughput (including compression) in megapixels per
+    second and the extra memory this export needed at its peak, worker
+    processes included (where the platform lets us measure it).
+    """
+    start = time.perf_counter()
+    with PeakMemoryMonitor() as memory, _discard_on_failure(file):
+        gradient.save_png(model, file, width, height, *geometry,
+                          progress=lambda rows, total: job.report(rows, total, stage="Exporting"), workers=workers)
+    megapixels_per_second = width * height / 1e6 / max(time.perf_counter() - start, 1e-9)
+
+    peak = memory.peak_bytes
+    peak_text = f", peak extra memory {peak / (1024 * 1024):.0f} MB" if peak is not None else ""
+    return (f"PNG gradient exported successfully! {width}x{height} at "
+            f"{megapixels_per_second:.1f} MP/s on {workers} worker(s){peak_text}")
+
+def _jpeg_export_job(job, model, file, width, height, geometry, workers):
+    """Export queue job: renders the gradient band by band into one array and saves it as a JPEG."""
+    start = time.perf_counter()
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    for y0, band in gradient.iter_export_bands(model, width, height, *geometry, workers=workers):
+        pixels[y0:y0 + len(band)] = band
+        job.report(y0 + len(band), height, stage="Rendering")
+    megapixels_per_second = width * height / 1e6 / max(time.perf_counter() - start, 1e-9)
+
+    job.stage = "Encoding"
+    img = Image.frombuffer('RGB', (width, height), pixels, 'raw', 'RGB', 0, 1)
+    with _discard_on_failure(file):
+        img.save(file, format='JPEG', quality=95) # High quality for JPEG
+    return (f"JPEG gradient exported successfully! "
+            f"Rendered at {megapixels_per_second:.1f} MP/s on {workers} worker(s)")
+
+@contextmanager
+def _discard_on_failure(path):
+    """Deletes a partly written export if the job fails or is cancelled while writing it."""
+    try:
+        yield
+    except BaseException:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
 
-                # Apply rotation and normalize to 0-1 for interpolation
-                frac = nx * cos_theta + ny * sin_theta + 0.5
-                frac = min(max(frac, 0), 1) # Clamp fraction
+def _queue_export(app, name, func, *args):
+    """
+    Puts an export job on app.export_queue and starts reporting its progress.
 
-                color_hex = _interpolate_gradient(app, frac)
-                color_rgb = helpers.hex_to_rgb(color_hex)
-                img.putpixel((x_coord, y_coord), color_rgb) # Set pixel color
+    Args:
+        app: The main application instance.
+        name (str): What is being exported, shown in the status bar.
+        func (callable): Job function, called as func(job, *args) on the worker thread.
+            It must not touch Tk and returns the success message.
+        *args: Arguments for func.
+    """
+    queued = len(app.export_queue.pending()) + (app.export_queue.current is not None)
+    app.export_queue.submit(name, func, *args)
+    if queued:
+        app.update_status(f"Queued export of {name} ({queued} ahead).")
+    if app._export_poll_job is None:
+        app._export_poll_job = app.root.after(EXPORT_POLL_MS, _poll_exports, app)
+
+def _poll_exports(app):
+    """Reports finished exports and the running one's progress in the status bar."""
+    app._export_poll_job = None
+    queue = app.export_queue
+    for job in queue.collect_finished():
+        if job.state == JOB_DONE:
+            app.update_status(job.result, SUCCESS_GREEN)
+        elif job.state == JOB_FAILED:
+            app.update_status(f"Failed to export {job.name}: {job.error}", WARNING_RED)
+        else:
+            app.update_status(f"Export of {job.name} cancelled.", TEXT_MUTED)
+
+    current = queue.current
+    if current is not None:
+        waiting = len(queue.pending())
+        waiting_text = f" ({waiting} more queued)" if waiting else ""
+        app.update_status(f"{current.stage} {current.name}... {current.progress * 100:.0f}%{waiting_text}")
+    if hasattr(app, 'export_cancel_btn'):
+        app.export_cancel_btn.config(state='normal' if current is not None else 'disabled')
+
+    if not queue.idle():
+        app._export_poll_job = app.root.after(EXPORT_POLL_MS, _poll_exports, app)
+
+def _cancel_export(app):
+    """Cancels the running export; queued exports still run afterwards."""
+    job = app.export_queue.cancel_current()
+    if job is not None:
+        app.update_status(f"Cancelling export of {job.name}...", TEXT_MUTED)
+
+def _preset_store(app):
+    """
+    Returns the gradient preset library, opening it on first use.
 
+    If the library file can't be opened (for example a read-only home
+    directory), the session gets an in-memory library seeded with the
+    built-in presets instead; presets saved to it last until the app closes.
+    """
+    if app.preset_store is None:
+        path = os.path.join(os.path.expanduser('~'), PRESET_LIBRARY_DIR, PRESET_LIBRARY_FILE)
+        try:
+            app.preset_store = PresetStore(path)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not open preset library {path}: {e}")
+            app.preset_store = PresetStore(':memory:')
+            app.update_status("Preset library unavailable - saved presets won't be kept!", WARNING_RED)
+    return app.preset_store
+
+def _save_gradient_preset(app):
+    """
+    Saves the current gradient stops (colors and positions) to the preset library.
+    Presets the library would reject (see core.presets) are reported in the status bar.
+    """
+    if len(app._gradient_colors) < MIN_PRESET_COLORS:
+        app.update_status(f"A preset needs at least {MIN_PRESET_COLORS} colors. Add a color stop first.", WARNING_RED)
+        return
+    name = simpledialog.askstring("Save Preset", "Preset name:", parent=app.root,
+                                  initialvalue=f"My Gradient {time.strftime('%Y-%m-%d %H:%M')}")
+    if name is None: # Cancelled
+        return
     try:
-        if format_type == "PNG":
-            img.save(file, format='PNG')
-        else: # JPEG
-            img.save(file, format='JPEG', quality=95) # High quality for JPEG
-        app.update_status(f"{format_type} gradient exported successfully!", SUCCESS_GREEN)
-    except Exception as e:
-        app.update_status(f"Failed to export {format_type}: {str(e)}", WARNING_RED)
+        _preset_store(app).add(name, app._gradient_colors, app._gradient_positions, tags=(PRESET_CUSTOM_TAG,))
+    except (ValueError, sqlite3.Error) as e:
+        app.update_status(f"Could not save preset: {e}", WARNING_RED)
+    else:
+        app.update_status(f"Saved preset '{name.strip()}'!", SUCCESS_GREEN)
 
 def _show_gradient_presets(app):
     """
-    Displays a popup window with predefined gradient presets.
-    Users can select a preset to load into the gradient generator.
+    Displays a popup window with the gradient preset library.
+    Users can search it by name or tag, filter it by stop count and hue,
+    and select a preset to load into the gradient generator.
     """
+    store = _preset_store(app)
     preset_window = Toplevel(app.root)
     preset_window.title("Gradient Presets")
-    preset_window.geometry("600x500")
+    preset_window.geometry("600x540")
     preset_window.configure(bg=PRIMARY_BG)
     preset_window.transient(app.root)
     preset_window.grab_set() # Make it modal
@@ -1756,114 +1894,228 @@ def _show_gradient_presets(app):
                     font=(FONT_FAMILY, 14, 'bold'), bg=PRIMARY_BG, fg=INPUT_FG)
     title.pack(pady=10)
 
-    # Scrollable frame for presets
-    canvas = tk.Canvas(preset_window, bg=PRIMARY_BG)
-    scrollbar = ttk.Scrollbar(preset_window, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=PRIMARY_BG)
+    # Search (name prefix or tag) and filters
+    filter_frame = tk.Frame(preset_window, bg=PRIMARY_BG)
+    filter_frame.pack(fill='x', padx=10, pady=(0, 4))
+    search_var = tk.StringVar()
+    search_entry = tk.Entry(filter_frame, textvariable=search_var, font=FONT_INPUT, bg=INPUT_BG, fg=INPUT_FG,
+                            relief='flat', bd=0, insertbackground=INPUT_FG)
+    search_entry.pack(side='left', fill='x', expand=True, ipady=4, padx=(0, 8))
+    stops_var = tk.StringVar(value="Any Stops")
+    stops_box = ttk.Combobox(filter_frame, textvariable=stops_var, state='readonly', width=10,
+                             values=["Any Stops"] + [f"{n} Stops" for n in range(2, 9)])
+    stops_box.pack(side='left', padx=(0, 8))
+    hue_var = tk.StringVar(value=next(iter(PRESET_HUE_FILTERS)))
+    hue_box = ttk.Combobox(filter_frame, textvariable=hue_var, state='readonly', width=10,
+                           values=list(PRESET_HUE_FILTERS))
+    hue_box.pack(side='left')
+
+    result_label = tk.Label(preset_window, text="Search by name or tag", font=(FONT_FAMILY, 9),
+                            bg=PRIMARY_BG, fg=TEXT_MUTED)
+    result_label.pack(anchor='w', padx=10, pady=(0, 6))
+
+    # Virtualized list of presets
+    gallery_frame = tk.Frame(preset_window, bg=PRIMARY_BG)
+    gallery_frame.pack(fill='both', expand=True)
+    set_presets = _build_preset_gallery(app, gallery_frame, preset_window)
+
+    pending = {'search': None} # after() id of the debounced search
+
+    def run_search():
+        pending['search'] = None
+        stops = stops_var.get().split()[0]
+        try:
+            presets = store.search(search_var.get(), stop_count=int(stops) if stops.isdigit() else None,
+                                   hue=PRESET_HUE_FILTERS[hue_var.get()], hue_tolerance=PRESET_HUE_TOLERANCE,
+                                   limit=PRESET_SEARCH_LIMIT)
+        except sqlite3.Error as e:
+            app.update_status(f"Preset search failed: {e}", WARNING_RED)
+            presets = []
+        set_presets([(preset.name, preset.colors, preset.positions) for preset in presets])
+        if len(presets) >= PRESET_SEARCH_LIMIT:
+            result_label.config(text=f"Showing the first {PRESET_SEARCH_LIMIT} matches - refine the search to see more")
+        else:
+            result_label.config(text=f"{len(presets)} preset{'s' if len(presets) != 1 else ''}")
 
-    canvas.configure(yscrollcommand=scrollbar.set)
-    scrollable_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+    def schedule_search(*_):
+        # Search once typing pauses rather than on every keystroke
+        if pending['search'] is not None:
+            preset_window.after_cancel(pending['search'])
+        pending['search'] = preset_window.after(PRESET_SEARCH_DELAY_MS, run_search)
 
-    def _on_mousewheel(event):
-        canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-    canvas.bind_all("<MouseWheel>", _on_mousewheel) # Bind to all for global effect
+    def on_destroy(event):
+        if event.widget is preset_window and pending['search'] is not None:
+            preset_window.after_cancel(pending['search'])
 
-    canvas.pack(side="left", fill="both", expand=True)
-    scrollbar.pack(side="right", fill="y")
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    search_var.trace_add('write', schedule_search)
+    stops_box.bind('<<ComboboxSelected>>', lambda e: run_search())
+    hue_box.bind('<<ComboboxSelected>>', lambda e: run_search())
+    preset_window.bind('<Destroy>', on_destroy)
+    run_search()
+    search_entry.focus_set()
 
-    # Create preset entries (frame, preview, info, button)
-    for name, colors in GRADIENT_PRESETS.items():
-        preset_frame = tk.Frame(scrollable_frame, bg=PRIMARY_BG)
-        preset_frame.pack(fill='x', padx=10, pady=5)
+    preset_window.protocol("WM_DELETE_WINDOW", preset_window.destroy) # Ensure grab_release on close
 
-        # Gradient preview canvas
-        preview_canvas = tk.Canvas(preset_frame, width=300, height=40, bg=INPUT_BG, highlightthickness=1)
-        preview_canvas.pack(side='left', padx=(0, 10))
-        _draw_preset_gradient(preview_canvas, colors) # Draw the gradient preview
 
-        # Preset info and button
-        info_frame = tk.Frame(preset_frame, bg=PRIMARY_BG)
-        info_frame.pack(side='left', fill='both', expand=True)
+def _build_preset_gallery(app, parent, window):
+    """
+    Builds a scrollable list of gradient presets that only has widgets for the rows in view.
 
-        name_label = tk.Label(info_frame, text=name, font=(FONT_FAMILY, 11, 'bold'),
-                             bg=PRIMARY_BG, fg=INPUT_FG)
-        name_label.pack(anchor='w')
+    Rows have a fixed height, so the scroll region is sized from the number of
+    presets alone. A pool of row widgets just big enough to fill the view is
+    moved and refilled as the list scrolls: preset i always goes to pool slot
+    i % pool size, so scrolling by one row refills one row. Opening and
+    scrolling the gallery costs the same for 18 presets or for thousands.
 
-        colors_label = tk.Label(info_frame, text=' → '.join(colors),
-                               font=(FONT_FAMILY, 9), bg=PRIMARY_BG, fg=TEXT_MUTED)
-        colors_label.pack(anchor='w')
+    Args:
+        app: The main application instance.
+        parent: The frame to build the gallery in.
+        window: The preset dialog, closed when a preset is picked.
 
-        use_btn = tk.Button(info_frame, text="Use This",
-                           command=partial(_load_preset_gradient, app, colors, preset_window),
-                           bg=ACCENT_BLUE, fg=TEXT_LIGHT, font=(FONT_FAMILY, 9),
-                           relief='flat', padx=10, pady=2, cursor='hand2')
-        use_btn.pack(anchor='w', pady=(5, 0))
+    Returns:
+        callable: set_items(items), which shows a new list of (name, colors, positions)
+            presets (positions None = evenly spaced).
+    """
+    canvas = tk.Canvas(parent, bg=PRIMARY_BG, highlightthickness=0, yscrollincrement=PRESET_ROW_HEIGHT // 4)
+    scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+    state = {'items': [], 'generation': 0, 'rows': []}
+
+    def refresh():
+        items, rows = state['items'], state['rows']
+        top = max(0, int(canvas.canvasy(0)) // PRESET_ROW_HEIGHT)
+        needed = min(canvas.winfo_height() // PRESET_ROW_HEIGHT + 2, len(items))
+        if len(rows) < needed:
+            rows.extend(_create_preset_row(app, canvas, window) for _ in range(needed - len(rows)))
+            for row in rows:
+                row['shown'] = None # Slot mapping changed with the pool size
+        visible = range(top, min(top + len(rows), len(items)))
+        for index in visible:
+            row = rows[index % len(rows)]
+            if row['shown'] != (state['generation'], index):
+                _fill_preset_row(app, row, *items[index])
+                row['shown'] = (state['generation'], index)
+                canvas.coords(row['item'], 0, index * PRESET_ROW_HEIGHT)
+                canvas.itemconfigure(row['item'], state='normal')
+        if len(visible) < len(rows):
+            for index in range(len(visible), len(rows)): # Pool slots past the end of the list
+                row = rows[(top + index) % len(rows)]
+                row['shown'] = None
+                canvas.itemconfigure(row['item'], state='hidden')
+
+    def on_scroll(first, last):
+        scrollbar.set(first, last)
+        refresh()
+
+    def on_resize(event):
+        for row in state['rows']:
+            canvas.itemconfigure(row['item'], width=event.width)
+        refresh()
+
+    def scroll_units(units):
+        canvas.yview_scroll(units, "units")
+
+    canvas.configure(yscrollcommand=on_scroll)
+    canvas.bind('<Configure>', on_resize)
+    # Wheel events reach the dialog from whichever row is under the pointer
+    window.bind('<MouseWheel>', lambda e: scroll_units(int(-1*(e.delta/120))))
+    window.bind('<Button-4>', lambda e: scroll_units(-1)) # X11 wheel up
+    window.bind('<Button-5>', lambda e: scroll_units(1)) # X11 wheel down
 
-    scrollable_frame.update_idletasks()
-    canvas.configure(scrollregion=canvas.bbox("all"))
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
 
-    preset_window.protocol("WM_DELETE_WINDOW", preset_window.destroy) # Ensure grab_release on close
+    def set_items(items):
+        state['items'] = list(items)
+        state['generation'] += 1
+        canvas.configure(scrollregion=(0, 0, 0, len(state['items']) * PRESET_ROW_HEIGHT))
+        canvas.yview_moveto(0)
+        refresh()
 
+    return set_items
 
-def _draw_preset_gradient(canvas, colors):
+
+def _create_preset_row(app, canvas, window):
     """
-    Draws a simple linear gradient preview on a given canvas for presets.
+    Creates one pooled gallery row (preview, name, colors and a "Use This" button).
 
-    Args:
-        canvas: The Tkinter Canvas widget to draw on.
-        colors (list): A list of HEX color codes for the gradient.
+    Returns:
+        dict: The row's widgets, its canvas window item, and the preset it shows.
     """
-    canvas.update_idletasks()
-    w = canvas.winfo_reqwidth()
-    h = canvas.winfo_reqheight()
+    preset_frame = tk.Frame(canvas, bg=PRIMARY_BG)
+    row = {'frame': preset_frame, 'colors': [], 'positions': None, 'shown': None}
 
-    if not colors:
-        return # Nothing to draw
+    # Gradient preview (a cached thumbnail image)
+    row['preview'] = tk.Label(preset_frame, bg=INPUT_BG, bd=0, highlightthickness=1)
+    row['preview'].pack(side='left', padx=(10, 10))
 
-    # Draw simple linear gradient from left to right
-    for x in range(w):
-        if len(colors) == 1:
-            color = colors[0] # Solid color if only one
-        else:
-            frac = x / (w - 1) if w > 1 else 0 # Normalized position
-            # Interpolate between colors
-            # Find the position in the color array (e.g., if 3 colors, pos will be 0 to 2)
-            pos_in_array = frac * (len(colors) - 1)
-            idx = int(pos_in_array) # Integer part is the left color index
-
-            if idx >= len(colors) - 1: # At or beyond the last color
-                color = colors[-1]
-            else:
-                t = pos_in_array - idx # Fractional part for interpolation between idx and idx+1
-                color = _interpolate_colors(colors[idx], colors[idx + 1], t)
+    # Preset info and button
+    info_frame = tk.Frame(preset_frame, bg=PRIMARY_BG)
+    info_frame.pack(side='left', fill='both', expand=True)
 
-        canvas.create_line(x, 0, x, h, fill=color) # Draw a vertical line for each x
+    row['name'] = tk.Label(info_frame, font=(FONT_FAMILY, 11, 'bold'), bg=PRIMARY_BG, fg=INPUT_FG)
+    row['name'].pack(anchor='w')
 
+    row['colors_label'] = tk.Label(info_frame, font=(FONT_FAMILY, 9), bg=PRIMARY_BG, fg=TEXT_MUTED)
+    row['colors_label'].pack(anchor='w')
 
-def _interpolate_colors(color1, color2, t):
-    """
-    Interpolates between two HEX color codes using a factor t (0.0 to 1.0).
+    use_btn = tk.Button(info_frame, text="Use This",
+                       command=lambda: _load_preset_gradient(app, row['colors'], window, row['positions']),
+                       bg=ACCENT_BLUE, fg=TEXT_LIGHT, font=(FONT_FAMILY, 9),
+                       relief='flat', padx=10, pady=2, cursor='hand2')
+    use_btn.pack(anchor='w', pady=(5, 0))
 
-    Args:
-        color1 (str): First HEX color.
-        color2 (str): Second HEX color.
-        t (float): Interpolation factor (0.0 = color1, 1.0 = color2).
+    row['item'] = canvas.create_window(0, 0, window=preset_frame, anchor='nw', height=PRESET_ROW_HEIGHT,
+                                       width=canvas.winfo_width(), state='hidden')
+    return row
 
-    Returns:
-        str: The interpolated HEX color code.
+
+def _fill_preset_row(app, row, name, colors, positions=None):
+    """Shows a preset in a pooled gallery row."""
+    row['colors'] = list(colors)
+    row['positions'] = list(positions) if positions else None
+    row['preview'].config(image=_preset_thumbnail(app, colors, positions))
+    row['name'].config(text=name)
+    row['colors_label'].config(text=' → '.join(colors))
+
+
+def _preset_thumbnail(app, colors, positions=None):
     """
-    c1_rgb = helpers.hex_to_rgb(color1)
-    c2_rgb = helpers.hex_to_rgb(color2)
+    Returns the preview image of a preset gradient, rendering it on first use.
 
-    # Interpolate each RGB component
-    r = int(c1_rgb[0] + (c2_rgb[0] - c1_rgb[0]) * t)
-    g = int(c1_rgb[1] + (c2_rgb[1] - c1_rgb[1]) * t)
-    b = int(c1_rgb[2] + (c2_rgb[2] - c1_rgb[2]) * t)
+    Thumbnails are PhotoImages of the main window kept in an LRU cache on app
+    (app._preset_thumbnails, at most PRESET_THUMBNAIL_CACHE_ENTRIES), so they
+    outlive the preset dialog and reopening it renders nothing again.
 
-    return helpers.rgb_to_hex((r, g, b))
+    Args:
+        app: The main application instance.
+        colors (list): The preset's HEX colors, from left to right.
+        positions (list, optional): Stop positions from 0 to 1 (default: evenly spaced).
 
-def _load_preset_gradient(app, colors, window):
+    Returns:
+        tk.PhotoImage: The thumbnail.
+    """
+    stops = tuple(color.upper() for color in colors)
+    positions = tuple(positions) if positions else tuple(colors_core.even_positions(len(stops)))
+    key = (stops, positions)
+    cache = app._preset_thumbnails
+    photo = cache.get(key)
+    if photo is not None:
+        cache.move_to_end(key)
+        return photo
+
+    width, height = PRESET_THUMBNAIL_SIZE
+    model = gradient.GradientModel(stops, positions)
+    # A left-to-right gradient is the same on every row: render one, repeat it
+    row_pixels = model.render(width, 1, 'linear', 0)
+    pixels = np.broadcast_to(row_pixels, (height, width, 3))
+    photo = tk.PhotoImage(master=app.root, data=gradient.encode_ppm(pixels), format='PPM')
+    cache[key] = photo
+    while len(cache) > PRESET_THUMBNAIL_CACHE_ENTRIES:
+        cache.popitem(last=False) # Least recently shown; it is off screen
+    return photo
+
+
+def _load_preset_gradient(app, colors, window, positions=None):
     """
     Loads a selected gradient preset into the main gradient generator.
 
@@ -1871,11 +2123,12 @@ def _load_preset_gradient(app, colors, window):
         app: The main application instance.
         colors (list): A list of HEX colors for the preset.
         window: The Toplevel preset window to destroy after loading.
+        positions (list, optional): The preset's saved stop positions.
     """
     app._gradient_colors = list(colors) # Copy colors
     n = len(colors)
-    # Re-distribute positions evenly for the loaded preset
-    app._gradient_positions = [i/(n-1) if n > 1 else 0.5 for i in range(n)]
+    # Saved presets keep their stops; the others are distributed evenly
+    app._gradient_positions = list(positions) if positions else colors_core.even_positions(n)
 
     _draw_gradient_preview(app) # Redraw gradient preview
     _draw_gradient_hexes(app) # Redraw HEX code labels
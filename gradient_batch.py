@@ -0,0 +1,257 @@
+# gradient_batch.py
+"""
+Headless batch gradient renderer.
+
+Renders many gradients to image files without opening the GUI. Specs come
+from a JSON or CSV file, or from constants.GRADIENT_PRESETS, and are rendered
+in parallel by a pool of worker processes. Nothing here imports tkinter.
+
+Usage:
+    python gradient_batch.py specs.json -o out/
+    python gradient_batch.py specs.csv -o out/ --workers 8
+    python gradient_batch.py --presets -o out/ --width 1920 --height 1080 --type radial
+
+JSON input is a list of objects (or {"gradients": [...]}); CSV input has a
+header row. Recognized fields:
+    name       Output file name without extension (defaults to gradient-00001, ...)
+    colors     '#RRGGBB' colors; a JSON list, or space/semicolon separated in CSV
+    positions  Stop positions from 0 to 1 (defaults to evenly spaced)
+    type       'linear' or 'radial' (default: linear)
+    angle      Direction in degrees for linear gradients (default: 0)
+    center     Center of radial gradients as x and y fractions of width and
+               height; a JSON list, or space/semicolon separated in CSV (default: 0.5 0.5)
+    radius     Radius of radial gradients as a fraction of the distance from the
+               center to the farthest corner (default: 1, the last stop is
+               reached at that corner)
+    width      Image width in pixels (default: 800)
+    height     Image height in pixels (default: 400)
+    format     'png' or 'jpeg' (default: png)
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from constants import GRADIENT_PRESETS
+from core.colors import is_valid_hex
+from core.gradient import GradientModel, relative_radius, save_png
+from core.parallel import resolve_workers
+
+FORMAT_EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'jpg': 'jpg'}
+DEFAULT_SPEC = {'type': 'linear', 'angle': 0, 'center': (0.5, 0.5), 'radius': 1.0,
+                'width': 800, 'height': 400, 'format': 'png'}
+
+
+class SpecError(ValueError):
+    """Raised when a gradient spec is missing fields or has invalid values."""
+
+
+def _normalize_hex(color):
+    """Returns a color as '#RRGGBB', accepting what the GUI accepts (core.colors.is_valid_hex)."""
+    color = color.strip()
+    if not is_valid_hex(color):
+        raise SpecError(f"invalid HEX color {color!r} (expected '#RRGGBB')")
+    return color.upper()
+
+
+def _split_list(value):
+    """Splits a CSV cell like '#FF0000 #00FF00' or '0;0.5;1' into items."""
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [item for item in re.split(r'[\s;]+', value.strip()) if item]
+
+
+def normalize_spec(raw, index):
+    """
+    Validates a raw spec (from JSON, CSV or a preset) and fills in defaults.
+
+    Args:
+        raw (dict): The spec as read from the input.
+        index (int): Position of the spec in the input, used for default names.
+
+    Returns:
+        dict: A spec with name, colors, positions, type, angle, center, radius, width,
+            height and format.
+
+    Raises:
+        SpecError: If the spec is invalid.
+    """
+    spec = dict(DEFAULT_SPEC)
+    spec.update({key: value for key, value in raw.items() if value not in (None, '')})
+
+    colors = [_normalize_hex(c) for c in _split_list(spec.get('colors', []))]
+    if len(colors) < 2:
+        raise SpecError("at least two colors are required")
+
+    if 'positions' in spec:
+        positions = [float(p) for p in _split_list(spec['positions'])]
+        if len(positions) != len(colors):
+            raise SpecError("positions must have one entry per color")
+        if any(b < a for a, b in zip(positions, positions[1:])) or positions[0] < 0 or positions[-1] > 1:
+            raise SpecError("positions must be ascending values from 0 to 1")
+    else:
+        positions = [i / (len(colors) - 1) for i in range(len(colors))]
+
+    gradient_type = str(spec['type']).lower()
+    if gradient_type not in ('linear', 'radial'):
+        raise SpecError(f"unknown gradient type {spec['type']!r}")
+    image_format = str(spec['format']).lower()
+    if image_format not in FORMAT_EXTENSIONS:
+        raise SpecError(f"unsupported format {spec['format']!r}")
+
+    try:
+        width, height = int(spec['width']), int(spec['height'])
+        angle = float(spec['angle'])
+        center = tuple(float(c) for c in _split_list(spec['center']))
+        radius = float(spec['radius'])
+    except ValueError as e:
+        raise SpecError(str(e)) from None
+    if width <= 0 or height <= 0:
+        raise SpecError("width and height must be positive")
+    if len(center) != 2 or not all(0 <= c <= 1 for c in center):
+        raise SpecError("center must be two fractions from 0 to 1")
+    if not (math.isfinite(radius) and radius > 0):
+        raise SpecError("radius must be a positive fraction of the farthest-corner distance")
+
+    name = str(spec.get('name') or f"gradient-{index + 1:05d}")
+    return {'name': name, 'colors': colors, 'positions': positions, 'type': gradient_type,
+            'angle': angle, 'center': center, 'radius': radius, 'width': width, 'height': height,
+            'format': image_format}
+
+
+def load_specs(path):
+    """
+    Reads raw gradient specs from a JSON or CSV file (chosen by extension).
+
+    Returns:
+        list: One dict per gradient.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith('.csv'):
+            return list(csv.DictReader(f))
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('gradients', [])
+    if not isinstance(data, list):
+        raise SpecError("JSON input must be a list of gradient objects")
+    return data
+
+
+def preset_specs(defaults):
+    """Builds one raw spec per entry in constants.GRADIENT_PRESETS."""
+    return [dict(defaults, name=name, colors=colors) for name, colors in GRADIENT_PRESETS.items()]
+
+
+def _file_name(name, extension, used):
+    """Turns a spec name into a unique, filesystem-safe file name."""
+    stem = re.sub(r'[^A-Za-z0-9._-]+', '-', name).strip('-.') or 'gradient'
+    candidate = f"{stem}.{extension}"
+    counter = 2
+    while candidate.lower() in used:
+        candidate = f"{stem}-{counter}.{extension}"
+        counter += 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def render_spec(job):
+    """
+    Worker entry point: renders one normalized spec to disk.
+
+    Args:
+        job (tuple): (spec, output path).
+
+    Returns:
+        tuple: (output path, pixel count, error message or None).
+    """
+    spec, path = job
+    model = GradientModel(spec['colors'], spec['positions'])
+    geometry = (spec['type'], spec['angle'], spec['center'],
+                relative_radius(spec['width'], spec['height'], spec['center'], spec['radius']))
+    try:
+        if spec['format'] == 'png':
+            save_png(model, path, spec['width'], spec['height'], *geometry)
+        else:
+            from PIL import Image # Only JPEG output needs Pillow
+            pixels = model.render(spec['width'], spec['height'], *geometry)
+            Image.frombuffer('RGB', (spec['width'], spec['height']), pixels, 'raw', 'RGB', 0, 1).save(
+                path, format='JPEG', quality=95)
+    except Exception as e:
+        return path, 0, f"{type(e).__name__}: {e}"
+    return path, spec['width'] * spec['height'], None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Render gradients to image files without the GUI.")
+    parser.add_argument('specs', nargs='?', help="JSON or CSV file with gradient specs")
+    parser.add_argument('--presets', action='store_true', help="render every entry of GRADIENT_PRESETS")
+    parser.add_argument('-o', '--output', default='gradients', help="output directory (default: gradients)")
+    parser.add_argument('--workers', type=int, default=0, help="worker processes (default: one per CPU core)")
+    parser.add_argument('--width', type=int, default=DEFAULT_SPEC['width'], help="default width for specs without one")
+    parser.add_argument('--height', type=int, default=DEFAULT_SPEC['height'], help="default height for specs without one")
+    parser.add_argument('--type', default=DEFAULT_SPEC['type'], help="default gradient type (linear or radial)")
+    parser.add_argument('--angle', type=float, default=DEFAULT_SPEC['angle'], help="default angle in degrees")
+    parser.add_argument('--center', type=float, nargs=2, default=DEFAULT_SPEC['center'], metavar=('X', 'Y'),
+                        help="default radial center as fractions of width and height")
+    parser.add_argument('--radius', type=float, default=DEFAULT_SPEC['radius'],
+                        help="default radial radius as a fraction of the farthest-corner distance")
+    parser.add_argument('--format', default=DEFAULT_SPEC['format'], help="default format (png or jpeg)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.specs and not args.presets:
+        parser.error("give a specs file or --presets")
+
+    defaults = {'width': args.width, 'height': args.height, 'type': args.type,
+                'angle': args.angle, 'center': args.center, 'radius': args.radius, 'format': args.format}
+    raw_specs = preset_specs(defaults) if args.presets else []
+    if args.specs:
+        try:
+            raw_specs += load_specs(args.specs)
+        except (OSError, ValueError) as e:
+            print(f"Could not read {args.specs}: {e}", file=sys.stderr)
+            return 2
+
+    os.makedirs(args.output, exist_ok=True)
+    jobs, failures, used_names = [], 0, set()
+    for index, raw in enumerate(raw_specs):
+        try:
+            spec = normalize_spec(dict(defaults, **raw), index)
+        except (SpecError, TypeError, ValueError) as e:
+            print(f"Spec {index + 1}: {e}", file=sys.stderr)
+            failures += 1
+            continue
+        file_name = _file_name(spec['name'], FORMAT_EXTENSIONS[spec['format']], used_names)
+        jobs.append((spec, os.path.join(args.output, file_name)))
+
+    workers = min(resolve_workers(args.workers), max(len(jobs), 1))
+    start = time.perf_counter()
+    pixels = rendered = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Small chunks keep all workers busy when sizes vary; larger ones cut overhead for thousands of specs
+        chunksize = max(1, len(jobs) // (workers * 8))
+        for path, count, error in pool.map(render_spec, jobs, chunksize=chunksize):
+            if error:
+                print(f"{path}: {error}", file=sys.stderr)
+                failures += 1
+            else:
+                rendered += 1
+            pixels += count
+    elapsed = time.perf_counter() - start
+
+    print(f"Rendered {rendered} of {len(raw_specs)} gradients into {args.output} in {elapsed:.2f}s "
+          f"({rendered / max(elapsed, 1e-9):.1f} images/s, {pixels / 1e6 / max(elapsed, 1e-9):.1f} MP/s, "
+          f"{workers} worker(s))")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,11 +4,11 @@ This module contains various helper functions used across different parts
 of the Quick Tools application.
 """
 import pyperclip
-import re
-import colorsys
 
 # Import constants (specifically for status messages)
 from constants import WARNING_RED, SUCCESS_GREEN
+# Color conversions live in the Tk-free core package; re-exported here for the GUI modules
+from core.colors import hex_to_rgb, rgb_to_hex, hsv_to_hex, is_valid_hex
 
 
 def copy_to_clipboard_helper(app_instance, text_to_copy: str, success_message: str):
@@ -37,56 +37,3 @@ def copy_to_clipboard_helper(app_instance, text_to_copy: str, success_message: s
     except Exception as e:
         app_instance.update_status(f"Failed to copy: {e}", WARNING_RED)
         print(f"Unknown error copying to clipboard: {e}")
-
-def hex_to_rgb(hex_code: str) -> tuple:
-    """
-    Converts a HEX color code (e.g., '#RRGGBB') to an RGB tuple (R, G, B).
-
-    Args:
-        hex_code (str): The HEX color string.
-
-    Returns:
-        tuple: An RGB tuple (0-255, 0-255, 0-255).
-    """
-    hex_code = hex_code.lstrip('#')
-    return tuple(int(hex_code[i:i+2], 16) for i in (0, 2, 4))
-
-def rgb_to_hex(rgb_tuple: tuple) -> str:
-    """
-    Converts an RGB tuple (R, G, B) to a HEX color code (e.g., '#RRGGBB').
-
-    Args:
-        rgb_tuple (tuple): An RGB tuple (0-255, 0-255, 0-255).
-
-    Returns:
-        str: The HEX color string.
-    """
-    return '#{:02X}{:02X}{:02X}'.format(*rgb_tuple)
-
-def hsv_to_hex(h: float, s: float, v: float) -> str:
-    """
-    Converts HSV (Hue, Saturation, Value) to a HEX color code.
-
-    Args:
-        h (float): Hue (0.0 to 1.0).
-        s (float): Saturation (0.0 to 1.0).
-        v (float): Value (0.0 to 1.0).
-
-    Returns:
-        str: The HEX color string.
-    """
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
-    return '#{:02X}{:02X}{:02X}'.format(int(r*255), int(g*255), int(b*255))
-
-def is_valid_hex(hex_code: str) -> bool:
-    """
-    Checks if a string is a valid 7-character HEX color code (e.g., '#AABBCC').
-
-    Args:
-        hex_code (str): The string to validate.
-
-    Returns:
-        bool: True if valid, False otherwise.
-    """
-    return re.fullmatch(r'^#([0-9a-fA-F]{6})$', hex_code) is not None
-
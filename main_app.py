@@ -2,6 +2,7 @@
 import tkinter as tk
 from tkinter import ttk
 import sys
+from collections import OrderedDict
 
 # Import constants and functional modules
 from constants import (
@@ -10,7 +11,8 @@ from constants import (
     STATUS_MESSAGE_DURATION_MS, FONT_FAMILY, FONT_REGULAR, FONT_BOLD, FONT_TITLE,
     FONT_INPUT, FONT_STATS_COUNT, FONT_STATS_TEXT, PALETTE_INDIGO,
     LENGTH_CONVERSION_FACTORS, MASS_CONVERSION_FACTORS, VOLUME_CONVERSION_FACTORS,
-    UNITS_CATEGORIES, GRADIENT_STYLES, GRADIENT_PRESETS
+    UNITS_CATEGORIES, GRADIENT_STYLES, GRADIENT_PRESETS, DEFAULT_EXPORT_WORKERS,
+    PICKER_AREA_SIZE, SV_CACHE_ENTRIES, SV_PREFILL_DELAY_MS
 )
 
 # Import functional modules
@@ -18,6 +20,10 @@ import text_tools
 import calc_tools
 import creative_tools
 import helpers
+from core.gradient import GradientModel, GradientRaster
+from core.jobs import JobQueue
+from core.text import LineStats
+from core.picker import SVSquareCache
 
 class QuickToolsApp:
     """
@@ -85,6 +91,18 @@ class QuickToolsApp:
 
         # Initialize attributes for dynamic elements and state management
         self.current_case_type = 'upper' # Default text case for Text Tools
+        self.text_stats = LineStats() # Per-line counts of the Text Tools input, updated on every edit
+        self._text_stats_generation = 0 # Bumped on every Text Tools edit; older background counts and conversions are dropped
+        self._text_stats_dirty = False # text_stats is out of date until a background recount lands
+        self._text_refresh_job = None # Pending idle-time stats/conversion refresh
+        self._text_stats_poll_job = None # Pending check for a finished background recount
+        self.text_stats_queue = JobQueue('text-stats') # Background recounts of large Text Tools input
+        self.text_convert_queue = JobQueue('text-convert') # Background case conversion of large Text Tools input
+        self._text_convert_poll_job = None # Pending check for a finished background conversion
+        self.text_file = None # Path of the file opened in Text Tools; the input box shows a preview of it
+        self._text_file_stats = None # (chars, words, lines) of the whole open file, once analyzed
+        self.text_file_queue = JobQueue('text-file') # Streaming passes over files opened in Text Tools
+        self._text_file_poll_job = None # Pending progress update for the running file pass
         self._button_hover_colors = {} # Dictionary to manage button hover effects
         self.area_rows = [] # List to manage dynamic area calculator rows
 
@@ -94,14 +112,32 @@ class QuickToolsApp:
         self.gradient_num_colors_var = tk.IntVar(value=3) # For Gradient Generator
         self.gradient_style_var = tk.StringVar(value='Warm') # For Gradient Generator
         self.gradient_rotation_var = tk.IntVar(value=45) # For Gradient Generator
+        self.gradient_radius_var = tk.IntVar(value=100) # Radial radius in percent of the farthest-corner distance
         self.export_width_var = tk.StringVar(value="800") # For Gradient Export
         self.export_height_var = tk.StringVar(value="400") # For Gradient Export
-        self._gradient_colors = [] # Current gradient colors
-        self._gradient_positions = [] # Current gradient stop positions
+        self.export_workers_var = tk.StringVar(value=DEFAULT_EXPORT_WORKERS) # Worker processes for large exports
+        self.gradient_model = GradientModel() # Current gradient stops and compiled color lookup table
+        self._gradient_raster = GradientRaster(self.gradient_model) # Retained preview frame
+        self._gradient_preview_photo = None # PhotoImage shown on the preview canvas
+        self._gradient_stop_items = [] # Canvas items for the stop handles
+        self._gradient_repaint_job = None # Pending coalesced preview repaint
+        self._gradient_refine_job = None # Pending full-resolution pass after interaction
+        self._gradient_lod_photo = None # Block-resolution frame zoomed onto the preview photo
+        self._gradient_center = (0.5, 0.5) # Radial gradient center (fractions of width/height)
+        self._gradient_center_item = None # Canvas marker at the radial gradient center
         self._dragging_stop = None # State for gradient stop dragging
         self._drag_mouse_offset_x = None # X offset for gradient stop drag
         self._drag_mouse_offset_y = None # Y offset for gradient stop drag
         self._last_gradient_signature = None # To prevent repetitive random gradients
+        self._gradient_hex_rows = [] # Pooled HEX row widgets, one per gradient stop
+        self._gradient_hex_drawn = None # (colors, width) the HEX rows were last drawn for
+        self._palette_swatches = {} # Pooled swatch/label widgets per palette section
+        self._palette_hex = None # Base HEX the palette swatches were last drawn for
+        self.sv_square_cache = SVSquareCache(SV_CACHE_ENTRIES) # Color picker squares by hue; see .stats()
+        self.export_queue = JobQueue('export') # Background image/SVG exports, run one after another
+        self._export_poll_job = None # Pending status bar update for the running export
+        self._preset_thumbnails = OrderedDict() # Preset gallery previews by colors, least recently shown first
+        self.preset_store = None # Gradient preset library (core.presets.PresetStore), opened on first use
 
         # Unit Converter variables
         self.unit_input_var = tk.StringVar(value="1.00")
@@ -160,6 +196,27 @@ class QuickToolsApp:
         # Bind tab change event to update focus and status
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
 
+        # Render the color picker squares in the background once the window is up
+        self.root.after(SV_PREFILL_DELAY_MS, lambda: self.sv_square_cache.start_prefill(PICKER_AREA_SIZE))
+
+    # The gradient stops are owned by gradient_model; these properties keep the
+    # _gradient_colors/_gradient_positions names used throughout the modules.
+    @property
+    def _gradient_colors(self):
+        return self.gradient_model.colors
+
+    @_gradient_colors.setter
+    def _gradient_colors(self, colors):
+        self.gradient_model.colors = list(colors)
+
+    @property
+    def _gradient_positions(self):
+        return self.gradient_model.positions
+
+    @_gradient_positions.setter
+    def _gradient_positions(self, positions):
+        self.gradient_model.positions = list(positions)
+
     def create_widgets(self):
         """
         Sets up the main notebook (tabbed interface) and
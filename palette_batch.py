@@ -0,0 +1,169 @@
+# palette_batch.py
+"""
+Headless bulk palette generator.
+
+Builds the Color Generator palettes (Analogous, Monochromatic, Shades and
+Complementary) for every base color in a file and streams them out as JSON
+Lines or CSV. Colors are processed in chunks with core.palette_bulk, so
+memory stays flat for catalogs of any size. Nothing here imports tkinter.
+
+Usage:
+    python palette_batch.py colors.txt -o palettes.jsonl
+    python palette_batch.py brand.csv --column hex -o palettes.csv --seed 42
+    cat colors.txt | python palette_batch.py - --format csv > palettes.csv
+
+Input is one '#RRGGBB' color per line, or a CSV file with a header row (the
+column is picked with --column, default: the first one). Invalid colors are
+reported on stderr and skipped. Throughput is reported on stderr at the end.
+
+JSON Lines output has one object per base color:
+    {"base": "#AABBCC", "Analogous": ["#AACCBB", ...], "Monochromatic": [...], ...}
+CSV output has one row per base color: base, then analogous_1 .. complementary_6.
+"""
+import argparse
+import csv
+import itertools
+import sys
+import time
+
+import numpy as np
+
+from constants import DEFAULT_PALETTE_SEED
+from core.palette_bulk import PALETTE_SIZE, bulk_palettes, format_hex_colors, parse_hex_colors
+from core.palettes import PALETTE_NAMES
+
+DEFAULT_CHUNK_SIZE = 65536
+OUTPUT_FORMATS = ('jsonl', 'csv')
+
+
+def read_base_colors(stream, column=None):
+    """
+    Yields base colors from a plain list (one per line) or a CSV file.
+
+    Args:
+        stream: A text file object.
+        column (str, optional): CSV column holding the colors. When omitted,
+            a first line containing a comma is treated as a CSV header and
+            its first column is used.
+
+    Yields:
+        tuple: (line number, color string).
+    """
+    first = stream.readline()
+    if not first:
+        return
+    if column is None and ',' not in first:
+        for line_no, line in enumerate(itertools.chain([first], stream), start=1):
+            if line.strip():
+                yield line_no, line.strip()
+        return
+
+    reader = csv.reader(itertools.chain([first], stream))
+    header = [name.strip() for name in next(reader)]
+    if column is None:
+        index = 0
+    elif column in header:
+        index = header.index(column)
+    else:
+        raise ValueError(f"column {column!r} not found (have: {', '.join(header)})")
+    for line_no, row in enumerate(reader, start=2):
+        if len(row) > index and row[index].strip():
+            yield line_no, row[index].strip()
+
+
+def csv_header():
+    """Returns the header row of the CSV output."""
+    return ['base'] + [f"{name.lower()}_{i + 1}" for name in PALETTE_NAMES for i in range(PALETTE_SIZE)]
+
+
+def write_chunk(out, bases, palettes, output_format):
+    """
+    Writes the palettes of one chunk of base colors.
+
+    Args:
+        out: Text file object to write to.
+        bases (list): Normalized base colors of the chunk.
+        palettes (dict): bulk_palettes() result for the chunk.
+        output_format (str): 'jsonl' or 'csv'.
+    """
+    # (N, 24) '#RRGGBB' strings, the four palettes side by side in PALETTE_NAMES order
+    rgb = np.concatenate([palettes[name] for name in PALETTE_NAMES], axis=1)
+    rows = format_hex_colors(rgb).astype('U7').tolist()
+    lines = []
+    for base, row in zip(bases, rows):
+        if output_format == 'csv':
+            lines.append(base + ',' + ','.join(row) + '\n')
+        else:
+            # Every value is a '#RRGGBB' string, so the JSON can be assembled directly
+            fields = ', '.join(f'"{name}": ["' + '", "'.join(row[i * PALETTE_SIZE:(i + 1) * PALETTE_SIZE]) + '"]'
+                               for i, name in enumerate(PALETTE_NAMES))
+            lines.append(f'{{"base": "{base}", {fields}}}\n')
+    out.write(''.join(lines))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generate Color Generator palettes for many base colors.")
+    parser.add_argument('input', help="file with one HEX color per line, or a CSV file ('-' for stdin)")
+    parser.add_argument('-o', '--output', default='-', help="output file (default: stdout)")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                        help="output format (default: from the output file extension, else jsonl)")
+    parser.add_argument('--column', help="CSV column with the base colors (default: the first column)")
+    parser.add_argument('--seed', default=str(DEFAULT_PALETTE_SEED),
+                        help=f"seed for the Complementary variations (default: {DEFAULT_PALETTE_SEED})")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"base colors processed per batch (default: {DEFAULT_CHUNK_SIZE})")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size must be positive")
+    output_format = args.format or ('csv' if args.output.lower().endswith('.csv') else 'jsonl')
+    seed = int(args.seed) if args.seed.lstrip('-').isdigit() else args.seed # Same palettes as get_palette(seed=...)
+
+    try:
+        source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+        out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    except OSError as e:
+        print(f"Could not open file: {e}", file=sys.stderr)
+        return 2
+
+    generated = failures = 0
+    start = time.perf_counter()
+    try:
+        if output_format == 'csv':
+            out.write(','.join(csv_header()) + '\n')
+        colors = read_base_colors(source, args.column)
+        while True:
+            chunk = list(itertools.islice(colors, args.chunk_size))
+            if not chunk:
+                break
+            rgb, valid = parse_hex_colors([color for _, color in chunk])
+            for (line_no, color), ok in zip(chunk, valid):
+                if not ok:
+                    print(f"Line {line_no}: invalid HEX color {color!r}", file=sys.stderr)
+            failures += len(chunk) - int(valid.sum())
+            rgb = rgb[valid]
+            bases = format_hex_colors(rgb).astype('U7').tolist()
+            write_chunk(out, bases, bulk_palettes(rgb, seed), output_format)
+            generated += len(bases)
+    except ValueError as e:
+        print(f"Could not read {args.input}: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"Generated {generated} palette sets ({generated * len(PALETTE_NAMES)} palettes) in {elapsed:.2f}s "
+          f"({generated / max(elapsed, 1e-9):,.0f} palette sets/s, "
+          f"{generated * len(PALETTE_NAMES) / max(elapsed, 1e-9):,.0f} palettes/s)", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
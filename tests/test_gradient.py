@@ -0,0 +1,110 @@
+# tests/test_gradient.py
+"""
+core.gradient: stop interpolation and the retained preview raster.
+"""
+import warnings
+
+import numpy as np
+
+from core import gradient
+
+
+def test_stops_at_one_position_compile_without_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        for positions in ([0.0, 0.5, 0.5], [0.0, 0.0, 1.0, 1.0], [0.3, 0.3]):
+            model = gradient.GradientModel(['#FF0000', '#00FF00', '#0000FF', '#FFFFFF'][:len(positions)], positions)
+            assert model.lut.shape == (model.lut_size, 3)
+
+
+def test_stops_at_one_position_switch_colors_there():
+    stop_pos, stop_rgb = gradient.stops_to_arrays(['#FF0000', '#00FF00', '#0000FF'], [0.0, 0.5, 0.5])
+    pixels = gradient.map_fractions(np.array([0.0, 0.25, 0.5, 1.0]), stop_pos, stop_rgb)
+    assert pixels.tolist() == [[255, 0, 0], [127, 127, 0], [0, 0, 255], [0, 0, 255]]
+
+
+def _fresh_frame(model, width, height, gradient_type, angle, center, radius):
+    """The preview frame drawn from scratch: nearest byte lookup-table entry for every pixel."""
+    lut = gradient.GradientModel(model.colors, model.positions, model.lut_size).byte_lut
+    frac = gradient.gradient_fractions(width, height, gradient_type, angle, center, radius)
+    return lut[np.rint(frac * (len(lut) - 1)).astype(np.intp)]
+
+
+def _drag(model, index, position):
+    model.positions[index] = position
+
+
+def _recolor(model, index, color):
+    model.colors[index] = color
+
+
+def _add_stop(model, position, color):
+    index = next((i for i, p in enumerate(model.positions) if p > position), len(model.positions))
+    model.positions.insert(index, position)
+    model.colors.insert(index, color)
+
+
+def _remove_stop(model, index):
+    del model.positions[index]
+    del model.colors[index]
+
+
+# (stop edit or None, geometry, lod) steps applied in order to one raster
+RASTER_STEPS = [
+    (None, (160, 90, 'linear', 45, (0.5, 0.5), None), 1),
+    (lambda m: _drag(m, 1, 0.35), (160, 90, 'linear', 45, (0.5, 0.5), None), 1),
+    (lambda m: _drag(m, 1, 0.36), (160, 90, 'linear', 45, (0.5, 0.5), None), 4),
+    (lambda m: _drag(m, 1, 0.6), (160, 90, 'linear', 45, (0.5, 0.5), None), 1),
+    (lambda m: _recolor(m, 2, '#123456'), (160, 90, 'linear', 45, (0.5, 0.5), None), 1),
+    (None, (160, 90, 'linear', 45, (0.5, 0.5), None), 1),
+    (None, (160, 90, 'linear', 200, (0.5, 0.5), None), 4),
+    (None, (160, 90, 'linear', 200, (0.5, 0.5), None), 1),
+    (lambda m: _add_stop(m, 0.8, '#FFFF00'), (160, 90, 'linear', 200, (0.5, 0.5), None), 1),
+    (None, (161, 57, 'radial', 0, (0.2, 0.7), None), 1),
+    (lambda m: _drag(m, 2, 0.61), (161, 57, 'radial', 0, (0.2, 0.7), None), 1),
+    (lambda m: _drag(m, 2, 0.61), (161, 57, 'radial', 0, (0.2, 0.7), 40.0), 3),
+    (None, (161, 57, 'radial', 0, (0.2, 0.7), 40.0), 1),
+    (lambda m: _remove_stop(m, 1), (161, 57, 'radial', 0, (0.2, 0.7), 40.0), 1),
+    (lambda m: m.set_stops(['#000000', '#FFFFFF'], [0.5, 0.5]), (161, 57, 'radial', 0, (0.2, 0.7), 40.0), 1),
+    (lambda m: _drag(m, 0, 0.0), (161, 57, 'radial', 0, (0.2, 0.7), 40.0), 1),
+    (None, (1, 1, 'linear', 0, (0.5, 0.5), None), 1),
+    (None, (300, 2, 'linear', 0, (0.5, 0.5), None), 1),
+]
+
+
+def test_raster_updates_match_a_fresh_frame_after_every_edit():
+    model = gradient.GradientModel(['#FF0000', '#00FF00', '#0000FF'], [0.0, 0.3, 1.0])
+    raster = gradient.GradientRaster(model)
+    previous = None
+    for step, (edit, geometry, lod) in enumerate(RASTER_STEPS):
+        if edit is not None:
+            edit(model)
+        dirty = raster.update(*geometry, lod=lod)
+        assert raster.lod == lod
+        if lod > 1:
+            previous = None
+            continue
+
+        expected = _fresh_frame(model, *geometry)
+        assert raster.pixels.shape == expected.shape
+        assert np.array_equal(raster.pixels, expected), f"step {step}"
+        if previous is not None and previous.shape == expected.shape:
+            # Everything outside the reported box is as before
+            outside = np.ones(expected.shape[:2], dtype=bool)
+            if dirty is not None:
+                x0, y0, x1, y1 = dirty
+                outside[y0:y1, x0:x1] = False
+            assert np.array_equal(raster.pixels[outside], previous[outside]), f"step {step}"
+        previous = raster.pixels.copy()
+
+
+def test_raster_reports_nothing_when_nothing_changed():
+    model = gradient.GradientModel(['#FF0000', '#0000FF'], [0.0, 1.0])
+    raster = gradient.GradientRaster(model)
+    assert raster.update(40, 20) == (0, 0, 40, 20)
+    assert raster.update(40, 20) is None
+    model.set_stops(['#FF0000', '#0000FF'], [0.0, 1.0]) # Same stops
+    assert raster.update(40, 20) is None
+    assert raster.update(40, 20, lod=4) == (0, 0, 40, 20)
+    assert raster.update(40, 20, lod=4) is None
+    assert raster.pixels.shape == (5, 10, 3)
@@ -0,0 +1,45 @@
+# tests/test_gradient_batch.py
+"""
+gradient_batch: spec validation and rendering of radial center and radius.
+"""
+import numpy as np
+import pytest
+
+import gradient_batch
+from core import gradient
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def test_center_and_radius_default_to_the_farthest_corner_circle():
+    spec = gradient_batch.normalize_spec({'colors': '#000000 #FFFFFF'}, 0)
+    assert spec['center'] == (0.5, 0.5)
+    assert spec['radius'] == 1.0
+
+
+@pytest.mark.parametrize('center, radius', [('0.2 0.7', '0.5'), ('0.2;0.7', 2), ([0, 1], 1.5)])
+def test_center_and_radius_are_read_from_csv_and_json_values(center, radius):
+    spec = gradient_batch.normalize_spec({'colors': '#000000 #FFFFFF', 'center': center, 'radius': radius}, 0)
+    assert spec['center'] == tuple(float(c) for c in gradient_batch._split_list(center))
+    assert spec['radius'] == float(radius)
+
+
+@pytest.mark.parametrize('field, value', [
+    ('center', '0.5'), ('center', '0.1 0.2 0.3'), ('center', '1.5 0.5'), ('center', '0.5 nan'),
+    ('radius', '0'), ('radius', '-1'), ('radius', 'nan'), ('radius', 'inf'),
+])
+def test_invalid_center_and_radius_are_rejected(field, value):
+    with pytest.raises(gradient_batch.SpecError):
+        gradient_batch.normalize_spec({'colors': '#000000 #FFFFFF', field: value}, 0)
+
+
+def test_radial_spec_renders_with_its_center_and_radius(tmp_path):
+    spec = gradient_batch.normalize_spec({'colors': '#FF0000 #0000FF', 'type': 'radial', 'center': '0.25 0.75',
+                                          'radius': '0.5', 'width': 120, 'height': 80}, 0)
+    path = str(tmp_path / 'radial.png')
+    assert gradient_batch.render_spec((spec, path)) == (path, 120 * 80, None)
+
+    model = gradient.GradientModel(spec['colors'], spec['positions'])
+    radius = 0.5 * gradient.farthest_corner_radius(120, 80, (0.25, 0.75))
+    with Image.open(path) as img:
+        assert np.array_equal(np.asarray(img), model.render(120, 80, 'radial', 0, (0.25, 0.75), radius))
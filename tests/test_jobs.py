@@ -0,0 +1,167 @@
+# tests/test_jobs.py
+"""
+core.jobs.JobQueue: ordering, cancellation, failures and collection.
+"""
+import threading
+import time
+
+import pytest
+
+from core import jobs
+
+
+def _collect(queue, count, timeout=5):
+    """Collects finished jobs until count have arrived."""
+    finished = []
+    deadline = time.monotonic() + timeout
+    while len(finished) < count:
+        assert time.monotonic() < deadline, "jobs didn't finish in time"
+        finished += queue.collect_finished()
+        time.sleep(0.001)
+    return finished
+
+
+def _blocker(job, started, release):
+    """A job that runs until released."""
+    started.set()
+    assert release.wait(5)
+    return 'released'
+
+
+def test_jobs_run_one_at_a_time_in_submission_order():
+    queue = jobs.JobQueue()
+    ran, running = [], []
+
+    def record(job, i):
+        running.append(i)
+        assert len(running) == 1 # Never two jobs at once
+        time.sleep(0.001)
+        ran.append(i)
+        running.remove(i)
+        return i * 10
+
+    submitted = [queue.submit(f"job {i}", record, i) for i in range(8)]
+    finished = _collect(queue, 8)
+    assert ran == list(range(8))
+    assert finished == submitted
+    assert [job.state for job in finished] == [jobs.DONE] * 8
+    assert [job.result for job in finished] == [i * 10 for i in range(8)]
+    assert all(job.progress == 1.0 for job in finished)
+
+
+def test_a_job_cancelled_while_queued_never_runs():
+    queue = jobs.JobQueue()
+    started, release = threading.Event(), threading.Event()
+    ran = []
+    first = queue.submit("blocker", _blocker, started, release)
+    assert started.wait(5)
+    second = queue.submit("second", lambda job: ran.append('second'))
+    third = queue.submit("third", lambda job: ran.append('third'))
+    assert queue.pending() == [second, third]
+
+    second.cancel()
+    release.set()
+    finished = _collect(queue, 3)
+    assert finished == [first, second, third]
+    assert [job.state for job in finished] == [jobs.DONE, jobs.CANCELLED, jobs.DONE]
+    assert ran == ['third']
+
+
+def test_cancelling_a_running_job_takes_effect_at_its_next_report():
+    queue = jobs.JobQueue()
+    reported, cancelled = threading.Event(), threading.Event()
+    steps = []
+
+    def work(job):
+        job.report(1, 4, stage="Rendering")
+        steps.append(1)
+        reported.set()
+        assert cancelled.wait(5)
+        steps.append(2) # Work between reports still finishes
+        job.report(2, 4)
+        steps.append(3)
+
+    job = queue.submit("work", work)
+    assert reported.wait(5)
+    assert queue.current is job
+    assert job.state == jobs.RUNNING and job.stage == "Rendering" and job.progress == 0.25
+    assert queue.cancel_current() is job
+    cancelled.set()
+
+    assert _collect(queue, 1) == [job]
+    assert job.state == jobs.CANCELLED
+    assert steps == [1, 2]
+    assert job.result is None and job.error is None
+
+
+def test_cancel_all_stops_the_running_job_and_everything_queued():
+    queue = jobs.JobQueue()
+    started = threading.Event()
+    ran = []
+
+    def work(job):
+        started.set()
+        while True:
+            job.report(0, 1)
+            time.sleep(0.001)
+
+    running = queue.submit("running", work)
+    assert started.wait(5)
+    queued = [queue.submit(f"queued {i}", lambda job, i=i: ran.append(i)) for i in range(3)]
+    queue.cancel_all()
+    assert _collect(queue, 4) == [running] + queued
+    assert all(job.state == jobs.CANCELLED for job in [running] + queued)
+    assert ran == []
+
+
+def test_a_failing_job_records_its_error_and_the_queue_moves_on():
+    queue = jobs.JobQueue()
+
+    def fail(job):
+        raise OSError("disk full")
+
+    failing = queue.submit("fails", fail)
+    after = queue.submit("after", lambda job: 'ok')
+    finished = _collect(queue, 2)
+    assert finished == [failing, after]
+    assert failing.state == jobs.FAILED
+    assert isinstance(failing.error, OSError) and str(failing.error) == "disk full"
+    assert failing.result is None
+    assert after.state == jobs.DONE and after.result == 'ok'
+
+
+def test_finished_jobs_are_kept_until_collected_and_returned_once():
+    queue = jobs.JobQueue()
+    assert queue.idle()
+    assert queue.collect_finished() == []
+
+    started, release = threading.Event(), threading.Event()
+    job = queue.submit("blocker", _blocker, started, release)
+    assert not queue.idle() # Queued or running
+    assert started.wait(5)
+    assert not queue.idle()
+    assert queue.collect_finished() == []
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while queue.current is not None:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    assert not queue.idle() # Finished but not collected yet
+    assert queue.collect_finished() == [job]
+    assert queue.collect_finished() == []
+    assert queue.idle()
+
+
+def test_report_clamps_progress_and_raises_once_cancelled():
+    job = jobs.Job("direct", lambda job: None)
+    job.report(5, 4, stage="Encoding")
+    assert job.progress == 1.0 and job.stage == "Encoding"
+    job.report(0, 0)
+    assert job.progress == 1.0 # An empty task counts as done
+    job.cancel()
+    assert job.cancelled
+    with pytest.raises(jobs.JobCancelled):
+        job.report(1, 2)
+    with pytest.raises(jobs.JobCancelled):
+        job.check_cancelled()
@@ -0,0 +1,35 @@
+# tests/test_memory.py
+"""
+core.memory.PeakMemoryMonitor around serial and parallel exports.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from core import gradient
+from core.memory import PeakMemoryMonitor
+
+pytestmark = pytest.mark.skipif(not os.path.exists(f'/proc/{os.getpid()}/smaps_rollup'),
+                                reason="needs /proc/<pid>/smaps_rollup")
+
+MB = 1024 * 1024
+
+
+def _export_peak(path, workers):
+    model = gradient.GradientModel(['#FF0000', '#00FF00', '#0000FF'], [0.0, 0.4, 1.0])
+    with PeakMemoryMonitor(interval=0.01) as monitor:
+        gradient.save_png(model, str(path), 2000, 1500, 'radial', 0, workers=workers)
+    return monitor.peak_bytes
+
+
+def test_parallel_export_peak_does_not_count_the_parent_per_worker(tmp_path):
+    # Memory the parent holds before the export must not show up once per worker
+    ballast = np.ones(256 * MB // 8)
+    _export_peak(tmp_path / 'warm-up.png', workers=2) # Starts the fork server outside the measurement
+    serial = _export_peak(tmp_path / 'serial.png', workers=1)
+    parallel = _export_peak(tmp_path / 'parallel.png', workers=2)
+    # Each worker renders one band of its own and runs its own interpreter
+    assert 0 < serial < 64 * MB
+    assert parallel < 4 * serial + 64 * MB
+    assert parallel < ballast.nbytes / 2
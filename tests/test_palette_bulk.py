@@ -0,0 +1,65 @@
+# tests/test_palette_bulk.py
+"""
+core.palette_bulk against the scalar core.palettes.get_palette().
+"""
+import numpy as np
+import pytest
+
+from constants import DEFAULT_PALETTE_SEED
+from core import palette_bulk
+from core.palettes import PALETTE_NAMES, get_palette
+
+GRAYS = ['#000000', '#FFFFFF', '#808080', '#7F7F7F', '#010101', '#FEFEFE']
+EDGE_COLORS = ['#FF0000', '#00FF00', '#0000FF', '#FFFF00', '#00FFFF', '#FF00FF', '#FF0001', '#800000']
+
+
+def _random_colors(count, seed):
+    rgb = np.random.default_rng(seed).integers(0, 256, (count, 3))
+    return [f'#{r:02X}{g:02X}{b:02X}' for r, g, b in rgb]
+
+
+@pytest.mark.parametrize('seed', [DEFAULT_PALETTE_SEED, 0, 1, -5, 2**64 + 3, 'autumn', '42', ''])
+def test_bulk_palettes_match_get_palette(seed):
+    colors = GRAYS + EDGE_COLORS + _random_colors(500, seed=len(str(seed)))
+    rgb, valid = palette_bulk.parse_hex_colors(colors)
+    assert valid.all()
+    palettes = palette_bulk.bulk_palettes(rgb, seed)
+    assert list(palettes) == list(PALETTE_NAMES)
+
+    for name, table in palettes.items():
+        assert table.shape == (len(colors), palette_bulk.PALETTE_SIZE, 3)
+        hexes = palette_bulk.format_hex_colors(table)
+        for i, color in enumerate(colors):
+            expected = get_palette(color, seed)[name]
+            assert [code.decode('ascii') for code in hexes[i]] == expected, (name, color, seed)
+
+
+def test_integer_and_string_seeds_give_different_complementary_palettes():
+    rgb, _ = palette_bulk.parse_hex_colors(_random_colors(50, seed=7))
+    by_int = palette_bulk.bulk_palettes(rgb, 42)['Complementary']
+    by_str = palette_bulk.bulk_palettes(rgb, '42')['Complementary']
+    assert not np.array_equal(by_int, by_str)
+    assert np.array_equal(by_int, palette_bulk.bulk_palettes(rgb, 42)['Complementary'])
+
+
+def test_parse_hex_colors_accepts_any_case_and_surrounding_whitespace():
+    rgb, valid = palette_bulk.parse_hex_colors(['#a1B2c3', '  #FFFFFF\n', '#000000'])
+    assert valid.all()
+    assert rgb.tolist() == [[0xA1, 0xB2, 0xC3], [255, 255, 255], [0, 0, 0]]
+    assert rgb.dtype == np.uint8
+
+
+@pytest.mark.parametrize('code', [
+    '', '#', 'FFFFFF', '#FFF', '#FFFFF', '#GGGGGG', '#12345G', '#FF FF FF', '##FFFFF', '#ÄÄÄÄÄÄ', 'white',
+    '#FFFFFF0', '#FFFFFFFF', '#1234567890', '#FFFFFF #000000',
+])
+def test_parse_hex_colors_rejects_invalid_and_over_long_codes(code):
+    rgb, valid = palette_bulk.parse_hex_colors(['#102030', code, '#405060'])
+    assert valid.tolist() == [True, False, True]
+    assert rgb.tolist() == [[0x10, 0x20, 0x30], [0, 0, 0], [0x40, 0x50, 0x60]]
+
+
+def test_format_hex_colors_round_trips_parse_hex_colors():
+    colors = GRAYS + _random_colors(100, seed=3)
+    rgb, _ = palette_bulk.parse_hex_colors(colors)
+    assert [code.decode('ascii') for code in palette_bulk.format_hex_colors(rgb)] == colors
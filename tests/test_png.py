@@ -0,0 +1,125 @@
+# tests/test_png.py
+"""
+core.png and gradient.save_png() against Pillow and the old per-pixel exporter.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from core import gradient, png
+from core.colors import hex_to_rgb, rgb_to_hex
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def read_png(path):
+    with Image.open(path) as img:
+        assert img.mode == 'RGB'
+        return np.asarray(img)
+
+
+@pytest.mark.parametrize('width, height, band_rows', [(1, 1, 1), (1, 50, 7), (64, 33, 5), (300, 20, 20), (17, 40, 40)])
+def test_writer_round_trips_through_pillow(tmp_path, width, height, band_rows):
+    pixels = np.random.default_rng(width * height).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    path = tmp_path / 'out.png'
+    with png.PngWriter(str(path), width, height) as writer:
+        for y0 in range(0, height, band_rows):
+            writer.write_rows(pixels[y0:y0 + band_rows])
+    assert np.array_equal(read_png(path), pixels)
+
+
+def test_writer_splits_data_into_several_idat_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(png, 'IDAT_CHUNK_SIZE', 256)
+    pixels = np.random.default_rng(1).integers(0, 256, (200, 200, 3), dtype=np.uint8)
+    path = tmp_path / 'out.png'
+    with png.PngWriter(str(path), 200, 200, compress_level=0) as writer:
+        for y0 in range(0, 200, 10):
+            writer.write_rows(pixels[y0:y0 + 10])
+    assert path.read_bytes().count(b'IDAT') > 1
+    assert np.array_equal(read_png(path), pixels)
+
+
+def test_writer_checks_row_count(tmp_path):
+    pixels = np.zeros((4, 3, 3), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        with png.PngWriter(str(tmp_path / 'short.png'), 3, 5) as writer:
+            writer.write_rows(pixels)
+    with pytest.raises(ValueError):
+        with png.PngWriter(str(tmp_path / 'long.png'), 3, 3) as writer:
+            writer.write_rows(pixels)
+
+
+def _legacy_interpolate_gradient(colors, stops, frac):
+    """creative_tools._interpolate_gradient() before core.gradient."""
+    if frac <= stops[0]:
+        return colors[0]
+    if frac >= stops[-1]:
+        return colors[-1]
+    for i in range(1, len(stops)):
+        if frac < stops[i]:
+            left_stop_idx, right_stop_idx = i - 1, i
+            break
+    else:
+        return colors[-1]
+    f = (frac - stops[left_stop_idx]) / (stops[right_stop_idx] - stops[left_stop_idx])
+    c1_rgb = hex_to_rgb(colors[left_stop_idx])
+    c2_rgb = hex_to_rgb(colors[right_stop_idx])
+    r = int(c1_rgb[0] + (c2_rgb[0] - c1_rgb[0]) * f)
+    g = int(c1_rgb[1] + (c2_rgb[1] - c1_rgb[1]) * f)
+    b = int(c1_rgb[2] + (c2_rgb[2] - c1_rgb[2]) * f)
+    return rgb_to_hex((r, g, b))
+
+
+def _legacy_linear_export(colors, stops, width, height, angle):
+    """The linear branch of the old _export_image_gradient(): one putpixel() per pixel."""
+    img = Image.new('RGB', (width, height), color='white')
+    theta = math.radians(angle)
+    cos_theta = math.cos(theta)
+    sin_theta = math.sin(theta)
+    for x_coord in range(width):
+        for y_coord in range(height):
+            nx = (x_coord / (width - 1)) - 0.5 if width > 1 else 0
+            ny = (y_coord / (height - 1)) - 0.5 if height > 1 else 0
+            frac = nx * cos_theta + ny * sin_theta + 0.5
+            frac = min(max(frac, 0), 1)
+            img.putpixel((x_coord, y_coord), hex_to_rgb(_legacy_interpolate_gradient(colors, stops, frac)))
+    return np.asarray(img)
+
+
+GRADIENTS = [
+    (['#FF0000', '#0000FF'], [0.0, 1.0]),
+    (['#12AB34', '#FFFFFF', '#000000', '#C0FFEE'], [0.0, 0.2, 0.75, 1.0]),
+    (['#FF8800', '#FF8800', '#0088FF'], [0.1, 0.5, 0.9]),
+    # Stops closer than a lookup table entry or two
+    (['#FF0000', '#00FFFF'], [0.3, 0.301]),
+    (['#000000', '#FFFFFF', '#000000'], [0.0, 0.5, 0.5005]),
+]
+SIZES_AND_ANGLES = [(40, 30, 0), (33, 21, 45), (1, 25, 90), (25, 1, 200), (20, 20, 315), (4000, 1, 0)]
+
+
+@pytest.mark.parametrize('colors, stops', GRADIENTS)
+@pytest.mark.parametrize('width, height, angle', SIZES_AND_ANGLES)
+def test_exact_interpolation_matches_legacy_export(colors, stops, width, height, angle):
+    frac = gradient.linear_fractions(width, height, angle)
+    pixels = gradient.map_fractions(frac, *gradient.stops_to_arrays(colors, stops))
+    assert np.array_equal(pixels, _legacy_linear_export(colors, stops, width, height, angle))
+
+
+@pytest.mark.parametrize('colors, stops', GRADIENTS)
+@pytest.mark.parametrize('width, height, angle', SIZES_AND_ANGLES)
+def test_linear_png_matches_legacy_export(tmp_path, colors, stops, width, height, angle):
+    path = tmp_path / 'gradient.png'
+    gradient.save_png(gradient.GradientModel(colors, stops), str(path), width, height, 'linear', angle)
+    assert np.array_equal(read_png(path), _legacy_linear_export(colors, stops, width, height, angle))
+
+
+@pytest.mark.parametrize('gradient_type', ['linear', 'radial'])
+def test_png_matches_in_memory_render_and_parallel_export(tmp_path, gradient_type):
+    model = gradient.GradientModel(['#FF0000', '#00FF00', '#0000FF'], [0.0, 0.3, 0.3005])
+    size = (301, 157)
+    expected = model.render(*size, gradient_type, 30, (0.3, 0.6))
+    for workers in (1, 2):
+        path = tmp_path / f'gradient-{workers}.png'
+        gradient.save_png(model, str(path), *size, gradient_type, 30, (0.3, 0.6), workers=workers)
+        assert np.array_equal(read_png(path), expected)
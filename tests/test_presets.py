@@ -0,0 +1,137 @@
+# tests/test_presets.py
+"""
+core.presets: searches against a plain Python filter over every preset, and
+the seeded library against the built-in presets it replaced.
+"""
+import random
+
+import pytest
+
+from constants import GRADIENT_PRESETS
+from core import presets
+from core.presets import PresetStore
+
+WORDS = ['Sun', 'sunset', 'Ocean', 'ocean breeze', 'Fire', 'frost', 'Aurora', 'a', 'Zebra', 'neon', 'Nocturne', 'ümlaut']
+TAGS = ['warm', 'Cool', 'pastel', 'dark', 'neon']
+
+
+def nocase(value):
+    return value.translate(str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'))
+
+
+def random_color(rng):
+    return '#' + ''.join(rng.choice('0123456789ABCDEF') for _ in range(6))
+
+
+@pytest.fixture(scope='module')
+def library():
+    """A store with built-ins plus random gradients and palettes, and every preset as (Preset, kind, hue)."""
+    rng = random.Random(1)
+    store = PresetStore(':memory:')
+    for kind in presets.KINDS:
+        store.add_many([(f"{rng.choice(WORDS)} {i}" if rng.random() < 0.8 else rng.choice(WORDS),
+                         [random_color(rng) for _ in range(rng.randint(2, 6))],
+                         None,
+                         rng.sample(TAGS, rng.randint(0, 3)))
+                        for i in range(1500)], kind=kind)
+    everything = store.search(kind=None, limit=10 ** 6)
+    assert len(everything) == store.count()
+    yield store, [(preset, presets.dominant_hue(preset.colors)) for preset in everything]
+    store.close()
+
+
+def brute_force_search(everything, text='', kind='gradient', stop_count=None, hue=None, hue_tolerance=20, tag=None,
+                       limit=200):
+    """What PresetStore.search() should return, by checking every preset."""
+    text, tag = text.strip(), (tag or '').strip()
+    found = []
+    for preset, preset_hue in everything:
+        tags = {nocase(t) for t in preset.tags}
+        if kind is not None and preset.kind != kind:
+            continue
+        if stop_count is not None and len(preset.colors) != stop_count:
+            continue
+        if hue is not None and (preset_hue is None or not any(
+                low <= preset_hue <= high for low, high in presets.hue_ranges(hue % 360, hue_tolerance))):
+            continue
+        if tag and nocase(tag) not in tags:
+            continue
+        if text and not (nocase(preset.name).startswith(nocase(text)) or nocase(text) in tags):
+            continue
+        found.append(preset)
+    found.sort(key=lambda preset: (nocase(preset.name), preset.id))
+    return found[:limit]
+
+
+def test_search_matches_brute_force(library):
+    store, everything = library
+    rng = random.Random(2)
+    for _ in range(300):
+        query = {
+            'text': rng.choice(['', '', 's', 'SUN', 'ocean b', 'Warm', 'neon', 'z', 'ü', 'nothing']),
+            'kind': rng.choice(presets.KINDS + (None,)),
+            'stop_count': rng.choice([None, None, 2, 3, 6]),
+            'hue': rng.choice([None, None, 0, 5, 120, 355]),
+            'hue_tolerance': rng.choice([10, 25, 180]),
+            'tag': rng.choice([None, None, 'warm', 'COOL', presets.BUILT_IN_TAG]),
+            'limit': rng.choice([1, 20, 500]),
+        }
+        assert store.search(**query) == brute_force_search(everything, **query), query
+
+
+def test_new_library_lists_the_built_in_presets():
+    store = PresetStore(':memory:')
+    found = store.search(tag=presets.BUILT_IN_TAG, limit=1000)
+    assert sorted((preset.name, preset.colors) for preset in found) == sorted(
+        (name, [color.upper() for color in colors]) for name, colors in GRADIENT_PRESETS.items())
+    assert all(preset.positions is None for preset in found)
+
+
+def test_library_file_is_seeded_once(tmp_path):
+    path = str(tmp_path / 'library' / 'presets.sqlite3')
+    store = PresetStore(path)
+    preset_id = store.add('Mine', ['#000000', '#FFFFFF'], [0.0, 0.25])
+    store.close()
+
+    store = PresetStore(path)
+    assert store.count() == len(GRADIENT_PRESETS) + 1
+    assert store.get(preset_id).positions == [0.0, 0.25]
+    store.close()
+
+
+def test_add_cleans_tags_and_delete_removes_them():
+    store = PresetStore(':memory:', seed_built_ins=False)
+    preset_id = store.add('  Sunrise ', ['#ff0000', '#FFFF00'], tags=['Warm', ' warm ', '', 'Morning'])
+    preset = store.get(preset_id)
+    assert (preset.name, preset.colors, preset.tags) == ('Sunrise', ['#FF0000', '#FFFF00'], ['Morning', 'Warm'])
+    assert store.search('WARM') == [preset]
+
+    store.delete(preset_id)
+    assert store.get(preset_id) is None
+    assert store.tags() == []
+
+
+@pytest.mark.parametrize('name, colors, positions, tags', [
+    ('', ['#000000', '#FFFFFF'], None, ()),
+    ('x' * (presets.MAX_NAME_LENGTH + 1), ['#000000', '#FFFFFF'], None, ()),
+    ('One color', ['#000000'], None, ()),
+    ('Bad color', ['#000000', 'white'], None, ()),
+    ('Positions', ['#000000', '#FFFFFF'], [0.0], ()),
+    ('Descending', ['#000000', '#FFFFFF'], [1.0, 0.0], ()),
+    ('Below zero', ['#000000', '#FFFFFF'], [-0.1, 1.0], ()),
+    ('Above one', ['#000000', '#FFFFFF'], [0.0, 1.5], ()),
+    ('Not a number', ['#000000', '#FFFFFF'], [0.0, float('nan')], ()),
+    ('Infinite', ['#000000', '#FFFFFF'], [0.0, float('inf')], ()),
+    ('Long tag', ['#000000', '#FFFFFF'], None, ['t' * (presets.MAX_TAG_LENGTH + 1)]),
+])
+def test_invalid_presets_are_rejected(name, colors, positions, tags):
+    store = PresetStore(':memory:', seed_built_ins=False)
+    with pytest.raises(ValueError):
+        store.add_many([('Valid', ['#000000', '#FFFFFF'], None, ()), (name, colors, positions, tags)])
+    assert store.count() == 0 # Nothing from a failed batch is saved
+
+
+def test_dominant_hue_wraps_around_red():
+    assert presets.dominant_hue(['#FF0011', '#FF1100']) == 0
+    assert presets.dominant_hue(['#808080', '#000000']) is None
+    assert presets.hue_ranges(350, 20) == [(330, 359), (0, 10)]
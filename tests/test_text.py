@@ -0,0 +1,133 @@
+# tests/test_text.py
+"""
+core.text against the code Text Tools used before it was moved and optimized.
+"""
+import random
+import re
+
+import pytest
+
+from core import text as text_core
+
+# Characters picked to hit the fast paths' edge cases: non-ASCII letters and
+# digits, combining marks, Unicode whitespace and punctuation.
+ALPHABET = ['a', 'B', 'z', '_', '7', ' ', '\t', '\n', '.', '!', '?', "'", '-', 'é', 'ß', 'Σ', 'İ',
+            '日', '٣', '́', ' ', ' ', '\x0c', 'ﬁ']
+
+
+def random_text(rng, max_length=60):
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def _legacy_text_stats(text):
+    """update_stats() before core.text: (chars, words, lines) of the whole text."""
+    char_count = len(text)
+    word_count = len(re.findall(r'\b\w+\b', text))
+    line_count = text.count('\n') + 1 if text else 0
+    return char_count, word_count, line_count
+
+
+@pytest.mark.parametrize('text', ['', ' ', '\n', 'one', 'two words', 'a\n\nb', 'ünïcödé wörds_1 2', 'x' * 1000])
+def test_text_stats_matches_legacy(text):
+    assert text_core.text_stats(text) == _legacy_text_stats(text)
+
+
+def test_count_words_matches_legacy_on_random_text():
+    rng = random.Random(1)
+    for _ in range(5000):
+        text = random_text(rng)
+        assert text_core.count_words(text) == _legacy_text_stats(text)[1], repr(text)
+
+
+def test_line_stats_of_whole_text():
+    rng = random.Random(2)
+    for _ in range(500):
+        text = random_text(rng)
+        assert text_core.LineStats(text).stats() == _legacy_text_stats(text), repr(text)
+
+
+def test_line_stats_follow_edits():
+    """Random inserts, deletes and replacements, applied the way Text Tools reports them."""
+    rng = random.Random(3)
+    for _ in range(200):
+        text = random_text(rng)
+        stats = text_core.LineStats(text)
+        for _ in range(20):
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, len(text))
+            new_text = text[:start] + random_text(rng, 10) + text[end:]
+            # Lines first..last of the old text become lines first..new_last of the new one
+            first = text.count('\n', 0, start)
+            last = text.count('\n', 0, end) + 1
+            new_last = last + new_text.count('\n') - text.count('\n')
+            stats.replace_lines(first, last, new_text.split('\n')[first:new_last])
+            text = new_text
+            assert stats.stats() == _legacy_text_stats(text), repr(text)
+        assert stats.line_total == text.count('\n') + 1
+
+
+def _legacy_sentence_case(text):
+    """Text Tools' _to_sentence_case() before core.text."""
+    text = text.lower()
+    text = re.sub(r'([.!?])(\s*)([a-z])', lambda m: m.group(1) + m.group(2) + m.group(3).upper(), text)
+    processed_lines = []
+    for line in text.split('\n'):
+        stripped_line = line.lstrip()
+        if stripped_line:
+            first_char_index = line.find(stripped_line[0])
+            processed_lines.append(line[:first_char_index] + stripped_line[0].upper() + stripped_line[1:])
+        else:
+            processed_lines.append(line)
+    return '\n'.join(processed_lines)
+
+
+def _legacy_convert_case(text, case_type):
+    """apply_conversion() before core.text."""
+    if case_type == 'upper':
+        return text.upper()
+    if case_type == 'lower':
+        return text.lower()
+    if case_type == 'title':
+        return text.title()
+    if case_type == 'sentence':
+        return _legacy_sentence_case(text)
+    return text
+
+
+@pytest.mark.parametrize('text', ['', 'hello', '  hello. world!  what? yes', 'a.\n\n  b\n\tc', 'x.y', '...a',
+                                  'ß. ǆ. İ. ﬁ', ' \u3000lead. \u2028b'])
+def test_sentence_case_matches_legacy(text):
+    assert text_core.to_sentence_case(text) == _legacy_sentence_case(text)
+
+
+def test_sentence_case_matches_legacy_on_random_text():
+    rng = random.Random(4)
+    for _ in range(20000):
+        text = random_text(rng)
+        assert text_core.to_sentence_case(text) == _legacy_sentence_case(text), repr(text)
+
+
+@pytest.mark.parametrize('case_type', text_core.CASE_TYPES + ('unknown',))
+def test_convert_case_matches_legacy(case_type):
+    rng = random.Random(5)
+    for _ in range(2000):
+        text = random_text(rng)
+        assert text_core.convert_case(text, case_type) == _legacy_convert_case(text, case_type), repr(text)
+
+
+@pytest.mark.parametrize('case_type', text_core.CASE_TYPES + ('unknown',))
+def test_streaming_conversion_matches_whole_text(case_type):
+    """However the text is split into pieces, the output is that of converting it at once."""
+    rng = random.Random(6)
+    alphabet = ALPHABET + ['\r', ':', '^', '`']
+    for _ in range(3000):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        converter = text_core.StreamingCaseConverter(case_type)
+        pieces, start = [], 0
+        while start < len(text):
+            end = start + rng.randint(0, 6)
+            pieces.append(converter.convert(text[start:end]))
+            start = end
+        pieces.append(converter.finish())
+        assert ''.join(pieces) == text_core.convert_case(text, case_type), repr(text)
+
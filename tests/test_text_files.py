@@ -0,0 +1,94 @@
+# tests/test_text_files.py
+"""
+core.text_files against reading the whole file and using core.text on it.
+"""
+import random
+
+import pytest
+
+from core import text as text_core, text_files
+
+# Multi-byte characters, invalid UTF-8 and every kind of line ending, so chunk
+# boundaries fall inside characters, '\r\n' pairs and words.
+PIECES = [piece.encode('utf-8') for piece in
+          ['word ', 'Ünïcödé ', '日本語', 'end. ', 'next! ', '\n', '\r\n', '\r', '\t', '😀', 'a', '1', '_']]
+PIECES.append(b'\xff') # Invalid byte
+
+
+def write_random_file(path, rng, length):
+    data = b''.join(rng.choice(PIECES) for _ in range(length))
+    if rng.random() < 0.3:
+        data += b'\xe6\x97' # Truncated character at the end
+    path.write_bytes(data)
+    return data
+
+
+def read_whole(path, newline=None):
+    with open(path, encoding='utf-8', errors='replace', newline=newline) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, text_files.CHUNK_SIZE])
+def test_file_stats_match_whole_text(tmp_path, chunk_size):
+    rng = random.Random(chunk_size)
+    path = tmp_path / 'input.txt'
+    for _ in range(30):
+        write_random_file(path, rng, rng.randint(0, 80))
+        assert text_files.file_stats(str(path), chunk_size) == text_core.text_stats(read_whole(path))
+
+
+def test_file_stats_of_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    assert text_files.file_stats(str(path)) == (0, 0, 0)
+
+
+def test_progress_reaches_file_size(tmp_path):
+    path = tmp_path / 'input.txt'
+    data = write_random_file(path, random.Random(1), 500)
+    reports = []
+    text_files.file_stats(str(path), chunk_size=100, progress=lambda done, total: reports.append((done, total)))
+    assert reports[0] == (0, len(data))
+    assert reports[-1] == (len(data), len(data))
+
+
+@pytest.mark.parametrize('max_chars', [0, 1, 10, 10_000])
+def test_read_preview(tmp_path, max_chars):
+    path = tmp_path / 'input.txt'
+    write_random_file(path, random.Random(max_chars), 300)
+    whole = read_whole(path)
+    assert text_files.read_preview(str(path), max_chars) == (whole[:max_chars], len(whole) > max_chars)
+
+
+@pytest.mark.parametrize('case_type', text_core.CASE_TYPES)
+@pytest.mark.parametrize('chunk_size', [1, 5, 64])
+def test_convert_file_matches_whole_text(tmp_path, case_type, chunk_size):
+    """Output is convert_case() of the whole text, with the source's line endings kept."""
+    rng = random.Random(chunk_size)
+    source, destination = tmp_path / 'input.txt', tmp_path / 'output.txt'
+    for _ in range(10):
+        write_random_file(source, rng, rng.randint(0, 80))
+        text_files.convert_file(str(source), str(destination), case_type, chunk_size)
+        expected = text_core.convert_case(read_whole(source, newline=''), case_type)
+        assert destination.read_bytes() == expected.encode('utf-8')
+
+
+def test_convert_file_refuses_to_overwrite_source(tmp_path):
+    source = tmp_path / 'input.txt'
+    source.write_text('keep me')
+    with pytest.raises(ValueError):
+        text_files.convert_file(str(source), str(source), 'upper')
+    assert source.read_text() == 'keep me'
+
+
+def test_convert_file_removes_partial_output(tmp_path):
+    source, destination = tmp_path / 'input.txt', tmp_path / 'output.txt'
+    source.write_text('some text\n' * 100)
+
+    def fail(done, total):
+        if done:
+            raise RuntimeError('stop')
+
+    with pytest.raises(RuntimeError):
+        text_files.convert_file(str(source), str(destination), 'upper', chunk_size=64, progress=fail)
+    assert not destination.exists()
@@ -1,14 +1,19 @@
 # text_tools.py
+import os
 import tkinter as tk
-from tkinter import ttk, scrolledtext
-import re
+from tkinter import ttk, scrolledtext, filedialog as fd
 
 # Import constants from the constants module
 from constants import (
     PRIMARY_BG, SECONDARY_BG, ACCENT_BLUE, TEXT_LIGHT, TEXT_MUTED,
     INPUT_BG, INPUT_FG, WARNING_RED, HOVER_PRIMARY_BG, HOVER_ACCENT_BLUE,
-    HOVER_WARNING_RED, FONT_FAMILY, FONT_INPUT, FONT_BOLD
+    HOVER_WARNING_RED, FONT_FAMILY, FONT_INPUT, FONT_BOLD, TEXT_REFRESH_IDLE_MS,
+    TEXT_STATS_THREAD_MIN_CHARS, TEXT_STATS_POLL_MS, TEXT_CONVERT_THREAD_MIN_CHARS, TEXT_CONVERT_CHUNK_CHARS,
+    TEXT_PREVIEW_CHARS, TEXT_FILE_POLL_MS, SUCCESS_GREEN
 )
+import helpers
+from core import text as text_core, text_files
+from core.jobs import DONE as JOB_DONE, FAILED as JOB_FAILED
 
 def create_text_tools_widgets(app, parent_frame):
     """
@@ -29,8 +34,20 @@ def create_text_tools_widgets(app, parent_frame):
     title_label.grid(row=0, column=0, columnspan=4, pady=(10, 18), sticky='w', padx=(2,0))
 
     # Input text label
-    input_label = ttk.Label(parent_frame, text="Enter your text:", style='InputLabel.TLabel')
-    input_label.grid(row=1, column=0, columnspan=4, sticky='w', pady=(0, 10))
+    app.text_input_label = ttk.Label(parent_frame, text="Enter your text:", style='InputLabel.TLabel')
+    app.text_input_label.grid(row=1, column=0, columnspan=3, sticky='w', pady=(0, 10))
+
+    # Files too large to paste: opened as a read-only preview and converted file to file
+    file_buttons_frame = tk.Frame(parent_frame, bg=PRIMARY_BG)
+    file_buttons_frame.grid(row=1, column=3, sticky='e', pady=(0, 10))
+    for text, command in (("📂 Open File...", lambda: open_text_file(app)),
+                          ("💾 Convert File...", lambda: convert_text_file(app))):
+        file_btn = tk.Button(file_buttons_frame, text=text, command=command,
+                             bg=SECONDARY_BG, fg=TEXT_LIGHT, font=FONT_BOLD,
+                             relief='flat', padx=12, pady=4, cursor='hand2', bd=0,
+                             activebackground=HOVER_PRIMARY_BG, activeforeground=TEXT_LIGHT)
+        file_btn.pack(side='left', padx=(6, 0))
+        app._button_hover_colors[file_btn] = {'original': SECONDARY_BG, 'hover': HOVER_PRIMARY_BG}
 
     # ScrolledText widget for user input
     app.text_tools_input_text = scrolledtext.ScrolledText(parent_frame,
@@ -43,6 +60,8 @@ def create_text_tools_widgets(app, parent_frame):
                                                           highlightcolor=SECONDARY_BG,
                                                           highlightthickness=1)
     app.text_tools_input_text.grid(row=2, column=0, columnspan=4, sticky='nsew', pady=(0, 30))
+    # Keep per-line stats up to date through every edit, however it is made
+    _track_text_edits(app, app.text_tools_input_text)
     # Bind key release event to update stats and apply conversion live
     app.text_tools_input_text.bind('<KeyRelease>', lambda e: on_text_change(app, e))
 
@@ -119,26 +138,262 @@ def create_text_tools_widgets(app, parent_frame):
     app.line_count_label.grid(row=0, column=2, pady=(15, 0))
     ttk.Label(stats_frame, text="Lines", style='StatsText.TLabel').grid(row=1, column=2, pady=(0, 15))
 
+def _track_text_edits(app, widget):
+    """
+    Routes a Text widget's edits through app.text_stats, so the statistics
+    follow each edit by recounting only the lines it touched.
+
+    Tk has no event that says what changed, so the widget's Tcl command is
+    wrapped: insert, delete and replace (whether from typing, pasting or
+    code) note the affected lines before running, and those lines are read
+    back and recounted afterwards. Everything else passes straight through.
+
+    Every edit bumps app._text_stats_generation (which also invalidates
+    background conversions of the old text). Edits too large to count in
+    the GUI thread, and edits whose range isn't known, mark the stats dirty
+    instead; they are recounted from scratch when typing pauses.
+
+    Args:
+        app: The main application instance.
+        widget: The Text widget to watch; app.text_stats must describe its content.
+    """
+    original = widget._w + '_unwatched'
+    widget.tk.call('rename', widget._w, original)
+
+    def last_line():
+        return int(widget.tk.call(original, 'index', 'end - 1c').split('.')[0])
+
+    def line_of(index):
+        return int(widget.tk.call(original, 'index', index).split('.')[0])
+
+    def dispatch(command, *args):
+        if command not in ('insert', 'delete', 'replace') or not args or (command == 'delete' and len(args) > 2):
+            result = widget.tk.call((original, command) + args)
+            if command == 'delete' or (command == 'edit' and args[:1] in (('undo',), ('redo',))):
+                # Several ranges at once, or undo/redo: recount everything
+                app._text_stats_generation += 1
+                app._text_stats_dirty = True
+            return result
+
+        lines_before = last_line()
+        first = min(line_of(args[0]), lines_before)
+        if command == 'insert':
+            last = first
+        else:
+            end = args[1] if len(args) > 1 else f"{args[0]} + 1c"
+            last = max(min(line_of(end), lines_before), first)
+        result = widget.tk.call((original, command) + args)
+        app._text_stats_generation += 1
+        if app._text_stats_dirty:
+            return result # A full recount is due anyway
+        new_last = last + last_line() - lines_before
+        edited = widget.tk.call(original, 'get', f"{first}.0", f"{new_last}.end")
+        if len(edited) > TEXT_STATS_THREAD_MIN_CHARS:
+            app._text_stats_dirty = True # Too big to count while typing; see _refresh_text_stats()
+        else:
+            app.text_stats.replace_lines(first - 1, last, edited.split('\n'))
+        return result
+
+    widget.tk.createcommand(widget._w, dispatch)
+
 def on_text_change(app, event=None):
     """
-    Callback for text input changes. Updates statistics and applies case conversion.
+    Callback for text input changes. Updates statistics and applies case
+    conversion once typing pauses, so holding a key down doesn't queue up
+    a refresh per keystroke.
     """
+    if app._text_refresh_job is not None:
+        app.root.after_cancel(app._text_refresh_job)
+    app._text_refresh_job = app.root.after(TEXT_REFRESH_IDLE_MS, _refresh_text_tools, app)
+
+def _refresh_text_tools(app):
+    """Idle-time refresh of the statistics and the converted result."""
+    app._text_refresh_job = None
     update_stats(app)
     apply_conversion(app)
 
 def update_stats(app):
     """
-    Calculates and displays character, word, and line counts for the input text.
+    Displays character, word, and line counts for the input text.
+
+    The counts are kept up to date edit by edit (see _track_text_edits()),
+    so this usually only reads the totals. After an edit too large to count
+    in the GUI thread, the labels keep their old values until the background
+    recount lands.
     """
-    text = app.text_tools_input_text.get('1.0', tk.END + '-1c')
-    char_count = len(text)
-    word_count = len(re.findall(r'\b\w+\b', text)) # Use regex to find words
-    line_count = text.count('\n') + 1 if text else 0 # Count newlines + 1 for total lines
+    if app.text_file is not None:
+        # The input box holds a preview; show the whole file's counts once known
+        if app._text_file_stats is None:
+            for label in (app.char_count_label, app.word_count_label, app.line_count_label):
+                label.config(text="…")
+            return
+        char_count, word_count, line_count = app._text_file_stats
+        app.char_count_label.config(text=f"{char_count:,}")
+        app.word_count_label.config(text=f"{word_count:,}")
+        app.line_count_label.config(text=f"{line_count:,}")
+        return
+    if app._text_stats_dirty:
+        _refresh_text_stats(app)
+        if app._text_stats_dirty:
+            return
+    char_count, word_count, line_count = app.text_stats.stats()
 
     app.char_count_label.config(text=str(char_count))
     app.word_count_label.config(text=str(word_count))
     app.line_count_label.config(text=str(line_count))
 
+def _refresh_text_stats(app):
+    """
+    Recounts the whole input after edits that couldn't be counted one by one.
+
+    Short texts are counted right away. Longer ones are counted on the
+    text-stats worker thread and applied by _poll_text_stats(), unless the
+    text was edited again in the meantime.
+    """
+    queue = app.text_stats_queue
+    if any(job.args[1] == app._text_stats_generation and not job.cancelled
+           for job in [queue.current] + queue.pending() if job is not None):
+        return # This version of the text is already being counted
+    text = app.text_tools_input_text.get('1.0', tk.END + '-1c')
+    if len(text) <= TEXT_STATS_THREAD_MIN_CHARS:
+        app.text_stats.reset(text)
+        app._text_stats_dirty = False
+        return
+    queue.cancel_all() # Older recounts would be dropped anyway
+    queue.submit('text statistics', _count_text_job, text, app._text_stats_generation)
+    if app._text_stats_poll_job is None:
+        app._text_stats_poll_job = app.root.after(TEXT_STATS_POLL_MS, _poll_text_stats, app)
+
+def _count_text_job(job, text, generation):
+    """Background job: counts a snapshot of the input text. Returns (generation, LineStats)."""
+    return generation, text_core.LineStats(text)
+
+def _poll_text_stats(app):
+    """Applies a finished background recount if the text hasn't changed since its snapshot."""
+    app._text_stats_poll_job = None
+    stale = False
+    for job in app.text_stats_queue.collect_finished():
+        if job.state != JOB_DONE:
+            continue
+        generation, stats = job.result
+        if generation == app._text_stats_generation:
+            app.text_stats = stats
+            app._text_stats_dirty = False
+            update_stats(app)
+        else:
+            stale = True # The text changed while it was being counted
+    if stale and app._text_stats_dirty and app._text_refresh_job is None:
+        update_stats(app) # No refresh is coming for the newer edit; count it now
+    if app._text_stats_poll_job is None and not app.text_stats_queue.idle():
+        app._text_stats_poll_job = app.root.after(TEXT_STATS_POLL_MS, _poll_text_stats, app)
+
+def open_text_file(app):
+    """
+    Opens a text file of any size in Text Tools.
+
+    Only the first TEXT_PREVIEW_CHARS characters are put in the input box,
+    which becomes read-only; the statistics cover the whole file and are
+    computed by a streaming pass on a background thread. "Clear All" closes
+    the file.
+    """
+    path = fd.askopenfilename(title="Open Text File",
+                              filetypes=[("Text files", "*.txt *.log *.csv *.md *.json"), ("All files", "*.*")])
+    if not path:
+        return
+    try:
+        preview, truncated = text_files.read_preview(path, TEXT_PREVIEW_CHARS)
+    except (OSError, ValueError) as e:
+        app.update_status(f"Could not open file: {e}", WARNING_RED)
+        return
+
+    close_text_file(app)
+    name = os.path.basename(path)
+    app.text_file = path
+    app._text_file_stats = None
+    widget = app.text_tools_input_text
+    widget.config(state='normal')
+    widget.delete('1.0', tk.END)
+    widget.insert('1.0', preview)
+    widget.config(state='disabled') # A preview; editing it wouldn't edit the file
+    shown = f"first {len(preview):,} characters" if truncated else "whole file"
+    app.text_input_label.config(text=f"{name} (read-only preview, {shown}):")
+
+    app.text_file_queue.submit(name, _analyze_file_job, path)
+    if app._text_file_poll_job is None:
+        app._text_file_poll_job = app.root.after(TEXT_FILE_POLL_MS, _poll_text_file, app)
+    _refresh_text_tools(app)
+
+def close_text_file(app):
+    """Stops analyzing the open file and makes the input box editable again."""
+    if app.text_file is None:
+        return
+    queue = app.text_file_queue
+    for job in [queue.current] + queue.pending(): # File conversions keep going
+        if job is not None and job.func is _analyze_file_job:
+            job.cancel()
+    app.text_file = None
+    app._text_file_stats = None
+    app.text_tools_input_text.config(state='normal')
+    app.text_input_label.config(text="Enter your text:")
+
+def _analyze_file_job(job, path):
+    """Background job: streams through a file and returns (path, (chars, words, lines))."""
+    return path, text_files.file_stats(path, progress=lambda done, total: job.report(done, total, 'Analyzing'))
+
+def convert_text_file(app):
+    """
+    Converts a whole file to the selected case and saves it as a new file.
+
+    The file opened with "Open File..." is converted if there is one;
+    otherwise the user picks a file. The conversion streams from file to
+    file on a background thread, so files of any size convert in bounded memory.
+    """
+    source = app.text_file or fd.askopenfilename(
+        title="Convert Text File", filetypes=[("Text files", "*.txt *.log *.csv *.md *.json"), ("All files", "*.*")])
+    if not source:
+        return
+    stem, ext = os.path.splitext(os.path.basename(source))
+    destination = fd.asksaveasfilename(title="Save Converted File", initialdir=os.path.dirname(source),
+                                       initialfile=f"{stem}_{app.current_case_type}{ext or '.txt'}",
+                                       defaultextension=ext or '.txt')
+    if not destination:
+        return
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        app.update_status("Choose a different file name - the source can't be overwritten.", WARNING_RED)
+        return
+    app.text_file_queue.submit(os.path.basename(source), _convert_file_job, source, destination,
+                               app.current_case_type)
+    if app._text_file_poll_job is None:
+        app._text_file_poll_job = app.root.after(TEXT_FILE_POLL_MS, _poll_text_file, app)
+
+def _convert_file_job(job, source, destination, case_type):
+    """Background job: streams a file through the case converter. Returns a status message."""
+    text_files.convert_file(source, destination, case_type,
+                            progress=lambda done, total: job.report(done, total, 'Converting'))
+    return f"Saved {case_type} case copy as {os.path.basename(destination)}!"
+
+def _poll_text_file(app):
+    """Applies finished file passes and reports the running one's progress in the status bar."""
+    app._text_file_poll_job = None
+    queue = app.text_file_queue
+    for job in queue.collect_finished():
+        if job.state == JOB_DONE and job.func is _convert_file_job:
+            app.update_status(job.result, SUCCESS_GREEN)
+        elif job.state == JOB_DONE:
+            path, stats = job.result
+            if path == app.text_file: # Not closed or replaced meanwhile
+                app._text_file_stats = stats
+                update_stats(app)
+                app.update_status(f"Analyzed {job.name}.", SUCCESS_GREEN)
+        elif job.state == JOB_FAILED:
+            app.update_status(f"Could not process {job.name}: {job.error}", WARNING_RED)
+
+    current = queue.current
+    if current is not None:
+        app.update_status(f"{current.stage} {current.name}... {current.progress * 100:.0f}%")
+    if not queue.idle():
+        app._text_file_poll_job = app.root.after(TEXT_FILE_POLL_MS, _poll_text_file, app)
+
 def set_case_type(app, case_type):
     """
     Sets the current case conversion type and applies the conversion.
@@ -167,54 +422,68 @@ def set_case_type(app, case_type):
 def apply_conversion(app):
     """
     Applies the selected case conversion to the input text and displays the result.
+
+    Inputs longer than TEXT_CONVERT_THREAD_MIN_CHARS are converted on the
+    text-convert worker thread and shown by _poll_text_conversion(), unless
+    the text or the case type changed in the meantime; until then the
+    previous result stays in place.
     """
     input_text = app.text_tools_input_text.get('1.0', tk.END + '-1c')
-    result = input_text
-
-    # Perform conversion based on current_case_type
-    if app.current_case_type == 'upper':
-        result = input_text.upper()
-    elif app.current_case_type == 'lower':
-        result = input_text.lower()
-    elif app.current_case_type == 'title':
-        result = input_text.title()
-    elif app.current_case_type == 'sentence':
-        result = _to_sentence_case(input_text)
+    if len(input_text) > TEXT_CONVERT_THREAD_MIN_CHARS:
+        _convert_in_background(app, input_text)
+        return
+    app.text_convert_queue.cancel_all() # A conversion of older, longer text would be dropped anyway
+    _show_conversion(app, text_core.convert_case(input_text, app.current_case_type))
+
+def _convert_in_background(app, text):
+    """Queues a conversion of a snapshot of the input text, unless one is already running for it."""
+    queue = app.text_convert_queue
+    request = (app.current_case_type, app._text_stats_generation)
+    if any(job.args[1:] == request and not job.cancelled
+           for job in [queue.current] + queue.pending() if job is not None):
+        return
+    queue.cancel_all() # Older conversions would be dropped anyway
+    queue.submit('case conversion', _convert_text_job, text, *request)
+    if app._text_convert_poll_job is None:
+        app._text_convert_poll_job = app.root.after(TEXT_STATS_POLL_MS, _poll_text_conversion, app)
 
+def _convert_text_job(job, text, case_type, generation):
+    """
+    Background job: converts a snapshot of the input text a piece at a time,
+    so it can be cancelled between pieces. Returns (case_type, generation, result).
+    """
+    converter = text_core.StreamingCaseConverter(case_type)
+    pieces = []
+    for start in range(0, len(text), TEXT_CONVERT_CHUNK_CHARS):
+        job.check_cancelled()
+        pieces.append(converter.convert(text[start:start + TEXT_CONVERT_CHUNK_CHARS]))
+    pieces.append(converter.finish())
+    return case_type, generation, ''.join(pieces)
+
+def _poll_text_conversion(app):
+    """Shows a finished background conversion if the text and case type are still the ones it converted."""
+    app._text_convert_poll_job = None
+    for job in app.text_convert_queue.collect_finished():
+        if job.state == JOB_DONE and job.result[:2] == (app.current_case_type, app._text_stats_generation):
+            _show_conversion(app, job.result[2])
+    if not app.text_convert_queue.idle():
+        app._text_convert_poll_job = app.root.after(TEXT_STATS_POLL_MS, _poll_text_conversion, app)
+
+def _show_conversion(app, result):
+    """Replaces the content of the read-only output area."""
     # Update the output text area (enable, delete, insert, then disable)
     app.output_text.config(state='normal')
     app.output_text.delete('1.0', tk.END)
     app.output_text.insert('1.0', result)
     app.output_text.config(state='disabled')
 
-def _to_sentence_case(text: str) -> str:
-    """
-    Converts the given text to sentence case.
-    (Capitalizes the first letter of each sentence and after punctuation).
-    """
-    text = text.lower() # Start by converting all to lowercase
-    # Capitalize first letter after a sentence-ending punctuation mark
-    text = re.sub(r'([.!?])(\s*)([a-z])', lambda m: m.group(1) + m.group(2) + m.group(3).upper(), text)
-
-    # Handle capitalization of the first letter of each line
-    lines = text.split('\n')
-    processed_lines = []
-    for line in lines:
-        stripped_line = line.lstrip() # Get line content without leading whitespace
-        if stripped_line:
-            # Find the index of the first non-whitespace character
-            first_char_index = line.find(stripped_line[0])
-            # Capitalize the actual first letter of the content, preserving leading whitespace
-            capitalized_line = line[:first_char_index] + stripped_line[0].upper() + stripped_line[1:]
-            processed_lines.append(capitalized_line)
-        else:
-            processed_lines.append(line) # Keep empty lines as they are
-    return '\n'.join(processed_lines)
-
 def clear_text(app):
     """
     Clears the input and output text areas, resets statistics, and sets focus.
+    Closes the file opened with "Open File...", if any.
     """
+    close_text_file(app)
+    app.text_convert_queue.cancel_all()
     app.text_tools_input_text.delete('1.0', tk.END)
     app.output_text.config(state='normal') # Enable to clear
     app.output_text.delete('1.0', tk.END)